@@ -24,7 +24,7 @@ if path.dirname(__file__) not in sys.path:
     sys.path.append(path.dirname(__file__))
 
 #Importing necessary basic_utils functions
-from _parserUtils.basic_utils import getLinesWith
+from _parserUtils.basic_utils import getLinesWithAny
 #Importing the necessary base class
 from _File import File
 #Importing the senstive information
@@ -104,6 +104,22 @@ class CrowdSource_File(File):
     # Longitude
     '''
 
+    #All of the delimiters used by loadCrowdSourceInfo, which are indexed in one read of the file
+    HEADER_DELIMITERS = File.HEADER_DELIMITERS + [
+        "Crowd Source", "Name =", "Architecture =", ", Version =", ": Version =", "Vendor =",
+        "Server:", "Host:", "NetworkProvider:", "NetworkOperator:", "NetworkType:",
+        "ConnectionType:", "This device was", "Device Name:", "Version =", "WiFi BSSID:",
+        "WiFi SSID:", "Phone Model:", "Phone Manufacturer:", "API Version:", "SDK Version:",
+        "Network is Roaming.", "Network is Not Roaming.", "GPSLastKnownLat:", "GPSLastKnownLong:",
+        "NetworkLastKnownLat:", "NetworkLastKnownLong:", "LastKnownLat:", "LastKnownLong:",
+        "Version:", "UserSettingAddress:", "Network ISP:", "IPLastKnownLat:", "IPLastKnownLng:"
+    ]
+    #The attributes set by loadBodyInfo, from the location lines of every test of a phone.
+    # A desktop's location is in the header, so these are already set for a desktop
+    BODY_ATTRIBUTES = File.BODY_ATTRIBUTES + [
+        "Latitude", "Longitude", "DistanceMoved", "LocationSource", "AllCoordPairs",
+        "AllGPSCoordPairs", "AllNetworkCoordPairs", "GPSLastKnownCoord", "NetworkLastKnownCoord"
+    ]
 
     def __new__(cls, *args, **kwargs):
         """
@@ -124,17 +140,29 @@ class CrowdSource_File(File):
         # then save the result back into fileLoc
         if system()!="Windows":
             fileLoc = path.abspath(fileLoc).replace("\\","").strip()
-        #Checking that the file is indeed a FieldTest File. If not, return None
+        #Checking that the file is indeed a Crowd Source File. If not, return None. Only the header
+        # is read to check this, so a file of another type costs one small read. The rest of
+        # the contents are then read, and are kept by the instance for the rest of the parsing,
+        # unless there are too many tests. A lazy object only reads the rest of the header,
+        # up to the first test
         try:
-            with open(fileLoc) as checkingFile:
-                allText = checkingFile.read()
+            with File.openFileBuffer(fileLoc, kwargs.get("fileBuffer")) as fs:
+                headerText = File.sniffFileHeader(fs)
+                if all( [(string not in headerText.split("\n\n")[0]) for string in ["Crowd Source"]] ):
+                    if "DEBUG" in kwargs and kwargs["DEBUG"]:
+                        print("{} is not a Crowd Source Test output file. ".format(os.path.basename(fileLoc))+
+                              "It did not have the necessary header.", file=sys.stderr)
+                    return None
+                if kwargs.get("lazy", False) and "fileBuffer" not in kwargs:
+                    headerText = File.sniffFileHeader(fs, end="Starting Test", text=headerText)
+                    allText, testCount = None, 0
+                else:
+                    allText, testCount = File.readCounting(fs, "Starting Test", 6, text=headerText)
             #END WITH FILE
-            if all( [(string not in allText.split("\n\n")[0]) for string in ["Crowd Source"]] ):
-                if "DEBUG" in kwargs and kwargs["DEBUG"]:
-                    print("{} is not a Crowd Source Test output file. ".format(os.path.basename(fileLoc))+
-                          "It did not have the necessary header.", file=sys.stderr)
-                return None
-            if allText.count("Starting Test") > 6:
+            #The tests are only counted in a file that has the Crowd Source header, as it is
+            # read. A lazy object has not read its tests, so they are counted by loadTests,
+            # which sets an error if there are too many
+            if testCount > 6:
                 if "DEBUG" in kwargs and kwargs["DEBUG"]:
                     print("{} had too many tests conducted. ".format(os.path.basename(fileLoc))+
                           "It was most likely not a Crowd Source Test output file", file=sys.stderr)
@@ -143,6 +171,10 @@ class CrowdSource_File(File):
             print("{} is a file that could not be read.".format(os.path.basename(fileLoc)), file=sys.stderr)
             return None
         inst = File.__new__(cls)
+        if allText is None:
+            inst._headerText = headerText.split("Starting Test")[0]
+        else:
+            inst._fileText = allText
         return inst
     #END DEF
 
@@ -151,6 +183,13 @@ class CrowdSource_File(File):
         Initializes the object by parsing the data in the given file path. Calls parent's __init__
         ARGS:
             filePath    String, containing absolute path to raw data file
+        KWARGS:
+            fileBuffer  String, bytes, or an open file object, holding the contents of the file.
+                         If given, the file at filePath is not read from disk
+            lazy        Boolean, if True, only the header is read and parsed here. The tests are
+                         parsed the first time that one of the LAZY_ATTRIBUTES is asked for, and
+                         any errors found in the tests are only set at that time. The rest of the
+                         file is read for the BODY_ATTRIBUTES the first time one is asked for
         """
         if 'empty' in kwargs and kwargs['empty']:
             return
@@ -160,34 +199,19 @@ class CrowdSource_File(File):
 
         #Call the parent class' __init__
         eastAndWestServerIP = CrowdSource_EastWest
-        File.__init__(self, filePath=filePath, eastWestIP=eastAndWestServerIP)
+        File.__init__(self, filePath=filePath, eastWestIP=eastAndWestServerIP,
+                      lazy=kwargs.get("lazy", False))
         self.loadCrowdSourceInfo()
 
-        #Actually parsing the tests in the file
-        self.findAndParseTCPTests()
-        self.findAndParsePINGTests()
-        self.findAndParseUDPTests()
-
-        for eastwest in ['East','West']:
-            try:
-                self.RValue[eastwest] = self.calcRval(eastwest)
-                self.MOS[eastwest] = self.calcMOS(eastwest)
-            except:
-                self.RValue[eastwest] = 'NA'
-                self.MOS[eastwest] = 'NA'   
-
-        #This is one final check, to make sure that we have all 6 tests. If not, then
-        # there was an unknown test of some kind, and we set our ContainsErrors to True
-        #The 6 Tests are:
-        #   2 PING TESTS (1 East, 1 West)
-        #   2 TCP TESTS (1 East, 1 West)
-        #   2 UDP 1 second TESTS (1 East, 1 West)
-        if (len(self.TestsByNum) != 6) and not self.ContainsErrors:
-            specialMessage = ("There was an unknown error of some kind, and the 14 necessary" +
-                              " tests were not performed. There are "+str(6-len(self.TestsByNum))+
-                              " tests missing.")
-            self._ErrorHandling__setErrorCode(404, specialMessage)
-        #END IF
+        #The body of the file and the tests are parsed now, unless the object is lazy
+        if not self._lazyTests:
+            self.loadBodyInfo()
+            self.loadTests()
+        elif "fileBuffer" not in kwargs:
+            #A lazy object does not hold on to its header. The rest of the file is read
+            # from self.FilePath (or memory-mapped, for the tests) when it is needed
+            del self._headerText
+        #END IF/ELSE
 
         """ Implement this once we get the proper algorithm
         #Video Metric Stuff
@@ -211,6 +235,37 @@ class CrowdSource_File(File):
 
 # INITIALIZATION FUNCTIONS -----------------------------------------------------
 
+    def loadTests(self):
+        """
+        Parses all of the tests in the file (see File.loadTests), and then checks that all
+         6 of the tests were found
+        ARGS:
+            None
+        RETURNS:
+            None
+        """
+        File.loadTests(self)
+
+        #This is one final check, to make sure that we have all 6 tests. If not, then
+        # there was an unknown test of some kind, and we set our ContainsErrors to True
+        #The 6 Tests are:
+        #   2 PING TESTS (1 East, 1 West)
+        #   2 TCP TESTS (1 East, 1 West)
+        #   2 UDP 1 second TESTS (1 East, 1 West)
+        if (len(self.TestsByNum) > 6) and not self.ContainsErrors:
+            #Only a lazy object gets here, as __new__ does not create any other object for a
+            # file with this many tests
+            specialMessage = ("There were "+str(len(self.TestsByNum))+" tests in the file. It was" +
+                              " most likely not a Crowd Source Test output file.")
+            self._ErrorHandling__setErrorCode(404, specialMessage)
+        elif (len(self.TestsByNum) != 6) and not self.ContainsErrors:
+            specialMessage = ("There was an unknown error of some kind, and the 14 necessary" +
+                              " tests were not performed. There are "+str(6-len(self.TestsByNum))+
+                              " tests missing.")
+            self._ErrorHandling__setErrorCode(404, specialMessage)
+        #END IF
+    #END DEF
+
     def loadCrowdSourceInfo(self):
         """
         Initializes the object by parsing the data in the given file path from __init__.
@@ -220,10 +275,10 @@ class CrowdSource_File(File):
             None
         """
         #This opens the file, and stores the file stream into the variabe fs
-        with open(self.FilePath,'r') as fs:
+        with self.openHeader() as fs:
             #We are going to first get the line that contains some of the basic
             # information, like the Client Type and the App Version
-            temp = getLinesWith(fs,"Crowd Source")
+            temp = self.getHeaderLines(fs,"Crowd Source")
             if temp:
                 if "Phone" in temp[0]:
                     self.Devicetype = "Phone"
@@ -299,16 +354,36 @@ class CrowdSource_File(File):
                     self.parseLineAndSetAttr(fileStream=fs, delimiter=pair[0], attribute=pair[1])
 
             #Determining if the device was Roaming or not.
-            line = getLinesWith(fs, "Network is Roaming.")
+            line = self.getHeaderLines(fs, "Network is Roaming.")
             if line:
                 self.Roaming = True
-            line = getLinesWith(fs, "Network is Not Roaming.")
+            line = self.getHeaderLines(fs, "Network is Not Roaming.")
             if line:
                 self.Roaming = False
             #Sometimes, there was a ":" in the output of the environment. This
             # little block below removes that
             self.Environment = self.Environment.replace(":","").strip()
 
+            #After all of this parsing, we just need to set anything that is empty to N/A
+            emptiesToSet = ["Server", "Host", "WiFiBSSID", "WiFiSSID"]
+            self.setEmptysToDefault(attributes=emptiesToSet)
+        #END IF
+    #END DEF
+
+    def loadBodyInfo(self):
+        """
+        Finds the location of a phone's test in all of the location lines of the file
+         (see File.loadBodyInfo). A desktop's location is in the header of the file, and
+         was already found by loadCrowdSourceInfo
+        ARGS:
+            None
+        RETURNS:
+            None
+        """
+        File.loadBodyInfo(self)
+        if self.Devicetype not in ["Phone", "Tablet", "iOS"]:
+            return
+        with self.openFile() as fs:
             #The Latitude and Longitude information between app versions is different, so
             # we need to have separate blocks for each. The main difference is that v1.0 has
             # just Latitude and Longitude, while v1.1 and later have GPS Lat, GPS Long,
@@ -332,10 +407,7 @@ class CrowdSource_File(File):
             # Network Lat/Long.
             else:
                 self.__loadPhoneCoords(fs)
-            #After all of this parsing, we just need to set anything that is empty to N/A
-            emptiesToSet = ["Server", "Host", "WiFiBSSID", "WiFiSSID"]
-            self.setEmptysToDefault(attributes=emptiesToSet)
-        #END IF
+        #END WITH FILE
     #END DEF
 
     def __loadPhoneCoords(self, fs):
@@ -376,8 +448,8 @@ class CrowdSource_File(File):
 
         #Function to parse and set the LastKnowLat/Long for both GPS and Network
         def _getLastKnown(fileStream, pair, attr):
-            line1 = getLinesWith(fs, pair[0])[0]
-            line2 = getLinesWith(fs, pair[1])[0]
+            line1 = self.getHeaderLines(fs, pair[0])[0]
+            line2 = self.getHeaderLines(fs, pair[1])[0]
             if "no value" not in line1.lower() and "no value" not in line2.lower():
                 self.__dict__[attr] = ( float(line1.split(pair[0])[1].strip()),
                                         float(line2.split(pair[1])[1].strip()))
@@ -466,10 +538,11 @@ class CrowdSource_File(File):
         assert (type_ in ["", "GPS", "Network"]
                 ),("Your type of Location values were not one of "+
                    "the options:"+str(["", "GPS", "Network"]))
-        #Now we will look for the specified types of Location information
-        latitudes = getLinesWith(fileStream, type_+"Latitude:")
-        longitudes = getLinesWith(fileStream, type_+"Longitude:")
-        distsMoved = getLinesWith(fileStream, type_+"DistanceMoved:")
+        #Now we will look for the specified types of Location information, in one read of the file
+        coordLines = getLinesWithAny(fileStream, [type_+"Latitude:", type_+"Longitude:", type_+"DistanceMoved:"])
+        latitudes = coordLines[type_+"Latitude:"]
+        longitudes = coordLines[type_+"Longitude:"]
+        distsMoved = coordLines[type_+"DistanceMoved:"]
 
         pairs = []
         #Now we are going to go through our three arrays, grabbing each value
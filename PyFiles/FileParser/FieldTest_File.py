@@ -27,7 +27,7 @@ if path.dirname(__file__) not in sys.path:
 
 #Importing necessary basic_utils functions
 from _parserUtils.basic_utils import getLinesWith
-from _parserUtils.device_tester_table import table
+from _parserUtils.device_tester_table import lookupTester
 #Importing the necessary sub-classes and base classes
 from _File import File
 from UDP_Test import UDP_Test
@@ -77,6 +77,18 @@ class FieldTest_File(File):
         AllCoordPairs       List of Tuples
     """
 
+    #All of the delimiters used by loadFieldTestInfo, which are indexed in one read of the file
+    HEADER_DELIMITERS = File.HEADER_DELIMITERS + [
+        "Name =", "Architecture =", ", Version =", ": Version =", "Vendor =",
+        "Server: ", "Host: ", "NetworkProvider: ", "Network Provider: ", "NetworkOperator: ",
+        "Device ID: ", "Host name: ", "ConnectionType: ", "Location ID: ", "Location: ",
+        "CPUC Tester", "iPhone", "Latitude:"
+    ]
+    #The Video Metrics are calculated from the tests, so they are also set by loadTests
+    LAZY_ATTRIBUTES = File.LAZY_ATTRIBUTES + ["WestVideoMetrics", "EastVideoMetrics"]
+    #The attributes set by loadBodyInfo, from the Latitude and Longitude lines of every test
+    BODY_ATTRIBUTES = File.BODY_ATTRIBUTES + ["AllCoordPairs", "Latitude", "Longitude"]
+
     def __new__(cls, *args, **kwargs):
         """
         Before creating an instance of the given file as a parsed object, we want to check
@@ -96,20 +108,32 @@ class FieldTest_File(File):
         # then save the result back into fileLoc
         if system()!="Windows":
             fileLoc = path.abspath(fileLoc).replace("\\","").strip()
-        #Checking that the file is indeed a FieldTest File. If not, return None
+        #Checking that the file is indeed a FieldTest File. If not, return None. Only the header
+        # is read to check this, so a file of another type costs one small read. The rest of
+        # the contents are then read, and are kept by the instance for the rest of the parsing.
+        # A lazy object only reads the rest of the header, up to the first test
         try:
-            with open(fileLoc) as checkingFile:
-                allText = checkingFile.read()
+            with File.openFileBuffer(fileLoc, kwargs.get("fileBuffer")) as fs:
+                headerText = File.sniffFileHeader(fs)
+                if all( [(string not in headerText.split("\n\n")[0]) for string in ["CPUC Tester","CPUC Traceroute"]] ):
+                    if "DEBUG" in kwargs and kwargs["DEBUG"]:
+                        print("{} is not a Field Test output file. ".format(os.path.basename(fileLoc))+
+                              "It did not have the necessary header.", file=sys.stderr)
+                    return None
+                if kwargs.get("lazy", False) and "fileBuffer" not in kwargs:
+                    headerText = File.sniffFileHeader(fs, end="Starting Test", text=headerText)
+                    allText = None
+                else:
+                    allText = headerText + fs.read()
             #END WITH FILE
-            if all( [(string not in allText.split("\n\n")[0]) for string in ["CPUC Tester","CPUC Traceroute"]] ):
-                if "DEBUG" in kwargs and kwargs["DEBUG"]:
-                    print("{} is not a Field Test output file. ".format(os.path.basename(fileLoc))+
-                          "It did not have the necessary header.", file=sys.stderr)
-                return None
         except:
             print(fileLoc+" is a file that could not be read.", file=sys.stderr)
             return None
         inst = File.__new__(cls)
+        if allText is None:
+            inst._headerText = headerText.split("Starting Test")[0]
+        else:
+            inst._fileText = allText
         return inst
     #END DEF
 
@@ -118,6 +142,13 @@ class FieldTest_File(File):
         Initializes the object by parsing the data in the given file path. Calls parent's __init__
         ARGS:
             filePath    String, containing absolute path to raw data file
+        KWARGS:
+            fileBuffer  String, bytes, or an open file object, holding the contents of the file.
+                         If given, the file at filePath is not read from disk
+            lazy        Boolean, if True, only the header is read and parsed here. The tests are
+                         parsed the first time that one of the LAZY_ATTRIBUTES is asked for, and
+                         any errors found in the tests are only set at that time. The rest of the
+                         file is read for the BODY_ATTRIBUTES the first time one is asked for
         """
         if 'empty' in kwargs and kwargs['empty']:
             return
@@ -127,21 +158,35 @@ class FieldTest_File(File):
 
         #Call the parent class' __init__
         eastAndWestServerIP = FieldTest_EastWest
-        File.__init__(self, filePath=filePath, eastWestIP=eastAndWestServerIP)
+        File.__init__(self, filePath=filePath, eastWestIP=eastAndWestServerIP,
+                      lazy=kwargs.get("lazy", False))
         self.loadFieldTestInfo()
 
-        #Actually parsing the tests in the file
-        self.findAndParseTCPTests()
-        self.findAndParsePINGTests()
-        self.findAndParseUDPTests()
+        #The body of the file and the tests are parsed now, unless the object is lazy
+        if not self._lazyTests:
+            self.loadBodyInfo()
+            self.loadTests()
+        elif "fileBuffer" not in kwargs:
+            #A lazy object does not hold on to its header. The rest of the file is read
+            # from self.FilePath (or memory-mapped, for the tests) when it is needed
+            del self._headerText
+        #END IF/ELSE
+    #END INIT
+
+
 
-        for eastwest in ['East','West']:
-            try:
-                self.RValue[eastwest] = self.calcRval(eastwest)
-                self.MOS[eastwest] = self.calcMOS(eastwest)   
-            except:
-                self.RValue[eastwest] = 'NA'
-                self.MOS[eastwest] = 'NA'
+# INITIALIZATION FUNCTIONS -----------------------------------------------------
+
+    def loadTests(self):
+        """
+        Parses all of the tests in the file (see File.loadTests), and then checks that all
+         14 of the tests were found
+        ARGS:
+            None
+        RETURNS:
+            None
+        """
+        File.loadTests(self)
 
         #This is one final check, to make sure that we have all 14 tests. If not, then
         # there was an unknown test of some kind, and we set our _contains_Errors to True
@@ -168,12 +213,7 @@ class FieldTest_File(File):
         except:
             self.EastVideoMetrics = []
         #self.EastVideoMetrics = VideoMetrics(self, 'east').getValues()
-
-    #END INIT
-
-
-
-# INITIALIZATION FUNCTIONS -----------------------------------------------------
+    #END DEF
 
     def loadFieldTestInfo(self):
         """
@@ -185,7 +225,7 @@ class FieldTest_File(File):
             None
         """
         #This opens the file, and stores the file stream into the variabe fs
-        with open(self.FilePath,'r') as fs:
+        with self.openHeader() as fs:
             #Read in Operating System Header Information
             self.parseLineAndSetAttr(fileStream=fs, delimiter=["Name =", "Architecture =", ", Version ="],
                                      attribute=["OSName", "OSArchitecture", "OSVersion"],
@@ -218,13 +258,13 @@ class FieldTest_File(File):
             #END IF/ELIF/ELSE
 
             #Setting the Device Type based on the Date/Time line, and the file name
-            if getLinesWith(fs,"Testing started at") and "WBBD" not in self.Filename:
-                if "tablet" in getLinesWith(fs,"CPUC Tester")[0].lower():
+            if self.getHeaderLines(fs,"Testing started at") and "WBBD" not in self.Filename:
+                if "tablet" in self.getHeaderLines(fs,"CPUC Tester")[0].lower():
                     self.DeviceType = "Tablet"
                 else:
                     self.DeviceType = "Phone"
                     #checks if the Phone is an iPhone
-                    if getLinesWith(fs,"iPhone"):
+                    if self.getHeaderLines(fs,"iPhone"):
                         self.DeviceType = "iPhone"
             else:
                 self.DeviceType = "Netbook"
@@ -241,30 +281,11 @@ class FieldTest_File(File):
                 # iOS devices use a different tester scheme than android
                 if self.DeviceType == "iPhone":
                     self.Tester = self.parseiPhoneTester(self.DeviceID)
-                #This converts the multiline string into a 2-D list, where the first
-                # element is the device ID, and the second is the tester number
+                #Otherwise, the tester is looked up in the index of the device/tester table
                 else:
-                    dttable = [elem.split(",") for elem in table.strip().split("\n")]
-                    for pair in dttable:
-                        if self.DeviceID in pair[0]:
-                            self.Tester = pair[1].strip()
-                            break
-                #END FOR
+                    self.Tester = lookupTester(self.DeviceID) or "NA"
+                #END IF/ELSE
             #END IF
-
-            #Getting all of the Latitude and Longitude pairs from the file, and
-            # then searching through them for the most accurate (ie. first pair,
-            # starting from the end, to have non-zero values)
-            self.AllCoordPairs = self.__getAllCoordinates(fileStream=fs)
-            for pair in reversed(self.AllCoordPairs):
-                if all([elem!=0 for elem in pair]):
-                    self.Latitude = pair[0]
-                    self.Longitude = pair[1]
-                    break
-            #END FOR
-            if "Latitude" not in self.__dict__:
-                self.Latitude = 0
-                self.Longitude = 0
         #END WITH FILE
 
         #Creating an array of the variables that we want to set to "NA" if they are empty
@@ -274,121 +295,112 @@ class FieldTest_File(File):
         self.setEmptysToDefault(attributes=emptiesToSet)
     #END DEF
 
+    def loadBodyInfo(self):
+        """
+        Finds the location of the test in all of the Latitude and Longitude lines of the
+         file (see File.loadBodyInfo)
+        ARGS:
+            None
+        RETURNS:
+            None
+        """
+        File.loadBodyInfo(self)
+        #Getting all of the Latitude and Longitude pairs from the file, and
+        # then searching through them for the most accurate (ie. first pair,
+        # starting from the end, to have non-zero values)
+        with self.openFile() as fs:
+            self.AllCoordPairs = self.__getAllCoordinates(fileStream=fs)
+        #END WITH FILE
+        for pair in reversed(self.AllCoordPairs):
+            if all([elem!=0 for elem in pair]):
+                self.Latitude = pair[0]
+                self.Longitude = pair[1]
+                break
+        #END FOR
+        if "Latitude" not in self.__dict__:
+            self.Latitude = 0
+            self.Longitude = 0
+    #END DEF
+
     def __getAllCoordinates(self, fileStream):
         """
-        A function used by loadFieldTestInfo to parse all of the Location pairs
+        A function used by loadBodyInfo to parse all of the Location pairs
          (i.e. Latitude and Longitude), and save in self.AllCoordPairs
         """
-        #Getting all lines with the Latitude info
-        latitudes = getLinesWith(fileStream, "Latitude:")
-        #Now that we have all of the latitudes, we need to go back to those locations
-        # in the file and get the following lines, which contain the Longitudes
-        longitudes = []
+        #Reading through the file once, pairing each Latitude line with the line that
+        # follows it, which should contain the Longitude. If it does not, then the
+        # Longitude of that pair is 0
         oldLoc = fileStream.tell()
-        for goodLat in latitudes:
-            line = "__"
-            while line:
-                if goodLat in line:
-                    line = fileStream.readline()
-                    longitudes.append(line)
-                    break
-                line = fileStream.readline()
-            #END WHILE
-            if latitudes.index(goodLat) != (len(longitudes)-1):
-                longitudes.append("Longitude: 0.0")
+        fileStream.seek(0)
+        pairs = []
+        latitude = None
+        for line in fileStream:
+            if latitude is not None:
+                longitude = line.split("Longitude:")[1] if "Longitude:" in line else "0.0"
+                pairs.append( [latitude, longitude.strip()] )
+                latitude = None
+            if "Latitude:" in line:
+                latitude = line.split("Latitude:")[1].strip()
         #END FOR
+        if latitude is not None:
+            pairs.append( [latitude, "0.0"] )
         fileStream.seek(oldLoc)
 
-        pairs = []
-        #Now we are going to go through our three arrays, grabbing each value
-        # and making a 2-element array out of the latitude and longitude.
-        #We will only go along the array up to the shortest array so that we don't try to
-        # index beyond the array
-        for i in range( len(latitudes) ):
-            pairs.append( [latitudes[i].split("Latitude:")[1].strip(),
-                           longitudes[i].split("Longitude:")[1].strip()] )
-        #END FOR
-        #Going through each 'pair' (of three elements) and casting them to a float if they
+        #Going through each pair and casting the values to a float if they
         # are numeric. Otherwise, we assume that they are 0
-        for pair in pairs:
+        for index, pair in enumerate(pairs):
             newPair = []
             for elem in pair:
                 try:
-                    elem = float(elem)
-                    newPair.append(elem)
+                    newPair.append(float(elem))
                 except:
                     newPair.append(0)
             #END FOR
-            pairs[pairs.index(pair)] = newPair
+            #Making all of our pairs into tuples
+            pairs[index] = tuple(newPair)
         #END FOR
-        #Making all of our 3-element pairs into tuples
-        pairs = [tuple(pair) for pair in pairs]
         return pairs
     #END DEF
 
-    def findAndParseUDPTests(self):
+    def makeTests(self, type_, chunk):
         """
-        This takes the contents of the file being parsed, splits the content by "Staring Test"
-         (to included any error messages in the tests) using the readAllTestsFromFile function,
-         and the creates the specified Test objects. Assumes that self._fileContentsByTest
-         contains all of the tests.
+        Creates the Test object(s) for a chunk of test output (see File.makeTests). The
+         UDP 1 second tests are three tests run in sequence, so they are split into their
+         sub-tests, each of which is made into its own UDP_Test object.
+        ARGS:
+            type_   String, the type of test in the chunk (see classifyTest)
+            chunk   TestChunk, the output of one test
+        RETURNS:
+            List of Test objects
         """
-        #First we run the readAllTestsFromFile function, to make sure that self._fileContentsByTest
-        # is set, and contains all of the test output
-        self.readAllTestsFromFile()
-        #If the function above ran and did not hit any major errors, then we can run the code
-        # inside of the IF block
-        if not self.ContainsErrors:
-            for chunk in self._fileContentsByTest:
-                if "1 second Test" in chunk:
-                    #This block gets the test number from the beginning of this chunk of
-                    # characters. Each 1 second test has a different test number, as 3 are
-                    # run in sequence. The number stored in tempTestNum applies to all 3
-                    allStartingLine = ""
-                    tempTestNum = 0
-                    for line in chunk.split("\n"):
-                        #If "Starting Test" is in the line, and we have not set our overall
-                        # test number yet, we are going to parse it out. We also save the
-                        # line with the number in it so that we can concatenate it to
-                        # the beginning of each chunk
-                        if ("Starting Test" in line) and (tempTestNum == 0):
-                            allStartingLine = line+"\n"
-                            rightChunk = line.split("Starting Test ")[1].strip()
-                            tempTestNum = rightChunk.split(":")[0].split("..")[0]
-                            break
-                    #END FOR
-                    subTests = chunk.split("Starting UDP 1")[1:]
-                    subTests = [(allStartingLine+"Starting UDP 1"+text) for text in subTests]
-                    #Now we go through each 1 second test, parse it into a UDP_Test object,
-                    # and appended it to the array parsedSubTests. This array will then be
-                    # added to self.Tests in the UDP and NUM category
-                    for test in subTests:
-                        #The if statement is one last check to make sure that the test actually contains
-                        # some basic information
-                        if "Iperf command line" in test:
-                            parsedTest = UDP_Test(dataString=test, eastWestIP=self.EastWestSrvrIPs)
-                            tempSubTestNum = test.split("Test #")[1].split("\n")[0].strip()
-                            parsedTest.TestNumber = int(tempTestNum)
-                            parsedTest.SubTestNumber = int(tempSubTestNum)
-                            self.Tests[parsedTest.ConnectionType].append(parsedTest)
-                            #Determining the index for this "sub" test
-                            byNum = float(str(parsedTest.TestNumber)+"."+str(parsedTest.SubTestNumber))
-                            self.TestsByNum[byNum] = parsedTest
-                        #END IF
-                    #END FOR
-                else:
-                    parsedTest = UDP_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
-                    #If the line above returned an object (and not None), then we have correctly
-                    # parsed a Test, and can add it to our list.
-                    if parsedTest:
-                        self.Tests[parsedTest.ConnectionType].append(parsedTest)
-                        self.TestsByNum[int(parsedTest.TestNumber)] = parsedTest
-                    else:
-                        pass #If we are passing, then the test was not a TCP test
-                    #END IF/ELSE
-                #END IF/ELSE
-            #END FOR
+        if type_ != "UDP" or "1 second Test" not in chunk.getFirstLine():
+            return File.makeTests(self, type_, chunk)
         #END IF
+        #This block gets the test number from the first line of this chunk, which is the
+        # "Starting Test" line. Each 1 second test has a different test number, as 3 are
+        # run in sequence. The number stored in tempTestNum applies to all 3. We also save
+        # the line so that it can be put at the beginning of each sub-test
+        allStartingLine = chunk.getFirstLine()+"\n"
+        rightChunk = allStartingLine.split("Starting Test ")[1].strip()
+        tempTestNum = rightChunk.split(":")[0].split("..")[0]
+        #The sub-tests are views of the same source as this chunk, so each one starts
+        # with the starting line, and nothing is copied
+        subTests = chunk.split("Starting UDP 1", prefix=allStartingLine)
+        #Now we go through each 1 second test, parse it into a UDP_Test object,
+        # and appended it to the array parsedSubTests
+        parsedSubTests = []
+        for test in subTests:
+            #The if statement is one last check to make sure that the test actually contains
+            # some basic information
+            if "Iperf command line" in test:
+                parsedTest = UDP_Test(dataString=test, eastWestIP=self.EastWestSrvrIPs)
+                tempSubTestNum = test.getLineAfter("Test #").strip()
+                parsedTest.TestNumber = int(tempTestNum)
+                parsedTest.SubTestNumber = int(tempSubTestNum)
+                parsedSubTests.append(parsedTest)
+            #END IF
+        #END FOR
+        return parsedSubTests
     #END DEF
 
     def parseiPhoneTester(self, id):
@@ -526,17 +538,17 @@ class VideoMetrics:
             for updown in ['UP','DOWN']:
                 for thread in object.Tests['TCP'][test].Threads[updown]:
                     intervalCount = 0
-                    for interval in thread.Measurements:
+                    for speed in thread.arrayOfMsmts("Speed"):
                         try:
                             if updown == 'UP':
-                                upSum[test][intervalCount] += interval.Speed
+                                upSum[test][intervalCount] += speed
                             else:
-                                dnSum[test][intervalCount] += interval.Speed
+                                dnSum[test][intervalCount] += speed
                         except:
                             if updown == 'UP':
-                                upSum[test].append(interval.Speed)
+                                upSum[test].append(speed)
                             else:
-                                dnSum[test].append(interval.Speed)
+                                dnSum[test].append(speed)
                         intervalCount+=1
                         if intervalCount == 10: #we only want the first 10 measurements
                             break
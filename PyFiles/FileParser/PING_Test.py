@@ -12,6 +12,7 @@ if __name__=="__main__":
     raise SystemExit
 
 # IMPORTS
+import re
 import sys
 from _parserUtils.basic_utils import calc_rVal_MOS
 from _Test import Test
@@ -31,11 +32,13 @@ class PING_Packet(Formatting):
         TTL     Float, the Time To Live of the Ping packet
     """
 
+    #Packets are made in large numbers, so they have no __dict__, and their
+    # padding is kept by the class
+    __slots__ = ("RTT", "TTL")
+    StringPadding = Formatting.StringPadding * 3
+
     def __init__(self, dataString, _outputType1=True):
         """Object initialization"""
-        #Inheritting our formatting
-        Formatting.__init__(self)
-        self.StringPadding = self.StringPadding * 3
         #Setting an array of strings that are key strings we are looking for.
         # If any are found, then there was an error in the test, and we set our
         # object attributes to default values
@@ -97,19 +100,36 @@ class PING_Test(Test):
         LossPercent     Integer, percentage of packets lost
     """
 
+    #Each alternative in this pattern is one of the kinds of lines that are parsed, and
+    # lastgroup is the name of the alternative that matched. The ones ending in 1 are
+    # from Linux and Android output, and the ones ending in 2 are from Windows output
+    PING_PATTERN = re.compile(r"""
+        ^(?=[^\n]*(?i:ttl)) [^\n]*? time [^=\n]* = (?P<RTT>[^\ =\n]*)
+      | (?P<Statistics>(?i:statistics))
+      | (?P<Latitude>(?i:latitude))
+      | (?P<Packets1>^[\ \t]*(?P<Sent1>\d+)\ packets\ transmitted,\ (?P<Received1>\d+)[^,\n]*
+                     (?:,\ (?P<Loss1>[\d.]+)%)? )
+      | (?P<Packets2>Sent\ =\ (?P<Sent2>\d+),\ Received\ =\ (?P<Received2>\d+),\ Lost\ =\ (?P<Lost2>\d+))
+      | (?P<RTTs1>=\ (?P<Min1>[\d.]+)/(?P<Avg1>[\d.]+)/(?P<Max1>[\d.]+))
+      | (?P<RTTs2>Minimum\ =\ (?P<Min2>[\d.]+)ms,\ Maximum\ =\ (?P<Max2>[\d.]+)ms,
+                  \ Average\ =\ (?P<Avg2>[\d.]+)ms)
+        """, re.MULTILINE | re.VERBOSE)
+
     def __new__(cls, *args, **kwargs):
         """
         Before creating an instance of the given file as a parsed object, we want to check
         that the file is indeed a test file. This will see if the necessary text
         is in the first few lines. If not, then we return None, and the object is not created
         """
+        if 'empty' in kwargs and kwargs['empty']:
+            return Test.__new__(cls, empty=True)
         #Getting the Data String passed to this constructor that was passed in to the constructor
         if "dataString" in kwargs:
             dataString = kwargs["dataString"]
         else:
             dataString = args[0]
         #END IF/ELSe
-        if "ping" not in dataString.lower():
+        if "ping" not in str(dataString).lower():
             if "DEBUG" in kwargs and kwargs["DEBUG"]:
                 print("The raw data passed to this constructor (PING_Test) did not contain "+
                       "the necessary identifiers.",
@@ -120,16 +140,20 @@ class PING_Test(Test):
         return inst
     #END DEF
 
-    def __init__(self, dataString="", eastWestIP=("0.0.0.0", "0.0.0.0")):
+    def __init__(self, dataString="", eastWestIP=("0.0.0.0", "0.0.0.0"), blankLinePadded=False):
         """
         Used to initialize an object of this class
         ARGS:
             dataString  String, the text that is going to be parsed
             eastWestIP  Tuple of two Strings, first String is the IP address of the East server, second the West
+            blankLinePadded Boolean, True if the output has a blank line after each of its lines
+                         (as pings from XP and Vista do)
         """
         #If we are at this point, then the dataString contained "ping", and we can
         # set the ConnectionType to "PING"
         self.ConnectionType = "PING"
+        #The data may be given as a TestChunk view, so we make sure that we have its text
+        dataString = str(dataString)
         #Call the parent class' __init__
         Test.__init__(self, dataString=dataString, eastWestIP=eastWestIP)
         self.Times = []
@@ -137,7 +161,15 @@ class PING_Test(Test):
         #A quick check that we do not have weird formatting of our PING test.
         # Sometimes, there are cases where there are two newline characters between
         # each line of data.
-        if "\n\n\n" in dataString and "statistics" not in dataString:
+        # Output that is padded with blank lines always has two newlines between its lines,
+        # so for it, we only look for the blank line that follows the ping command (the
+        # line with "-n") when nothing comes after that command
+        if blankLinePadded:
+            lines = [line for line in dataString.split("\n") if line]
+            oddFormatting = bool(lines) and ("-n" in lines[-1])
+        else:
+            oddFormatting = ("\n\n\n" in dataString)
+        if oddFormatting and "statistics" not in dataString:
             self._ErrorHandling__setErrorCode(101)
         #Now we parse out the Pings from the test
         if not self.ContainsErrors:
@@ -169,121 +201,82 @@ class PING_Test(Test):
     def parsePings(self, dataString):
         """
         Parses out all of the Ping test information (individual ping RTTs and total RTT stats)
+         in one pass of PING_PATTERN over the text. The values are found by what they look
+         like, and not by which line they are on, so the output of every kind of device
+         (including XP and Vista, which have blank lines between every line) is parsed the same way
         ARGS:
-            None
+            dataString  String, the text of the test
         RETURNS:
             None
         """
-        
-        dataLines = dataString.splitlines()
-        pingList = []
-        statList = []
+        found = {}
         recordStats = False
-        #This loop will place all ping lines in pingList 
-        # and make a string containing the ping statistics
-        for line in dataLines:
-            if len(statList) > 0 and recordStats == True:
-                if (statList[-1] == '\n' and line == '\n') or 'latitude' in line.lower():
-                    recordStats = False
-            if 'ttl' in line.lower(): #ttl makes an appearance in all pings
-                pingList.append(line)
-            elif 'statistics' in line.lower() or recordStats == True: #statsList holds ping statstics. Later converted into a string.
+        for match in PING_Test.PING_PATTERN.finditer(dataString):
+            kind = match.lastgroup
+            #Every ping reply (which has a TTL) is a packet, wherever it is in the test
+            if kind == "RTT":
+                self.Times.append(PING_Packet(match.group("RTT"), self.is_outputType1))
+            #The statistics are only looked for after the "statistics" line, and
+            # before a "Latitude" line
+            elif kind == "Statistics":
                 recordStats = True
-                statList.append(line + '\n')
-
-        statString = ''.join(statList)
-
-
-
-        #Now we can parse the information we want
-        self.__parseStats(statString)
-        self.__parseIndividualPings(pingList)
-
-
-        
-
-        '''
-        #We start our function be splitting the data string into individual chunks,
-        # which we will then parse individually
-        dataChunks = [elem.strip() for elem in dataString.split("\n\n") if elem]
-        statsText = "ping statistics"
-        for chunk in dataChunks:
-            if statsText in chunk.lower():
-                self.__parseStats(chunk)
-            #If the string 'bytes of data' is in the chunk, then we are looking
-            # at the chunk holding all of the ping packet results
-            if "bytes of data" in chunk:
-                self.__parseIndividualPings(chunk, "bytes of data")
-            elif "data bytes" in chunk:
-                self.__parseIndividualPings(chunk, "data bytes")
+            elif kind == "Latitude":
+                recordStats = False
+            elif recordStats and (kind not in found):
+                found[kind] = match
+            #END IF/ELIF
         #END FOR
+        self.__parseStats(found)
     #END DEF
-        '''
-
-    def __parseIndividualPings(self, pings):
-        '''
-        This function will parse the RTTs of all the pings in a ping test
-        '''
-        for ping in pings:
-            tempSplit = ping.split('=')
-            for i in range(0, len(tempSplit)):
-                if 'time' in tempSplit[i]: #RTT will be in the next index
-                    self.Times.append(PING_Packet(tempSplit[i+1].split(' ')[0], self.is_outputType1))
-                    break #Time to move to the next line
-        
-
-    def __parseStats(self, dataString):
+
+    def __parseStats(self, found):
+        """
+        Sets the packet counts and RTT stats from the matches of PING_PATTERN
+        ARGS:
+            found   Dictionary, the first match of each kind of statistics line, by group name
+        """
         #Depending on whether our ouput was of one type or another, we will follow
         # different rules for parsing
-        dataString = dataString.split("\n")
         if self.is_outputType1:
-            #First declare packetsLine to be the first element, and then split it by ",".
-            # Then parse the packets sent and received, and deduce the packets lost
-            packetsLine = dataString[1]
-            packetsLine = packetsLine.split(",")
-            self.PacketsSent = int(packetsLine[0].split(" ")[0])
-            self.PacketsReceived = int(packetsLine[1].strip().split(" ")[0])
+            #Parse the packets sent and received, and deduce the packets lost
+            if "Packets1" not in found:
+                raise ValueError("The ping statistics did not have the packets sent and received")
+            packets = found["Packets1"]
+            self.PacketsSent = int(packets.group("Sent1"))
+            self.PacketsReceived = int(packets.group("Received1"))
             self.PacketsLost = int(self.PacketsSent - self.PacketsReceived)
-            try:
-                self.LossPercent = int(float(packetsLine[2].split("%")[0]))
-            except:
+            if packets.group("Loss1") is not None:
+                self.LossPercent = int(float(packets.group("Loss1")))
+            else:
                 self.LossPercent = int(self.PacketsLost / self.PacketsSent * 100)
             if self.LossPercent == 100:
                 self._ErrorHandling__setErrorCode(101)
-            #This try/except block is needed, as sometimes the min/avg/max numbers
-            # are not printed out by iPerf. This happens in the case of 100% packet loss
-            try:
-                RTTLine = dataString[2]
-                RTTNums = RTTLine.split("=")[1].strip().split("/")
-                self.RTTMin = float(RTTNums[0])
-                self.RTTAverage = float(RTTNums[1]) 
-                #Added a try/except block in case there was no mdev given
-                try:
-                    self.RTTMax = float(RTTNums[2])
-                except:
-                    self.RTTMax = float(RTTNums[2].split(" ")[0])
-            except:
+            #The min/avg/max numbers are not always printed out. This happens in the case
+            # of 100% packet loss
+            if "RTTs1" in found:
+                self.RTTMin = float(found["RTTs1"].group("Min1"))
+                self.RTTAverage = float(found["RTTs1"].group("Avg1"))
+                self.RTTMax = float(found["RTTs1"].group("Max1"))
+            else:
                 self.RTTMin     = -1
                 self.RTTMax     = -1
                 self.RTTAverage = -1
         else:
-            #First declare packetsLine to be the first element, and then split it by ",".
-            # Then parse the packets sent and lost
-            packetsLine = dataString[1]
-            packetsLine = packetsLine.split(",")
-            self.PacketsSent = int(packetsLine[0].split("=")[1].strip())
-            self.PacketsReceived = int(packetsLine[1].split("=")[1].strip())
-            self.PacketsLost = int(packetsLine[2].split("=")[1].strip().split(" ")[0])
+            #Parse the packets sent, received, and lost
+            if "Packets2" not in found:
+                raise ValueError("The ping statistics did not have the packets sent and received")
+            packets = found["Packets2"]
+            self.PacketsSent = int(packets.group("Sent2"))
+            self.PacketsReceived = int(packets.group("Received2"))
+            self.PacketsLost = int(packets.group("Lost2"))
             self.LossPercent = int(self.PacketsLost / self.PacketsSent * 100)
-            #This try/except block is needed, as sometimes the min/avg/max numbers
-            # are not printed out by iPerf. This happens in the case of 100% packet loss
-            try:
-                RTTLine = dataString[3]
-                RTTLine = RTTLine.split(",")
-                self.RTTMin = float(RTTLine[0].split("=")[1][:-2].strip())
-                self.RTTMax = float(RTTLine[1].split("=")[1][:-2].strip())
-                self.RTTAverage = float(RTTLine[2].split("=")[1][:-2].strip())
-            except:
+            #The min/avg/max numbers are not always printed out. This happens in the case
+            # of 100% packet loss
+            if "RTTs2" in found:
+                self.RTTMin = float(found["RTTs2"].group("Min2"))
+                self.RTTMax = float(found["RTTs2"].group("Max2"))
+                self.RTTAverage = float(found["RTTs2"].group("Avg2"))
+            else:
                 self.RTTMin     = -1
                 self.RTTMax     = -1
                 self.RTTAverage = -1
@@ -15,8 +15,15 @@ if __name__=="__main__":
 
 # IMPORTS
 import sys
+from array import array
+from fractions import Fraction
 from statistics import pstdev, median
 from _Test import Test
+#NumPy is optional. If it is not installed, the thread matrices are kept in flat arrays
+try:
+    import numpy
+except ImportError:
+    numpy = None
 #END IMPORTS
 
 
@@ -29,6 +36,9 @@ class TCP_Test(Test):
         ThreadsByNum    List, thread objects (UP and DOWN) organized by number
         WindowSize      Integer, the size of TCP window
         ThreadNumbers   List of Integers, the possible thread numbers
+        ThreadMatrices  Dictionary, the values of the threads in each direction as a
+                         threads x intervals matrix (see getThreadMatrix), which are
+                         only made the first time that they are needed
     """
 
     def __new__(cls, *args, **kwargs):
@@ -37,13 +47,15 @@ class TCP_Test(Test):
          that the file is indeed a test file. This will see if the necessary text
          is in the first few lines. If not, then we return None, and the object is not created
         """
+        if 'empty' in kwargs and kwargs['empty']:
+            return Test.__new__(cls, empty=True)
         #Getting the Data String passed to this constructor that was passed in to the constructor
         if "dataString" in kwargs:
             dataString = kwargs["dataString"]
         else:
             dataString = args[0]
         #END IF/ELSe
-        if "tcp" not in dataString.lower():
+        if "tcp" not in str(dataString).lower():
             if "DEBUG" in kwargs and kwargs["DEBUG"]:
                 print("The raw data passed to this constructor (TCP_Test) did not contain "+
                       "the necessary identifiers.",
@@ -66,6 +78,7 @@ class TCP_Test(Test):
         self.ConnectionType = "TCP"
         #Call the parent class' __init__
         Test.__init__(self, dataString=dataString, eastWestIP=eastWestIP)
+        self.ThreadMatrices = {}
 
         #If we were unable to parse out the iPerfCommand line from the text, then
         # we assume that there was an error of some kind that was not caught, and exit
@@ -103,22 +116,13 @@ class TCP_Test(Test):
         RETURNS:
             None
         """
-        #We first call the sorting method, which will return a boolean and the strings
-        # in self._text sorted by thread number. If the boolean is true, the threads are sorted
-        (sorted_, tempThreads) = self.__sortThreadsByNum()
+        #We first call the demultiplexer, which will return a boolean and the strings in
+        # self._text sorted by thread number and direction. If the boolean is true, the
+        # threads are sorted
+        (sorted_, tempThreadsByDirection) = self.__demuxThreads()
         if not sorted_:
             return
 
-        #Now that every thread is sorted into an array of string, we can split them into
-        # upload and download threads, and pass it to the TCP_Thread object
-        #Grabbing a list of all of the thread numbers from this test
-        self.ThreadNumbers = list(tempThreads.keys())
-        #Initializaing tempThreadsByDirection to have the necessary keys (thread numbers),
-        # and each key holds another dictionary of 2 arrays, linked to the keys UP and DOWN
-        (againSorted_, tempThreadsByDirection) = self.__sortThreadsByNumDir(tempThreads)
-        if not againSorted_:
-            return
-
         #Now that everything is split by thread number and by direction, we can call
         # the TCP Thread object creation
         for threadNum in tempThreadsByDirection:
@@ -138,42 +142,60 @@ class TCP_Test(Test):
         #END FOR
     #END DEF
 
-    def __sortThreadsByNum(self):
-        #This block does the initial organization, going through each line and
-        # putting them into the array whose key corresponds with their thread number.
-        tempThreads = {}
+    def __demuxThreads(self):
+        """
+        Goes through the lines in self._text once, putting each line into the list of its
+         thread number and direction, in the order that they are in. This will make the structure
+         dict [thread number 1] [ UP ]   = [String1, String2, String3, etc..]
+              [thread number 1] [ DOWN ] = [String4, String5, String6, etc..]
+              [thread number 2] [ UP ]   = [String7, String8, String9, etc..]
+              .....
+         A thread's lines are upload lines until its second "connected with" line, which starts
+         its download lines. A thread that only has one "connected with" line (as its first line)
+         has all of its lines put in the download list.
+        RETURNS:
+            Tuple (Boolean, dictionary), Boolean is whether the lines were sorted without an error
+        """
+        tempThreadsByDirection = {}
+        #The number of "connected with" lines that each thread had, and whether each thread
+        # has started its download lines yet
+        connections = {}
+        switched = {}
         for line in self._text:
             if ("[" in line) and ("SUM" not in line):
-                #This gets the thread number from within the square brackets, checks
-                # if it is a key in tempThreads, and then adds the line to correct
-                # list in tempThreads (each key is a thread number)
+                #This gets the thread number from within the square brackets, and adds the line
+                # to the correct list in tempThreadsByDirection
                 try:
                     newKey = int(line.split("]")[0][1:].strip())
                 except:
                     self._ErrorHandling__setErrorCode(404, "Something went wrong with TCP test")
                     break
-                if newKey not in tempThreads.keys():
-                    tempThreads[newKey] = []
+                if newKey not in tempThreadsByDirection:
+                    tempThreadsByDirection[newKey] = {"UP": [], "DOWN": []}
+                    connections[newKey] = 0
+                    switched[newKey] = False
+                #END IF
+                if "connected with" in line:
+                    connections[newKey] += 1
+                    if not switched[newKey] and tempThreadsByDirection[newKey]["UP"]:
+                        switched[newKey] = True
                 #END IF
-                tempThreads[newKey].append(line)
+                tempThreadsByDirection[newKey]["DOWN" if switched[newKey] else "UP"].append(line)
             #END IF
         #END FOR
+        for threadNum, thread in tempThreadsByDirection.items():
+            if not switched[threadNum]:
+                thread["UP"], thread["DOWN"] = [], thread["UP"]
+        #END FOR
 
         #ERROR CHECKING
         #Now we check for a funny error, where one thread starts either an upload or download twice,
         # while another only starts an upload. If this is the case, the test will be ignored, and
         # self._contains_Errors is set to True.
-        checkThreadsForErr = {}
-        for threadNum, thread in tempThreads.items():
-            #This line goes through all of the lines in thread, and counts how many have
-            # "connected with" in them. If the line contains the string, it adds a 1, otherwise a 0.
-            # At the end, it sums up the number of "connected with"s, and uses that in the next
-            # block to determine if there was an output error
-            checkThreadsForErr[threadNum] = sum( [1 if ("connected with" in line) else 0 for line in thread] )
         oneLess = 0
         oneMore = 0
         _wasAnError = False
-        for threadNum, value in checkThreadsForErr.items():
+        for threadNum, value in connections.items():
             if value == 3:
                 oneMore = threadNum
                 _wasAnError = True
@@ -191,32 +213,11 @@ class TCP_Test(Test):
             #If there was an error, then we return with what amounts to an empty TCP Test
             return (False, None)
         #END IF
-        return (True, tempThreads)
-    #END DEF
 
-    def __sortThreadsByNumDir(self, tempThreads):
-        tempThreadsByDirection = {}
+        #Grabbing a list of all of the thread numbers from this test
+        self.ThreadNumbers = list(tempThreadsByDirection.keys())
         for threadNum in self.ThreadNumbers:
-            tempThreadsByDirection[threadNum] = {"UP": [], "DOWN": []}
             self.ThreadsByNum[threadNum] = {"UP": None, "DOWN": None}
-        #Now we can actually start putting the necessary strings into the arrays
-        # that they need to be sorted into. This will make the structure below
-        # dict [thread number 1] [ UP ]   = [String1, String2, String3, etc..]
-        #      [thread number 1] [ Down ] = [String4, String5, String6, etc..]
-        #      [thread number 2] [ UP ]   = [String7, String8, String9, etc..]
-        #      .....
-        for threadNum, thread in tempThreads.items():
-            downStartInd = 0
-            for elem in thread[1:]:
-                if "connected with" in elem:
-                    downStartInd = thread[1:].index(elem) + 1
-                    break
-            #END FOR
-            #We slice up the array of strings in thread, putting the upload ones
-            # in [threadNum]["UP"], and the download ones into [threadNum]["DOWN"]
-            tempThreadsByDirection[threadNum]["UP"] = thread[0:downStartInd]
-            tempThreadsByDirection[threadNum]["DOWN"] = thread[downStartInd:]
-        #END FOR
 
         #ERROR CHECKING
         #One last check for another funny error. This is where the thread only had
@@ -271,7 +272,7 @@ class TCP_Test(Test):
                                       " had a bad final measurement. (Time was from 0.0 to 0.0 seconds)")
                     self._ErrorHandling__setErrorCode(101, specialMessage)
                     break
-                if (thread.FinalMsmt.Speed > 1000000) and (thread.Measurements[0].Speed == 0):
+                if (thread.FinalMsmt.Speed > 1000000) and (thread.MsmtColumns["Speed"][0] == 0):
                     from math import log10
                     specialMessage = (direction + " Thread #{}".format(thread.ThreadNumber) +
                                       " had a bad final measurement. (Measured speed was in the order "+
@@ -292,6 +293,52 @@ class TCP_Test(Test):
 
 # THREAD VALUE GETTERS ---------------------------------------------------------
 
+    def getThreadMatrix(self, direction="DOWN"):
+        """
+        Returns the values of all of the threads in the given direction as a matrix, where
+         each row is a thread, and each column is a 1 second interval. Threads that are shorter
+         than the longest thread are padded with 0s, which are marked as missing in the mask.
+         The matrix is only made the first time that it is asked for.
+        ARGS:
+            direction       String, threads of specified direction (Up or Down)
+        RETURNS:
+            Dictionary, with the keys "Speed", "Size", "Mask", and "Shape". If NumPy is installed,
+             Speed and Size are 2-D arrays of Floats and Mask is a 2-D array of Booleans.
+             Otherwise, they are flat arrays in row order. Shape is the Tuple (threads, intervals)
+        """
+        if direction not in self.ThreadMatrices:
+            threads = self.Threads[direction]
+            rows = len(threads)
+            #The columns are read directly, as arrayOfMsmts makes a copy of them
+            width = max( [len(thread.MsmtColumns["Speed"]) for thread in threads] )
+            if numpy is not None:
+                matrix = {"Speed": numpy.zeros((rows, width)),
+                          "Size":  numpy.zeros((rows, width)),
+                          "Mask":  numpy.zeros((rows, width), dtype=bool) }
+                for row, thread in enumerate(threads):
+                    length = len(thread.MsmtColumns["Speed"])
+                    for attribute in ["Speed", "Size"]:
+                        matrix[attribute][row, :length] = thread.MsmtColumns[attribute]
+                    matrix["Mask"][row, :length] = True
+                #END FOR
+            else:
+                matrix = {"Speed": array("d", [0.0]) * (rows*width),
+                          "Size":  array("d", [0.0]) * (rows*width),
+                          "Mask":  array("b", [0]) * (rows*width) }
+                for row, thread in enumerate(threads):
+                    length = len(thread.MsmtColumns["Speed"])
+                    start = row*width
+                    for attribute in ["Speed", "Size"]:
+                        matrix[attribute][start:start+length] = thread.MsmtColumns[attribute]
+                    matrix["Mask"][start:start+length] = array("b", [1]) * length
+                #END FOR
+            #END IF/ELSE
+            matrix["Shape"] = (rows, width)
+            self.ThreadMatrices[direction] = matrix
+        #END IF
+        return self.ThreadMatrices[direction]
+    #END DEF
+
     def get_ThreadSumValues(self, direction="DOWN", attribute="Speed"):
         """
         Creating an array of the sum of each 1 second interval of all 4 thread's speed or size
@@ -307,27 +354,69 @@ class TCP_Test(Test):
         if direction not in self.Threads.keys():
             direction = "DOWN"
         #END IF
-        #Getting all of the necessary values from the TCP Thread objects we have
-        allValues = self.get_ThreadsValues(direction, attribute)
-        #Calculating max thread length
-        maxThreadLength = max( [len(array) for array in allValues] )
-        #Get the sums of the "direction" threads. The first FOR loop will iterate X number of times
-        # based on what is in maxThreadLength. Within the FOR loop, we set up
-        # a temporary variable. We then try to add a specific interval (e.g. 1.0-2.0 sec) for each
-        # thread to the temporary variable. If the interval does not exist, then nothing is added
-        # (i.e. we add 0). We then append this value to threads_summed, which will be returned.
-        threads_summed = []
-        for interval in range(maxThreadLength):
-            temp = 0
-            for array in allValues:
-                try:
-                    temp += array[interval]
-                except:
-                    pass
-            #END FOR
-            threads_summed.append(temp)
+        #Each column of the matrix is one interval (e.g. 1.0-2.0 sec) of every thread. A thread
+        # that did not have the interval holds a 0 there, so it adds nothing to the sum
+        matrix = self.getThreadMatrix(direction)
+        if numpy is not None:
+            return matrix[attribute].sum(axis=0).tolist()
+        width = matrix["Shape"][1]
+        return [ sum(matrix[attribute][interval::width]) for interval in range(width) ]
+    #END DEF
+
+    def get_ThreadMeanValues(self, direction="DOWN", attribute="Speed"):
+        """
+        Creating an array of the mean of the speed or size of each thread, over the intervals
+         that the thread had
+        ARGS:
+            direction       String, threads of specified direction (Up or Down) that will be averaged
+            attribute       String, the attribute of the measurement we wish to average (speed or size)
+        RETURNS:
+            List of Floats, the mean of each thread, which is 0 for a thread with no intervals
+        """
+        #Just in case what was passed is not a possible option, we will chose the defaults
+        if attribute not in ["Speed", "Size"]:
+            attribute = "Speed"
+        if direction not in self.Threads.keys():
+            direction = "DOWN"
+        #END IF
+        #Each row of the matrix is one thread. The padding of a shorter thread adds nothing
+        # to the row's sum, and is not counted by the mask
+        matrix = self.getThreadMatrix(direction)
+        if numpy is not None:
+            counts = matrix["Mask"].sum(axis=1)
+            return numpy.divide(matrix[attribute].sum(axis=1), counts,
+                                out=numpy.zeros(counts.shape), where=(counts > 0)).tolist()
+        width = matrix["Shape"][1]
+        means = []
+        for row in range(matrix["Shape"][0]):
+            count = sum(matrix["Mask"][row*width:(row+1)*width])
+            means.append( (sum(matrix[attribute][row*width:(row+1)*width]) / count) if count else 0.0 )
         #END FOR
-        return threads_summed
+        return means
+    #END DEF
+
+    def get_DataScore(self, direction="DOWN"):
+        """
+        Calculates the data score of the threads in the given direction, which is the fraction
+         of all of the threads' intervals in which data was being transmitted
+        ARGS:
+            direction       String, threads of specified direction (Up or Down)
+        RETURNS:
+            Number between 0 and 1. This is an Integer if it is exactly 0 or 1, in the same
+             way that the mean of a list of 1s and 0s would be
+        """
+        if direction not in self.Threads.keys():
+            direction = "DOWN"
+        matrix = self.getThreadMatrix(direction)
+        if numpy is not None:
+            moving = int( numpy.count_nonzero((matrix["Speed"] > 0) & matrix["Mask"]) )
+            total = int( numpy.count_nonzero(matrix["Mask"]) )
+        else:
+            moving = sum( [1 for speed, valid in zip(matrix["Speed"], matrix["Mask"]) if valid and speed > 0] )
+            total = sum(matrix["Mask"])
+        #END IF/ELSE
+        score = Fraction(moving, total)
+        return score.numerator if (score.denominator == 1) else float(score)
     #END DEF
 
     def get_ThreadsValues(self, direction="DOWN", attribute="Speed"):
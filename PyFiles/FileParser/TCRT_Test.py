@@ -24,6 +24,8 @@ class Hop:
 
     """A simple class for holding the information from a single hop"""
 
+    __slots__ = ("Number", "Name", "IP", "Speed")
+
     '''
     # ------------------------------
     # ---- CLASS VARIABLES ----
@@ -35,23 +37,17 @@ class Hop:
     '''
     
     def __init__(self, dataString):
-        tempDataString = dataString.split(" ")
-        temp = [x for x in tempDataString if x]
-        try:
-            self.Number = temp.pop(0)
-        except:
-            self.Number = dataString
+        # The tokens of the line are read by their index, so they are only gone through once
+        temp = [x for x in dataString.split(" ") if x]
+        self.Number = temp[0] if temp else dataString
 
         # Checking if test timed out or was otherwise ended early
         try:
             #if Number can be converted into an int, everything is swell
             self.Number = int(self.Number)
-            self.Name = temp.pop(0)
-            self.IP = temp.pop(0)[1:-1]
-            self.Speed = temp.pop(0)    
-        except:
+            self.Name, self.IP, self.Speed = temp[1], temp[2][1:-1], temp[3]
+        except (ValueError, IndexError):
             #if Number cannot be convereted to an int the test ended early
-            self.Number = self.Number
             self.Name = dataString
             self.IP = "NA"
             self.Speed = "NA"
@@ -69,6 +65,18 @@ class Hop:
 		'''
 
     
+    @classmethod
+    def empty(cls, number):
+        """
+        Returns a Hop that holds 'NA' values, which is used to fill the hops after the
+         last one in a test (the same as Hop("<number> NA (NA) NA"))
+        """
+        hop = cls.__new__(cls)
+        hop.Number = number
+        hop.Name = hop.IP = hop.Speed = "NA"
+        return hop
+    #END DEF
+
     def __str__(self):
         return("Hop number: {}\nDestination: {}\nDestination IP: {}\nSpeed: {} ms".format(self.Number, self.Name, self.IP, self.Speed))
     #END DEF
@@ -77,6 +85,14 @@ class Hop:
 class TCRT_Test:
     
     """A TRCRT test, containing parsed information about TCRT hops"""
+
+    # The text in a hop's name that means the test ended with an error, and the error
+    # that is then given as the HopCount. If more than one hop has an error, the last one is used
+    ERROR_MESSAGES = (("Cancelled", "error: Cancelled by user"),
+                      ("Timed", "error: Timed out"),
+                      ("failed", "error: Traceroute command failed"),
+                      ("not complete", "error: Traceroute did not complete"),
+                      ("Quitting", "error: Cancelled by user"))
     '''
     # ---- CLASS ATTRIBUTES ----
     Hops = []
@@ -101,29 +117,14 @@ class TCRT_Test:
         # Setting destination IP based on passed in value
         self.setDestination(destination)
 
-        #Construct Hops list
-        self.Hops.append(self.__parseHops(dataString))
-        
-        #Check Hops for any errors and deal with them accordingly
-        error = False
-        for x in self.Hops:
-            if "Cancelled" in x.Name:
-                self.HopCount = "error: Cancelled by user"
-                error = True
-            elif "Timed" in x.Name:
-                self.HopCount = "error: Timed out"
-                error = True
-            elif "failed" in x.Name:
-                self.HopCount = "error: Traceroute command failed"
-                error = True
-            elif "not complete" in x.Name:
-                self.HopCount = "error: Traceroute did not complete"
-                error = True
-            elif "Quitting" in x.Name:
-                self.HopCount = "error: Cancelled by user"
-                error = True
+        #Construct Hops list, which also checks the hops for any errors
+        error = self.__parseHops(dataString)
+
+        #If there was an error, then none of the hops are kept
         if error:
-            self.__parseIndividualHops("")
+            self.HopCount = error
+            self.Hops = [None] * self.HopMax
+            self.__fillHops(0)
 
         #Checking for incomplete tcrts
         if not error:
@@ -146,34 +147,38 @@ class TCRT_Test:
 
     def __parseHops(self, dataString):
         """ 
-        Seperates first line from the hops and then passes off hops to be parsed.
+        Seperates first line from the hops, and then creates Hop objects (which are parsed
+         upon creation) in one pass over the lines. These objects are stored into the Hops
+         table, which is made with room for the 40 hop max (HopMax) before they are parsed
+        Returns the error message of the last hop that had an error, or None
         """
-        # We start our function be splitting the data string into individual chunks,
-        # which we will then parse individually
+        # We start our function be splitting the data string into individual lines,
+        # which we then walk through by their index
         data = dataString.splitlines()
-        if self.__parseFirstLine(data[0]):
-            data.pop(0)
-        self.__parseIndividualHops(data)
-        
+        start = 1 if self.__parseFirstLine(data[0]) else 0
+        #Here we determine the number of hops before completion
+        self.HopCount = len(data) - start
+        self.Hops = [None] * max(self.HopMax, self.HopCount)
+        error = None
+        for index in range(start, len(data)):
+            hop = Hop(data[index])
+            self.Hops[index - start] = hop
+            for word, message in self.ERROR_MESSAGES:
+                if word in hop.Name:
+                    error = message
+                    break
+            #END FOR
+        #END FOR
+        self.__fillHops(self.HopCount)
+        return error
     #END DEF
 
-    def __parseIndividualHops(self, dataString):
+    def __fillHops(self, start):
         """ 
-        Creates Hop objects that are parsed upon creation 
-        These objects are then stored into an array 
-        Additionally, this function will fill the Hops array up to the 40 hop max 
+        Fills the Hops table with fake Hop objects, from the given index up to HopMax
         """
-        # This is where we creat Hop objects and store them into an array
-        self.Hops = []
-        while(dataString):
-            self.Hops.append(Hop(dataString.pop(0)))
-        #Here we determine the number of hops before completion
-        if dataString != "":
-            self.HopCount = len(self.Hops)
-        # This loop fills the Hops array with fake Hop objects up to HopMax
-        while(len(self.Hops) < self.HopMax):
-            emptyHop = str(len(self.Hops)) + " NA (NA) NA"
-            self.Hops.append(Hop(emptyHop))
+        for index in range(start, self.HopMax):
+            self.Hops[index] = Hop.empty(index)
     #END DEF
 
     def setDestination(self, destination):
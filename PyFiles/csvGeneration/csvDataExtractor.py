@@ -744,21 +744,11 @@ class csvDataExtractor(object):
 
     def __TCPRating(self, tcpTest):
         if not tcpTest.ContainsErrors:
-            RATING = {"UP": [], "DOWN": []}
-            for direction in RATING:
-                #This block calculates the TCP Quality based on the data score,
-                # a value between 1 and 0 based on how many intervals in the threads were
-                # either downloading or uploading data
-                allSpeeds = tcpTest.get_ThreadsValues(direction=direction)
-                for thread in allSpeeds:
-                    for elem in thread:
-                        if elem>0:
-                            RATING[direction].append(1)
-                        else:
-                            RATING[direction].append(0)
-                #END FOR
-            #END FOR
-            qualVals = [mean(RATING["UP"]), mean(RATING["DOWN"])]
+            #This calculates the TCP Quality based on the data score, a value between
+            # 1 and 0 based on how many intervals in the threads were either
+            # downloading or uploading data
+            qualVals = [tcpTest.get_DataScore(direction="UP"),
+                        tcpTest.get_DataScore(direction="DOWN")]
         else:
             qualVals = [tcpTest.ErrorType]*2
         return qualVals
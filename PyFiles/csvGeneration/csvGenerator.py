@@ -15,8 +15,13 @@ PURPOSE-  The file contains a number of functions that will take a given
 import os
 import sys
 import shutil
+import queue
 import datetime
+import threading
 import traceback
+import multiprocessing
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 from platform import system
 if system()=="Windows":
     import ntpath as path
@@ -29,6 +34,176 @@ from csvDataExtractor import csvDataExtractor
 #END IMPORTS
 
 
+#The parsed file objects that the worker processes of csvGenerator.__extractInPool extract
+# the rows of. It is set just before the workers are forked, so that they inherit the
+# objects rather than having them pickled and sent to them
+_forkedFiles = []
+
+
+def parseDataFile(parser, filePath):
+    """
+    Reads the file at the given path, and runs it through the given parser. This is outside
+     of csvGenerator so that it can be given to the worker processes of pushAllFiles
+    ARGS:
+        parser      Class, the parser to create the parsed file object with
+        filePath    String, the absolute path to the file to be parsed
+    RETURNS:
+        Tuple (Object, String), the Object is the parsed file object (or None if the file
+         could not be parsed), and the String is the traceback if the file could not be read
+    """
+    #The contents are kept, and handed to the parser, so that the file is only read from disk once
+    with open(filePath) as quickread:
+        try:
+            fileContents = quickread.read()
+        except:
+            return (None, traceback.format_exc())
+    #END WITH
+    return (parser(filePath=filePath, fileBuffer=fileContents), None)
+#END DEF
+
+
+def parseAndExtract(parser, extractor, methodNames, filePath):
+    """
+    Parses the file at the given path (see parseDataFile), and extracts its values with the
+     given extractor functions. This is given to worker processes, so that only the values
+     (and not the whole parsed file object) are pickled to be sent back
+    ARGS:
+        parser          Class, the parser to create the parsed file object with
+        extractor       csvDataExtractor, the object that the values are extracted with
+        methodNames     List of Strings, the names of the extractor functions to call
+        filePath        String, the absolute path to the file to be parsed
+    RETURNS:
+        Tuple (ExtractedFile, String), the same as parseDataFile, with an ExtractedFile
+         in place of the parsed file object
+    """
+    parsedFileObj, readError = parseDataFile(parser, filePath)
+    if parsedFileObj:
+        parsedFileObj = ExtractedFile(parsedFileObj, extractor, methodNames)
+    return (parsedFileObj, readError)
+#END DEF
+
+
+def parseInWorker(parser, extractor, methodNames, filePath):
+    """
+    Parses the file at the given path (see parseDataFile), and extracts its values (see
+     ExtractedFile), in a worker process of csvGenerator.pushAllFiles. The parsed tests are
+     then dropped from the object (see File.releaseTests), as they are most of its size
+     when it is pickled to be sent back
+    ARGS:
+        (see parseAndExtract)
+    RETURNS:
+        Tuple (Object, ExtractedFile, String), the parsed file object (or None), the values
+         extracted from it (or None), and the traceback if the file could not be read
+    """
+    parsedFileObj, readError = parseDataFile(parser, filePath)
+    if not parsedFileObj:
+        return (parsedFileObj, None, readError)
+    extractedFile = ExtractedFile(parsedFileObj, extractor, methodNames)
+    parsedFileObj.releaseTests()
+    return (parsedFileObj, extractedFile, readError)
+#END DEF
+
+
+def extractRows(extractor, methodNames, parsedFiles):
+    """
+    Makes the CSV row of values for each of the given parsed file objects
+    ARGS:
+        extractor       csvDataExtractor, the object that the values are extracted with
+        methodNames     List of Strings, the names of the extractor functions to call for
+                         each file (see csvGenerator.OPTS), in the order of the row
+        parsedFiles     List of parsed file objects
+    RETURNS:
+        List of Tuples (List, String), one for each file. The List is the row of values (or
+         None), and the String is the traceback if the values could not be extracted
+    """
+    rows = []
+    for parsedFileObj in parsedFiles:
+        #The values of an ExtractedFile were extracted when the file was parsed
+        if isinstance(parsedFileObj, ExtractedFile):
+            rows.append(parsedFileObj.getRow(methodNames))
+            continue
+        try:
+            objAsArray = []
+            for methodName in methodNames:
+                objAsArray.extend(getattr(extractor, methodName)(parsedFileObj))
+            rows.append((objAsArray, None))
+        except:
+            rows.append((None, traceback.format_exc()))
+    #END FOR
+    return rows
+#END DEF
+
+
+def extractForkedRows(extractor, methodNames, start, stop):
+    """
+    Makes the CSV rows (see extractRows) of _forkedFiles[start:stop], in a worker process
+     that was forked after the parsed file objects were put in _forkedFiles
+    """
+    return extractRows(extractor, methodNames, _forkedFiles[start:stop])
+#END DEF
+
+
+class ExtractedFile(object):
+
+    """
+    The values extracted from a parsed file object by a worker process, which are sent
+     back so that the row of the file does not have to be extracted again (see
+     csvGenerator.pushAllFiles and csvGenerator.streamToCSVs)
+
+    ATTRIBUTES
+        FilePath    String, the absolute path to the file that was parsed
+        Filename    String, the name of the file
+        Date        String, the date of the file's tests
+        Values      Dictionary, the name of each extractor function that was called, and
+                     the List of values it returned
+        Errors      Dictionary, the name of each extractor function that raised an error,
+                     and the traceback of that error
+    """
+
+    def __init__(self, parsedFileObj, extractor, methodNames):
+        """
+        Used to initialize an object of this class
+        ARGS:
+            parsedFileObj   Object, the parsed file object to extract the values from
+            extractor       csvDataExtractor, the object that the values are extracted with
+            methodNames     List of Strings, the names of the extractor functions to call
+        """
+        self.FilePath = parsedFileObj.FilePath
+        self.Filename = parsedFileObj.Filename
+        self.Date = parsedFileObj.Date
+        self._datetime_ = parsedFileObj._datetime_
+        self.Values = {}
+        self.Errors = {}
+        for methodName in methodNames:
+            try:
+                self.Values[methodName] = getattr(extractor, methodName)(parsedFileObj)
+            except:
+                self.Errors[methodName] = traceback.format_exc()
+        #END FOR
+    #END DEF
+
+    def hasValues(self, methodNames):
+        """Returns whether all of the given extractor functions were called for this file"""
+        return all((methodName in self.Values or methodName in self.Errors)
+                   for methodName in methodNames)
+    #END DEF
+
+    def getRow(self, methodNames):
+        """
+        Returns the row of values for the given extractor functions, in the same way as
+         extractRows does for a parsed file object
+        """
+        objAsArray = []
+        for methodName in methodNames:
+            if methodName in self.Errors:
+                return (None, self.Errors[methodName])
+            objAsArray.extend(self.Values[methodName])
+        #END FOR
+        return (objAsArray, None)
+    #END DEF
+#END CLASS
+
+
 class csvGenerator(object):
 
     """
@@ -95,6 +270,9 @@ class csvGenerator(object):
         self.parsedFiles = []
         #This will be a list of strings that are the dates the tests were conducted on
         self.fileDates = []
+        #This will hold the ExtractedFile of each parsed file whose values were extracted by
+        # a worker process of pushAllFiles, by the path of the file
+        self.__extractedFiles = {}
         self.CSVs = {}
 
         #Importing the necessary parser based on the specified data file type. We
@@ -242,6 +420,7 @@ class csvGenerator(object):
                   "Was given '{}',\n".format(object.__class__)+
                   " should be '{}'".format(self.__parserClass))
             return False
+        self.__extractedFiles.pop(object.FilePath, None)
         if index == -1:
             self.parsedFiles.append(object)
         else:
@@ -265,38 +444,67 @@ class csvGenerator(object):
             Tuple (Boolean, String), Boolean is whether the file was able to be parsed, and
              the String is the path to the file that's been given
         """
+        filePath = self.__checkFilePath(filePath)
+        if not filePath:
+            return (False, "")
+        parsedFileObj, readError = parseDataFile(self.parser, filePath)
+        return self.__addParsedFile(filePath, parsedFileObj, readError, **kwargs)
+    #END DEF
+
+
+    def __checkFilePath(self, filePath):
+        """Returns the absolute path of the given file path, or None if it is not a legitimate file"""
         #The value in filePath must be a string
         if not isinstance(filePath, str):
-            return (False, "")
+            return None
         filePath = os.path.abspath(filePath)
         #Checking that the given file path points to a legitimate file
         if not os.path.isfile(filePath):
-            return (False, "")
-        #Checking that the given file actually has information to read
-        with open(filePath) as quickread:
-            try:
-                __ = quickread.read()
-            except:
-                self.errorCount += 1
-                traceback.print_exception(*sys.exc_info(), file=sys.stderr)
-                print("Errored File: {}\n".format(filePath), file=sys.stderr)
-                print(" - UNREADABLE: Processed file '{}'".format(filePath))
-                #If we have been given an Error Directory, and the directory exists, then
-                # we will make a copy of the file that gave us an error, and move it to
-                # the given directory
-                if 'ErrorDirectory' in kwargs \
-                        and isinstance(kwargs['ErrorDirectory'], str) \
-                        and os.path.isdir(kwargs['ErrorDirectory']):
-                    shutil.copy2(filePath, kwargs['ErrorDirectory'])
-                return (False, filePath)
-            #END TRY/EXCEPT
-        #END WITH
-        #Now that we've tested that the file actually has contents, we are going to
-        # pass it to our parser.
-        parsedFileObj = self.parser(filePath=filePath)
+            return None
+        return filePath
+    #END DEF
+
+
+    def __addParsedFile(self, filePath, parsedFileObj, readError, keep=True,
+                        extractedFile=None, **kwargs):
+        """
+        Adds the result of parseDataFile to self.parsedFiles, and makes the copy of the file
+         in the Archive or Error Directory
+        ARGS:
+            filePath        String, the absolute path to the file that was parsed
+            parsedFileObj   Object, the parsed file object, or None
+            readError       String, the traceback if the file could not be read, or None
+            keep            Boolean, whether the parsed file object is kept in self.parsedFiles
+            extractedFile   ExtractedFile, the values already extracted from the parsed file
+                             object, which are used when its row is appended to a CSV
+        KWARGS:
+            (see pushFile)
+        RETURNS:
+            (see pushFile)
+        """
+        #Any values extracted from an earlier parse of this file are out of date
+        self.__extractedFiles.pop(filePath, None)
+        #Checking that the given file actually had information to read
+        if readError:
+            self.errorCount += 1
+            print(readError, end="", file=sys.stderr)
+            print("Errored File: {}\n".format(filePath), file=sys.stderr)
+            print(" - UNREADABLE: Processed file '{}'".format(filePath))
+            #If we have been given an Error Directory, and the directory exists, then
+            # we will make a copy of the file that gave us an error, and move it to
+            # the given directory
+            if 'ErrorDirectory' in kwargs \
+                    and isinstance(kwargs['ErrorDirectory'], str) \
+                    and os.path.isdir(kwargs['ErrorDirectory']):
+                shutil.copy2(filePath, kwargs['ErrorDirectory'])
+            return (False, filePath)
+        #END IF
         if parsedFileObj:
             self.parsedCount += 1
-            self.parsedFiles.append(parsedFileObj)
+            if keep:
+                self.parsedFiles.append(parsedFileObj)
+                if extractedFile is not None:
+                    self.__extractedFiles[filePath] = extractedFile
             self.__addDate(parsedFileObj)
             if 'ArchiveDirectory' in kwargs \
                     and isinstance(kwargs['ArchiveDirectory'], str) \
@@ -318,12 +526,20 @@ class csvGenerator(object):
     #END DEF
 
 
-    def pushAllFiles(self, folderPath, **kwargs):
+    def pushAllFiles(self, folderPath, workers=1, **kwargs):
         """
         This takes a given folder path, and parses all files found using the parser
          imported in __init__
         ARGS:
             folderPath      String, the path to the folder containing files to parse
+            workers         Integer, the number of processes that parse the files. If more
+                             than 1, the files are parsed in a process pool, and the values
+                             of the options chosen (see setOpts) are extracted from them
+                             there, so that exportCSV does not extract them again. The
+                             parsed file objects are sent back without their tests, which
+                             are parsed again from the file if they are asked for (see
+                             File.releaseTests). The files are added in the same order
+                             that they would be parsed in otherwise
         KWARGS:
             ErrorDirectory      String, the path to the directory that will hold files that cause an error
             ArchiveDirectory    String, the path to the archival directory
@@ -334,32 +550,176 @@ class csvGenerator(object):
         """
         erroredFiles = []
         #This will recursively loop through all of the files and folder in the given folder path.
-        for root, dirs, files in os.walk(folderPath):
-            for aFile in files:
-                #Seeing if the file given is, in fact, a data file
-                #If not, the script will exit and display the message below
-                thisFile = os.path.join(root, aFile)
-                #This calls the class function, and if what is returned is not
-                # False, then we have
-                return_, filePath = self.pushFile(thisFile, **kwargs)
-                if not return_ and filePath:
-                    erroredFiles.append(filePath)
-            #END FOR files
-        #END FOR os.walk
+        allFiles = (os.path.join(root, aFile)
+                    for root, dirs, files in os.walk(folderPath) for aFile in files)
+        if workers > 1:
+            results = self.__parseInPool(list(allFiles), workers, **kwargs)
+        else:
+            results = (self.pushFile(thisFile, **kwargs) for thisFile in allFiles)
+        #END IF/ELSE
+        for return_, filePath in results:
+            #If what is returned is False, and there is a file path, then the file errored
+            if not return_ and filePath:
+                erroredFiles.append(filePath)
+        #END FOR
         print("{} files processed without error, {} with error.".format(self.parsedCount, self.errorCount))
         self.parsedFiles.sort()
         return (self.parsedCount, self.errorCount, erroredFiles)
     #END DEF
 
 
+    def __parseInPool(self, allFiles, workers, **kwargs):
+        """
+        Parses the given files in a pool of worker processes (see parseInWorker), and adds
+         each parsed file object, with its ExtractedFile, in the same way that pushFile does. The results
+         are given in the order of allFiles, and all of the copies to the Archive and Error
+         Directories are made by this process
+        ARGS:
+            allFiles    List of Strings, the paths to the files to parse
+            workers     Integer, the number of worker processes
+        KWARGS:
+            (see pushFile)
+        RETURNS:
+            Generator of Tuples (Boolean, String), the same as pushFile returns for each file
+        """
+        checkedFiles = [self.__checkFilePath(thisFile) for thisFile in allFiles]
+        filePaths = [thisFile for thisFile in checkedFiles if thisFile]
+        chunkSize = max(1, len(filePaths) // (workers * 4))
+        methodNames = [self.OPTS[op] for op in self.optsChosen]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = pool.map(parseInWorker, repeat(self.parser), repeat(self.extractor),
+                              repeat(methodNames), filePaths, chunksize=chunkSize)
+            for filePath in checkedFiles:
+                if not filePath:
+                    yield (False, "")
+                    continue
+                parsedFileObj, extractedFile, readError = next(parsed)
+                yield self.__addParsedFile(filePath, parsedFileObj, readError,
+                                           extractedFile=extractedFile, **kwargs)
+            #END FOR
+        #END WITH
+    #END DEF
+
+
+    def streamToCSVs(self, folderPath, csvPaths, queueSize=8, executor=None, **kwargs):
+        """
+        Parses all files found in the given folder, and appends the row of values of each
+         one to all of the given CSVs. The files are parsed by a producer thread, which puts
+         them in a queue that holds at most queueSize parsed file objects, and each object
+         is dropped as soon as its row has been extracted, so that the parsed files (which
+         are many times larger than their rows) are not all held at once. The parsed files
+         are not added to self.parsedFiles. Once all of the files are parsed, each CSV is
+         written in the same way that exportCSV writes it (see __exportRows)
+        ARGS:
+            folderPath      String, the path to the folder containing files to parse
+            csvPaths        List of Strings, the paths of the CSVs to append the rows to. A
+                             CSV that does not exist is created (with its headers), if
+                             any file could be parsed
+            queueSize       Integer, the most parsed file objects that are waiting at once
+            executor        concurrent.futures executor (which can be shared with other work)
+                             to parse the files in. The producer hands each file to it, so
+                             at most queueSize files are being parsed or waiting at once.
+                             The row of each file is extracted with it too, and only the
+                             row's values are sent back (see ExtractedFile). If None, the
+                             producer thread parses the files itself
+        KWARGS:
+            (see pushFile)
+        RETURNS:
+            Tuple (Int_1, Int_2, List_1, List_2), Int_1 is the number of files that have been
+             parsed, Int_2 is the number of files that errored, List_1 is the paths to the
+             files that caused an error, and List_2 is the paths to the parsed files that
+             values could not be extracted from
+        """
+        erroredFiles = []
+        extractErrors = []
+        #The datetime and row of values of each parsed file, and whether any file was parsed
+        newRows = []
+        anyParsed = False
+        methodNames = [self.OPTS[op] for op in self.optsChosen]
+        parsedQueue = queue.Queue(maxsize=queueSize)
+        stop = threading.Event()
+
+        def produce():
+            """Parses each file in the folder, and puts the result in the queue"""
+            try:
+                for root, dirs, files in os.walk(folderPath):
+                    for aFile in files:
+                        if stop.is_set():
+                            return
+                        filePath = self.__checkFilePath(os.path.join(root, aFile))
+                        if filePath:
+                            if executor is None:
+                                result = parseDataFile(self.parser, filePath)
+                            else:
+                                result = executor.submit(parseAndExtract, self.parser,
+                                                         self.extractor, methodNames, filePath)
+                            parsedQueue.put((filePath, result))
+                    #END FOR files
+                #END FOR os.walk
+            except BaseException as e:
+                #The error is raised again by the consumer
+                parsedQueue.put((None, e))
+            finally:
+                parsedQueue.put(None)
+        #END DEF
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            for item in iter(parsedQueue.get, None):
+                filePath, result = item
+                if filePath is None:
+                    raise result
+                if executor is not None:
+                    result = result.result()
+                parsedFileObj, readError = result
+                return_, errorPath = self.__addParsedFile(filePath, parsedFileObj, readError,
+                                                          keep=False, **kwargs)
+                if not return_:
+                    erroredFiles.append(errorPath)
+                    continue
+                anyParsed = True
+                objAsArray, error = extractRows(self.extractor, methodNames, [parsedFileObj])[0]
+                if error is None:
+                    newRows.append((parsedFileObj._datetime_, objAsArray))
+                else:
+                    print(error, file=sys.__stdout__)
+                    extractErrors.append(parsedFileObj.FilePath)
+                #END IF/ELSE
+                del parsedFileObj, result, item
+            #END FOR
+        finally:
+            #If the consumer stopped early, the queue is emptied so that the producer can finish
+            stop.set()
+            while producer.is_alive():
+                try:
+                    parsedQueue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            #END WHILE
+        #END TRY/FINALLY
+        if anyParsed:
+            #The rows are added in date order, the same as the sorted parsed files are
+            newRows.sort(key=lambda dateAndRow: dateAndRow[0])
+            for path in csvPaths:
+                self.__exportRows(path, [row for __, row in newRows])
+        #END IF
+        print("{} files processed without error, {} with error.".format(self.parsedCount, self.errorCount))
+        return (self.parsedCount, self.errorCount, erroredFiles, extractErrors)
+    #END DEF
+
+
     def _popObject(self, front=False):
         """Removes the parsed data file object from the end of array of parsed files"""
         if len(self.parsedFiles) < 1:
             return None
         self.parsedCount -= 1
         if front:
-            return self.parsedFiles.pop(0)
-        return self.parsedFiles.pop()
+            object = self.parsedFiles.pop(0)
+        else:
+            object = self.parsedFiles.pop()
+        self.__extractedFiles.pop(object.FilePath, None)
+        return object
     #END DEF
 
 
@@ -435,39 +795,95 @@ class csvGenerator(object):
     #END DEF
 
 
-    def __appendToCSV(self, indexName):
-        """Given an index name, appends all parsed files to the indexed CSV"""
+    def __appendToCSV(self, indexName, workers=1):
+        """
+        Given an index name, appends all parsed files to the indexed CSV. If workers is more
+         than 1, the rows are extracted in a pool of that many worker processes
+        """
         erroredFiles = []
         #If the index given is in self.CSVs, then we can go ahead and get the
         # values we want
         if indexName in self.CSVs:
             #Sorting the parsed files before we append them to the CSV
             self.parsedFiles.sort()
-            for parsedFileObj in self.parsedFiles:
-                try:
-                    ## print(" Extracting from {}".format(parsedFileObj.FilePath))
-                    #This is the block that will make the row of values from the
-                    # parsed file object.
-                    objAsArray = []
-                    #For every option chosen by the user, we will get the values by
-                    # calling the necessary function from the EXTRACTOR. We get that
-                    # function by using the function name in self.OPTS the corresponds
-                    # to the number in 'op'.
-                    for op in self.optsChosen:
-                        VALUES = getattr(self.extractor, self.OPTS[op])(parsedFileObj)
-                        objAsArray.extend(VALUES)
+            #For every option chosen by the user, we will get the values by
+            # calling the necessary function from the EXTRACTOR. We get that
+            # function by using the function name in self.OPTS the corresponds
+            # to the number in 'op'.
+            methodNames = [self.OPTS[op] for op in self.optsChosen]
+            #The files whose values were already extracted by the workers of pushAllFiles
+            # are not extracted again
+            rows = [None] * len(self.parsedFiles)
+            toExtract = []
+            for index, parsedFileObj in enumerate(self.parsedFiles):
+                extractedFile = self.__extractedFiles.get(parsedFileObj.FilePath)
+                if extractedFile is not None and extractedFile.hasValues(methodNames):
+                    rows[index] = extractedFile.getRow(methodNames)
+                else:
+                    toExtract.append(parsedFileObj)
+            #END FOR
+            if workers > 1 and len(toExtract) > 1:
+                extracted = self.__extractInPool(methodNames, workers, toExtract)
+            else:
+                extracted = extractRows(self.extractor, methodNames, toExtract)
+            extracted = iter(extracted)
+            rows = [row if row is not None else next(extracted) for row in rows]
+            #The rows are in the same order as the sorted files
+            for parsedFileObj, (objAsArray, error) in zip(self.parsedFiles, rows):
+                if error is None:
                     #Adding the value to the end of the CSV
                     self.CSVs[indexName].append(objAsArray)
-                except:
-                    print(traceback.format_exc(), file=sys.__stdout__)
+                else:
+                    print(error, file=sys.__stdout__)
                     erroredFiles.append(parsedFileObj.FilePath)
+            #END FOR
             return erroredFiles
         else:
             return False
     #END DEF
 
 
-    def exportCSV(self, indexName, path):
+    def __extractInPool(self, methodNames, workers, parsedFiles):
+        """
+        Extracts the rows of the given parsed files in a pool of worker processes. The workers
+         are forked, so that they already have the parsed file objects, and each task is only
+         the start and end of a chunk of the files. If the workers can not be forked (as the
+         platform does not support it, or as there are other threads running, which could be
+         holding a lock when a worker is forked), then the rows are extracted in this process
+        ARGS:
+            methodNames     List of Strings, the names of the extractor functions to call
+            workers         Integer, the number of worker processes
+            parsedFiles     List of parsed file objects
+        RETURNS:
+            Generator of Tuples (List, String), the same as extractRows, in the order of parsedFiles
+        """
+        global _forkedFiles
+        if ("fork" not in multiprocessing.get_all_start_methods() or
+                threading.active_count() > 1):
+            for row in extractRows(self.extractor, methodNames, parsedFiles):
+                yield row
+            return
+        #END IF
+        fileCount = len(parsedFiles)
+        chunkSize = max(1, -(-fileCount // (workers * 4)))
+        starts = range(0, fileCount, chunkSize)
+        _forkedFiles = parsedFiles
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context("fork")) as pool:
+                for rows in pool.map(extractForkedRows, repeat(self.extractor), repeat(methodNames),
+                                     starts, (start + chunkSize for start in starts)):
+                    for row in rows:
+                        yield row
+                #END FOR
+            #END WITH
+        finally:
+            _forkedFiles = []
+        #END TRY/FINALLY
+    #END DEF
+
+
+    def exportCSV(self, indexName, path, workers=1):
         """
         Exports the CSV currently at the given indexName. The CSV will be
          exported to the given path. If the indexName does not exist, then
@@ -475,12 +891,13 @@ class csvGenerator(object):
         ARGS:
             indexName   The value of the index used to identify this CSV with the object
             path        The path to where the CSV will be created
+            workers     Integer, the number of processes that extract the rows of the CSV
         RETURNS:
             Boolean, True on success, False on failure
         """
         path = os.path.abspath(path)
         if indexName in self.CSVs and len(self.parsedFiles)>0:
-            erroredFiles = self.__appendToCSV(indexName)
+            erroredFiles = self.__appendToCSV(indexName, workers)
             self.__cleanCSV(self.CSVs[indexName])
             csvExport(self.CSVs[indexName], path)
             self.CSVs.pop(indexName)
@@ -497,6 +914,28 @@ class csvGenerator(object):
     #END DEF
 
 
+    def __exportRows(self, path, rows):
+        """
+        Appends the given rows to the CSV at the given path (creating it if it does not
+         exist), and exports it in the same way that exportCSV does, with all of its
+         values cleaned
+        ARGS:
+            path    String, the path to the CSV
+            rows    List of Lists, the rows of values to append to the CSV
+        RETURNS:
+            Boolean, True on success, False if the CSV could not be imported
+        """
+        path = os.path.abspath(path)
+        if not self.importCSV(path, path):
+            return False
+        csv = self.CSVs.pop(path)
+        csv.extend(list(row) for row in rows)
+        self.__cleanCSV(csv)
+        csvExport(csv, path)
+        return True
+    #END DEF
+
+
     def listCSVs(self):
         """Returns a list of the CSV index names the user has imported"""
         return list(self.CSVs.keys())
@@ -53,6 +53,11 @@ def __debug(logFileLoc, emailAddress, fullDebug=False, funcName=""):
         """Base function for wrapping"""
         def debug_wrapper(*args, **kwargs):
             """Actual debug wrapper. Puts function in try/except, and puts output into file."""
+            #The kind of file can also be given to the function itself (see __checkSysArg)
+            if 'fileType' in kwargs:
+                runName = "{} Server".format(kwargs['fileType'].upper())
+            else:
+                runName = serverName
             #Getting the previous output, for later comparison
             if os.path.isfile(logFile):
                 with open(logFile) as fs:
@@ -82,7 +87,7 @@ def __debug(logFileLoc, emailAddress, fullDebug=False, funcName=""):
                     print("Sending {} ERROR file...".format(funcName))
                     timeOfError = datetime.datetime.now().isoformat(' ')
                     ec.addAttachment(logFile)
-                    ec.SUBJECT = "ERROR ENCOUNTERED - {}".format(serverName)
+                    ec.SUBJECT = "ERROR ENCOUNTERED - {}".format(runName)
                     ec.MESSAGE = ("Error encountered. Error Log file included.\n" +
                                   "TIME=' {} '".format(timeOfError) +
                                   "Log file location: {}\n\n".format(logFile) +
@@ -108,7 +113,7 @@ def __debug(logFileLoc, emailAddress, fullDebug=False, funcName=""):
                         print("Sending {} DEBUG file...".format(funcName))
                         timeOfError = datetime.datetime.now().isoformat(' ')
                         ec.addAttachment(logFile)
-                        ec.SUBJECT = "Recent Output - {}".format(serverName)
+                        ec.SUBJECT = "Recent Output - {}".format(runName)
                         ec.MESSAGE = ("Script complete. Log file included.\n" +
                                       "TIME=' {} '".format(timeOfError)
                                       )
@@ -125,21 +130,30 @@ def __debug(logFileLoc, emailAddress, fullDebug=False, funcName=""):
 
 
 def __checkSysArg(func):
-    """Wrapper function for checking that 'field' or 'crowd' was passed in"""
+    """
+    Wrapper function for checking that 'field' or 'crowd' was passed in. The kind of file
+     can instead be given to the function as the keyword argument 'fileType' (when it is
+     called from another script), and it is always passed on to the function in 'fileType'
+    """
     def checkSysArgWrapper(*args, **kwargs):
-        assert (len(sys.argv)>1
-                ),("Too few system arguements. "+
-                   "You must pass in another system argument for this script to run.")
-        sys.argv[1] = sys.argv[1].lower()
-        assert (sys.argv[1] in ['fieldtest', 'crowdsource']
+        if 'fileType' in kwargs:
+            kwargs['fileType'] = kwargs['fileType'].lower()
+        else:
+            assert (len(sys.argv)>1
+                    ),("Too few system arguements. "+
+                       "You must pass in another system argument for this script to run.")
+            sys.argv[1] = sys.argv[1].lower()
+            kwargs['fileType'] = sys.argv[1]
+        #END IF/ELSE
+        assert (kwargs['fileType'] in ['fieldtest', 'crowdsource']
                 ),("You must pass in what kind of file will be parsed, 'FieldTest' or 'CrowdSource'.\n"+
-                   "Was given '{}'".format(sys.argv[1]))
+                   "Was given '{}'".format(kwargs['fileType']))
 
         #This set some variables that we will be using later, depending on whether we are
         # parsing Field Test files, or Crowd Source files
-        if sys.argv[1] == "fieldtest":
+        if kwargs['fileType'] == "fieldtest":
             kwargs['folderPaths'] = _generateFieldTestPaths()
-        elif sys.argv[1] == "crowdsource":
+        elif kwargs['fileType'] == "crowdsource":
             kwargs['folderPaths'] = _generateCrowdSourcePaths()
         #END IF/ELSE
 
@@ -6,33 +6,111 @@ Author:     Evan Schwander  eschwander@csumb.edu
 
 Purpose:    This module is used to determine if an incoming file is a traceroute test or not.
             Depending on what test is found, an apporopriate script is used to parse it.
+            Both scripts are run in this process, at the same time, and share one pool of
+            worker processes to parse their files in.
+
+            While sort_and_extract runs, its debug wrapper points sys.stdout and sys.stderr
+            of this whole process at its log file (_ERRORLOG.txt), so anything the tcrt
+            pipeline printed through them would end up in that log. The tcrt rows, the
+            timings, and the error of either pipeline are printed to the console that was
+            in use before the pipelines started.
 ---------------------------------------------------------------------------------------------
 """
 
 
 import os
+import sys
+import time
 import shutil
 import glob
+import traceback
+import multiprocessing
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor)
+import parse_all_tcrts
+import sort_and_extract
+
+# csvGenerator imports the speed test parsers from the PyFiles folder. That folder is put on
+# the path now, so that the pool's workers (which can be started before the csvGenerator is
+# made) can load the parsers of the files that they are sent
+parserPath = os.path.join(os.getcwd(), os.path.dirname(__file__), "PyFiles")
+if parserPath not in sys.path:
+    sys.path.append(parserPath)
+
+
+def classifyUploads():
+    ''' moves all txt files in UploadData into either tcrt or other, and returns how many
+        went into each '''
+    # The following directories need to be created if they don't already exist
+    if not os.path.exists("./UploadData/other"):
+        os.makedirs("./UploadData/other")
+    if not os.path.exists("./UploadData/tcrt"):
+        os.makedirs("./UploadData/tcrt")
+
+    # All txt files in UploadData get put into either tcrt or other
+    numTCRT, numOther = 0, 0
+    for file in glob.glob(os.path.join("./UploadData", '*.txt')):
+        with open(file, 'r') as fs:
+            firstline = str(fs.readline())
+        if "traceroute" in firstline.lower():
+            shutil.move(file, "./UploadData/tcrt")
+            numTCRT += 1
+        else:
+            shutil.move(file, "./UploadData/other")
+            numOther += 1
+    return (numTCRT, numOther)
+
+
+def timed(func, *args, **kwargs):
+    ''' calls func, and returns how many seconds it took, and the traceback of the error it
+        raised (or None), so that one pipeline failing does not stop the other '''
+    start = time.perf_counter()
+    try:
+        func(*args, **kwargs)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return (time.perf_counter() - start, error)
+
+
+def main(workers=None):
+    ''' classifies the uploaded files, and then runs the tcrt and speed test pipelines at
+        the same time. Both of them parse their files in one shared process pool, with
+        workers processes (os.cpu_count() by default). The time each pipeline took (and
+        the error that stopped it, if any) is printed once they are both done '''
+    start = time.perf_counter()
+    numTCRT, numOther = classifyUploads()
+    classifyTime = time.perf_counter() - start
+    # sort_and_extract sends the output of this process to its log file while it runs (see
+    # the top of this file), so everything here is printed to the console from before then
+    console = sys.stdout
 
-# The following directories need to be created if they don't already exist
-if not os.path.exists("./UploadData/other"):
-    os.makedirs("./UploadData/other")
-if not os.path.exists("./UploadData/tcrt"):
-    os.makedirs("./UploadData/tcrt")
-
-# All txt files in UploadData get put into either tcrt or other
-for file in glob.glob(os.path.join("./UploadData", '*.txt')):
-    fs = open(file, 'r')
-    firstline = str(fs.readline())
-    fs.close()
-    if "traceroute" in firstline.lower():
-        shutil.move(file, "./UploadData/tcrt")
+    # The workers are not forked from this process, as it has the pipelines' threads
+    # running (and a thread could be holding a lock when a worker is forked)
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
     else:
-        shutil.move(file, "./UploadData/other")
+        context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool, \
+            ThreadPoolExecutor(max_workers=2) as pipelines:
+        # Parse tcrt files if there are any
+        tcrtRun = pipelines.submit(timed, parse_all_tcrts.main, executor=pool, output=console)
+        # Parse files in other if there are any
+        speedRun = pipelines.submit(timed, sort_and_extract.main, fileType="fieldtest",
+                                    executor=pool)
+        runs = [("TCRT", tcrtRun.result()), ("Speed test", speedRun.result())]
 
+    print("Classified {} tcrt and {} other files in {:.2f} seconds".format(
+          numTCRT, numOther, classifyTime), file=console)
+    for name, (seconds, error) in runs:
+        if error is None:
+            print("{} pipeline finished in {:.2f} seconds".format(name, seconds), file=console)
+        else:
+            print("{} pipeline failed after {:.2f} seconds".format(name, seconds), file=console)
+            print(error, end="", file=console)
+    #END FOR
+    print("All pipelines finished in {:.2f} seconds".format(time.perf_counter() - start),
+          file=console)
 
-# Parse tcrt files if there are any
-os.system("python parse_all_tcrts.py")
 
-# Parse files in other if there are any
-os.system("python sort_and_extract.py fieldtest")
+if __name__=="__main__":
+    main()
\ No newline at end of file
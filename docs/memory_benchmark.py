@@ -0,0 +1,171 @@
+#!/usr/local/bin/python3
+"""
+----------------------------------------------------------------
+This file measures how much memory a parsed FieldTest file holds on to.
+For each file, the bytes still allocated (as counted by tracemalloc) are
+measured after the file is parsed, and again after str() has been called
+on it (which makes every Test, Thread and Measurement object). The text
+of the file that is kept by the parser is dropped before measuring.
+
+Call this script with a folder path to measure the files in that folder.
+If no folder is given, 5 synthetic FieldTest files (each with 14 tests) are
+written to a temporary folder and measured instead. Running this script
+from checkouts made before and after a change (like the one that added
+__slots__ to the Measurement, ServerReport, PING_Packet and Hop classes)
+gives the memory used by each.
+----------------------------------------------------------------
+"""
+
+
+def makeSyntheticFiles(folderPath, numFiles=5):
+    """
+    Writes synthetic FieldTest files to the given folder. Each file has 4 TCP tests,
+     2 ping tests, 2 UDP 5 second tests and 2 UDP 1 second tests (of 3 parts each)
+    ARGS:
+        folderPath  String, the folder to write the files to
+        numFiles    Integer, the number of files to write
+    """
+    import os
+    import random
+    random.seed(7)
+    east, west = "10.1.1.1", "10.2.2.2"
+
+    def tcp(num, loc, ip):
+        lines = ["Starting Test %d: TCP %s...." % (num, loc),
+                 "Iperf command line:/data/iperf -c %s -e -w 64k -P 4 -i 1 -t 10 -f k" % ip,
+                 "-"*60, "Client connecting to %s, TCP port 5001" % ip,
+                 "TCP window size: 64.0 KByte (WARNING: requested 64.0 KByte)", "-"*60]
+        for port in (40000, 41000):
+            for thread in (3, 4, 5, 6):
+                lines.append("[  %d] local 192.168.1.5 port %d connected with %s port 5001"
+                             % (thread, port+thread, ip))
+            for sec in range(10):
+                for thread in (3, 4, 5, 6):
+                    speed = round(random.uniform(100, 3000), 1)
+                    lines.append("[  %d] %4.1f-%4.1f sec  %.1f KBytes  %.1f Kbits/sec"
+                                 % (thread, sec, sec+1, speed/8, speed))
+            for thread in (3, 4, 5, 6):
+                lines.append("[  %d]  0.0-10.0 sec  %.1f KBytes  %.1f Kbits/sec"
+                             % (thread, 1200.0+thread, 980.0+thread))
+        return lines + [""]
+
+    def ping(num, loc, ip):
+        lines = ["Starting Test %d: Ping %s...." % (num, loc),
+                 "PING %s (%s) 56(84) bytes of data." % (ip, ip)]
+        times = [round(random.uniform(30, 90), 1) for i in range(10)]
+        for i, time in enumerate(times):
+            lines.append("64 bytes from %s: icmp_seq=%d ttl=50 time=%s ms" % (ip, i+1, time))
+        return lines + ["", "--- %s ping statistics ---" % ip,
+                        "10 packets transmitted, 10 received, 0% packet loss, time 9012ms",
+                        "rtt min/avg/max/mdev = %.3f/%.3f/%.3f/3.100 ms"
+                        % (min(times), sum(times)/len(times), max(times)), ""]
+
+    def udp(ip, secs):
+        lines = ["-"*60, "Client connecting to %s, UDP port 5001" % ip,
+                 "Sending 220 byte datagrams", "UDP buffer size: 110 KByte (default)", "-"*60,
+                 "[  3] local 192.168.1.5 port 50000 connected with %s port 5001" % ip]
+        for sec in range(secs):
+            lines.append("[  3] %4.1f-%4.1f sec  10.7 KBytes  88.0 Kbits/sec" % (sec, sec+1))
+        return lines + ["[  3]  0.0-%4.1f sec  %.1f KBytes  88.0 Kbits/sec" % (secs, 10.7*secs),
+                        "[  3] Sent %d datagrams" % (50*secs), "[  3] Server Report:",
+                        "[  3]  0.0-%4.1f sec  %.1f KBytes  88.0 Kbits/sec  %.3f ms  1/ %d (0.1%%)"
+                        % (secs, 10.7*secs, random.uniform(1, 9), 50*secs), ""]
+
+    def udp5(num, loc, ip):
+        return (["Starting Test %d: UDP 5 second Test %s...." % (num, loc),
+                 "Iperf command line:/data/iperf -c %s -u -l 220 -b 88k -i 1 -t 5 -f k" % ip]
+                + udp(ip, 5))
+
+    def udp1(num, loc, ip):
+        lines = ["Starting Test %d: UDP 1 second Test %s...." % (num, loc)]
+        for sub in (1, 2, 3):
+            lines += ["Starting UDP 1 second Test #%d" % sub,
+                      "Iperf command line:/data/iperf -c %s -u -l 220 -b 88k -i 1 -t 1 -f k" % ip]
+            lines += udp(ip, 1)
+        return lines
+
+    for fileNum in range(numFiles):
+        lines = ["CPUC Tester Beta v2.0 Phone", "Testing started at Wed Jun 04 10:26:23 PDT 2014", "",
+                 "OS: Name = Android, Architecture = armv7l, Version = 4.4.2",
+                 "Java: Version = 0, Vendor = The Android Project", "Server: n/a", "Host: ",
+                 "NetworkProvider: Verizon Wireless", "NetworkOperator: Verizon Wireless",
+                 "Device ID: 9900034824%04d" % fileNum, "ConnectionType: LTE", "Location ID: 1234",
+                 "Latitude: 36.6", "Longitude: -121.8", "", "Checking Connectivity...", ""]
+        lines += (tcp(1, "West", west) + tcp(2, "East", east) +
+                  ping(3, "West", west) + ping(4, "East", east) +
+                  udp5(5, "West", west) + udp5(6, "East", east) +
+                  udp1(7, "West", west) + udp1(8, "East", east) +
+                  tcp(9, "West", west) + tcp(10, "East", east) + ["Saving results...", ""])
+        with open(os.path.join(folderPath, "synthetic_%d.txt" % fileNum), "w") as newfile:
+            newfile.write("\n".join(lines) + "\n")
+    #END FOR
+#END DEF
+
+
+def main():
+    """
+    This script can be run as __main__ by a user, with an optional folder path as
+    the second argument.
+    """
+    import sys
+    import os
+    import gc
+    import shutil
+    import tempfile
+    import tracemalloc
+    if ("-h" in sys.argv) or ("--help" in sys.argv) or len(sys.argv) > 2:
+        print("Call this script with a folder path as the second argument, or with no "+
+              "arguments to use synthetic files.")
+        raise SystemExit
+    #END IF
+
+    #The parser is imported from the PyFiles folder of the checkout that this script is in
+    projectPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "PyFiles")
+    sys.path.append(os.path.realpath(projectPath))
+    from FileParser.FieldTest_File import FieldTest_File
+
+    synthetic = (len(sys.argv) != 2)
+    if synthetic:
+        fullPath = tempfile.mkdtemp()
+        makeSyntheticFiles(fullPath)
+    else:
+        fullPath = os.path.realpath(sys.argv[-1])
+    print("Using files in : {}\n".format(fullPath))
+
+    results = []
+    for file in sorted(os.listdir(fullPath)):
+        truePath = os.path.join(fullPath, file)
+        with open(truePath) as quickread:
+            fileContents = quickread.read()
+        measures = []
+        for callStr in (False, True):
+            gc.collect()
+            tracemalloc.start()
+            parsed = FieldTest_File(filePath=truePath, fileBuffer=fileContents)
+            if not parsed:
+                tracemalloc.stop()
+                break
+            if callStr:
+                str(parsed)
+            parsed.__dict__.pop("_fileText", None)
+            gc.collect()
+            measures.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            del parsed
+        #END FOR
+        if len(measures) != 2:
+            print("{:<40}{:>15}".format(file, "NOT PARSED"))
+            continue
+        results.append(measures)
+        print("{:<40}{:>15,}{:>15,}".format(file, *measures))
+    #END FOR
+    if results:
+        print("{:<40}{:>15,}{:>15,}".format("MEAN (tests parsed only, str() run)",
+                                             *[sum(col)//len(results) for col in zip(*results)]))
+    if synthetic:
+        shutil.rmtree(fullPath)
+    return True
+#END MAIN
+
+if __name__ == "__main__":
+    main()
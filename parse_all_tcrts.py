@@ -13,13 +13,20 @@ import sys
 import shutil
 import calendar
 import glob
-from PyFiles.FileParser._parserUtils.device_tester_table import table
+from PyFiles.FileParser._parserUtils.basic_utils import matchLinesWithAny
+from PyFiles.FileParser._parserUtils.device_tester_table import lookupTester
 from PyFiles.FileParser.TCRT_Test import TCRT_Test
 from PyFiles.csvGeneration._csvUtils._csvHeaders_ import FieldTestHeaders as headers
 import datetime
 
 
-def main():
+def main(executor=None, output=None):
+    ''' parses every tcrt file in UploadData/tcrt, and appends their rows to the tcrt csvs
+        executor is an optional concurrent.futures executor (shared with other pipelines)
+        that the files are parsed in, and output is the stream that the rows are printed
+        to (sys.stdout by default) '''
+    if output is None:
+        output = sys.stdout
 
     #open csvs
     #file creation/opening happens here
@@ -35,50 +42,74 @@ def main():
         headers = str(getHeaders()).replace("'","").replace(" ","")[1:-1]
         allFile.write(headers + "\n")
 
-    #parsing all tcrts
-    for file in glob.glob(os.path.join("./UploadData/tcrt", '*.txt')):
+    #parsing all tcrts, in the executor if one was given. map keeps the files in order,
+    # so the rows are written and the files are moved in the main process as before
+    files = glob.glob(os.path.join("./UploadData/tcrt", '*.txt'))
+    if executor is None:
+        finalStrings = map(parseTCRTFile, files)
+    else:
+        finalStrings = executor.map(parseTCRTFile, files)
+    for file, finalString in zip(files, finalStrings):
+        print(finalString, file=output)
+    
+        #write to appropriate csvs
+        dailyFile.write(finalString + "\n")
+        allFile.write(finalString + "\n")
+
+        #move file to ProcessedData
+        shutil.move(file, "./ProcessedData")
+
+    #close csvs
+    dailyFile.close()
+    allFile.close()
+
+def parseTCRTFile(file):
+        ''' parses the tcrt file at the given path, and returns its csv row as a string '''
         tocsv = Test()
         fs = open(file, 'rt')
         allLines = fs.readlines()
         fs.close()
         #shutil.move(file, "./ProcessedData")
-        firstLine = str(allLines.pop(0))
+        #The lines are walked through by their index, instead of being taken off of the list
+        firstLine = str(allLines[0])
         if "tablet" in firstLine.lower():
             tocsv.DeviceType = "Tablet"
         else:
             tocsv.DeviceType = "Phone"
-        # This loop parses basic info
-        while "Checking Connectivity" not in allLines[0]:
-            tocsv.findBasicInfo(str(allLines.pop(0)))
+        # This parses basic info, from all of the lines before the connectivity check
+        headerEnd = 1
+        while "Checking Connectivity" not in allLines[headerEnd]:
+            headerEnd += 1
+        tocsv.findAllBasicInfo(allLines[1:headerEnd])
 
         #Variable initialization for the following loop
         recording = False
-        hops = ''
+        hops = []
         tcrtTests = []
         destination = ''
+        index = headerEnd
         #The following loop records once it finds a certain delimiter
         #It then creates a TCRT_Test object once it reaches a different delimiter
-        while "Saving" not in allLines[0]:
-            if ": Traceroute" in allLines[0]: #delimiter 1
+        while "Saving" not in allLines[index]:
+            if ": Traceroute" in allLines[index]: #delimiter 1
                 #begin recording and set the destination
                 recording = True
-                destinationLine = allLines[0]
+                destinationLine = allLines[index]
                 if "Oregon" in destinationLine:
                     destination = "oregon"
                 elif "West" in destinationLine:
                     destination = "california"
                 elif "East" in destinationLine:
                     destination = "east"
-                allLines.pop(0)
-                allLines.pop(0)
-            elif allLines[0] == "\n" and recording == True: #delimiter 2
+                #The delimiter and the line after it are skipped
+                index += 2
+            elif allLines[index] == "\n" and recording == True: #delimiter 2
                 recording = False
-                tcrtTests.append(TCRT_Test(hops, destination))
-                hops = ''
+                tcrtTests.append(TCRT_Test("".join(hops), destination))
+                hops = []
             if recording:
-                hops += allLines.pop(0)
-            else:
-                allLines.pop(0)
+                hops.append(allLines[index])
+            index += 1
 
         #Here we build the "finalString" to write to the csv
         finalString = str(tocsv)
@@ -100,19 +131,7 @@ def main():
                     tcrtTests.append(TCRT_Test("\nQuitting\n"))
             for x in tcrtTests:
                 finalString += str(x)
-            
-        print(finalString)
-    
-        #write to appropriate csvs
-        dailyFile.write(finalString + "\n")
-        allFile.write(finalString + "\n")
-
-        #move file to ProcessedData
-        shutil.move(file, "./ProcessedData")
-
-    #close csvs
-    dailyFile.close()
-    allFile.close()
+        return finalString
 
 def currDate():
         #Everything is finally written to a daily csv and an all tcrt results csv
@@ -129,6 +148,11 @@ def currDate():
         return currentDate
 
 class Test:
+
+    # The delimiters that findBasicInfo looks for, in the order that it checks them
+    BASIC_INFO_DELIMITERS = ["Test started", "NetworkProvider:", "NetworkOperator:", "Device ID:",
+                             "Latitude:", "Longitude:", "ConnectionType:", "Location ID:",
+                             "Testing started"]
     
     def __init__(self):
         self.Tester = 'NA'
@@ -143,25 +167,37 @@ class Test:
         self.DeviceID = 'NA'
         self.DeviceType = 'NA'
  
-    def findBasicInfo(self, dataString):
-        if "Test started" in dataString:
+    def findAllBasicInfo(self, lines):
+        ''' finds every basic info line in one pass, in file order (so that a later line,
+            like "Testing started" after "Test started", still wins), and parses each one
+            with the delimiter that it matched '''
+        for line, delimiter in matchLinesWithAny(lines, self.BASIC_INFO_DELIMITERS):
+            self.findBasicInfo(line, delimiter)
+
+    def findBasicInfo(self, dataString, delimiter=None):
+        ''' parses a basic info line. If the delimiter it contains is not given, it is
+            looked for in the order of BASIC_INFO_DELIMITERS '''
+        if delimiter is None:
+            delimiter = next((delim for delim in self.BASIC_INFO_DELIMITERS
+                              if delim in dataString), None)
+        if delimiter == "Test started":
             self.parseDateTime(dataString)
-        elif "NetworkProvider:" in dataString:
+        elif delimiter == "NetworkProvider:":
             self.Provider = str(dataString.split(" ").pop())
-        elif "NetworkOperator:" in dataString:
+        elif delimiter == "NetworkOperator:":
             self.Operator = str(dataString.split(" ").pop())
-        elif "Device ID:" in dataString:
+        elif delimiter == "Device ID:":
             self.DeviceID = str(dataString.split(" ").pop())
             self.determineTester(self.DeviceID)
-        elif "Latitude:" in dataString:
+        elif delimiter == "Latitude:":
             self.Latitude = str(dataString.split(":").pop())
-        elif "Longitude:" in dataString:
+        elif delimiter == "Longitude:":
             self.Longitude = str(dataString.split(":").pop())
-        elif "ConnectionType:" in dataString:
+        elif delimiter == "ConnectionType:":
             self.Network = str(dataString.split(" ").pop())
-        elif "Location ID:" in dataString:
+        elif delimiter == "Location ID:":
             self.LocationID = str(dataString.split(" ").pop())
-        elif "Testing started" in dataString:
+        elif delimiter == "Testing started":
             self.parseDateTime(dataString)
 
     def parseDateTime(self, dataString):
@@ -176,15 +212,10 @@ class Test:
         self.Time = time
 
     def determineTester(self, id):
-        pairs = table.rsplit()
         id = str(id.rsplit()[0])
-        flag = False
-        for pair in pairs:
-            if id in str(pair):
-                flag = True
-            elif flag:
-                self.Tester = "Tester " + str(pair)
-                break
+        tester = lookupTester(id)
+        if tester:
+            self.Tester = tester
 
     def __str__(self):
         ''' returns string in the form of a csv '''
@@ -212,4 +243,5 @@ def getHeaders():
     return FieldTestHeaders
 
 
-main()
\ No newline at end of file
+if __name__=="__main__":
+    main()
\ No newline at end of file
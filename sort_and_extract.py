@@ -15,8 +15,9 @@ PURPOSE-  This script will be called every hour to check 'UploadData' for new
             logged and copied into a separate folder.
 FUNCTIONS
     _find
+    _stageFiles
     _makeDateCSVs
-    _makeBaseCSVs
+    _baseCSVPaths
     main
 ------------------------------------------------------------------------
 """
@@ -25,7 +26,9 @@ FUNCTIONS
 import os
 import sys
 import shutil
+import asyncio
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from _decorators import (__debug, __checkSysArg, logFileLOCATION)
 from _sensitiveInfo.emailLogin import ADMIN
 
@@ -44,45 +47,75 @@ if major<3:
     raise SystemExit("You must be running at least Python 3")
 
 
-def _find(BASEDIR, UPL_DIR, TMP_DIR, nowTime):
-    """Finds files that are ready to process, and moves them to a temp directory"""
-    #This will organize each file into a folder based on the modification data of the file, as
-    # well as copy the file into the temporary directory
-    print("Finding new files to process...")
-    #Creating a datetime object that is set to 45 minutes ago
-    filesToParse = []
-    nowTimeLess = nowTime - datetime.timedelta(minutes=0)
-    for file in os.listdir(UPL_DIR):
-        truePath = os.path.abspath(os.path.join(UPL_DIR, file))
-        #This will get the modification time of the file at 'truePath'. The value returned
+def _find(BASEDIR, UPL_DIR, TMP_DIR, nowTime, concurrency=32):
+    """
+    Finds files that are ready to process, and moves them to a temp directory, where they
+     are picked up by the parser. On network storage every stat, copy and move takes a
+     while, so they are run by _stageFiles, up to 'concurrency' of them at once
+    """
+    return asyncio.run(_stageFiles(BASEDIR, UPL_DIR, TMP_DIR, nowTime, concurrency))
+#END DEF
+
+
+async def _stageFiles(BASEDIR, UPL_DIR, TMP_DIR, nowTime, concurrency):
+    """
+    Does the work of _find. The blocking calls are run in a pool of threads, and a semaphore
+     keeps at most 'concurrency' of them running at once
+    """
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def inThread(func, *args):
+        """Runs func(*args) in the thread pool, once the semaphore lets it"""
+        async with limit:
+            return await loop.run_in_executor(pool, func, *args)
+    #END DEF
+
+    try:
+        #This will organize each file into a folder based on the modification data of the file, as
+        # well as copy the file into the temporary directory
+        print("Finding new files to process...")
+        #Creating a datetime object that is set to 45 minutes ago
+        nowTimeLess = nowTime - datetime.timedelta(minutes=0)
+        allPaths = [os.path.abspath(os.path.join(UPL_DIR, file)) for file in os.listdir(UPL_DIR)]
+        #This will get the modification time of every file at once. The value returned
         # in the attribute 'st_mtime' is an epoch time (time in seconds since 1/1/1970). That
         # is passed to datetime.fromtimestamp, which creates a datetime object
-        lastModTime = datetime.datetime.fromtimestamp(os.stat(truePath).st_mtime)
+        allStats = await asyncio.gather(*[inThread(os.stat, truePath) for truePath in allPaths])
         #If the modification time of the file is less than the time 45 minutes ago, then
         # we can pass it to the parser
-        if lastModTime < nowTimeLess:
-            filesToParse.append(truePath)
-    #END FOR
-    if len(filesToParse) == 0:
-        return 0
-
-    print("Found "+str(len(filesToParse))+" files. Processing...")
-    #With all of the files found, we will get the file's modification date, copy the file
-    # with all of it's metadata into the temp directory and a new directory (named the file's
-    # creation data), and then remove the file
-    #I may want to do some testing on the raw data. if so, we want to copy the files into
-    # the dev folder, but only if the folder exists
-    devFolder = os.path.join(BASEDIR, "dev", "UploadData")
-    extracopy = False
-    if os.path.isdir(devFolder):
-        extracopy = True
-    for file in filesToParse:
-        if extracopy:
-            shutil.copy2(file, devFolder)
-        #Moving the text file into the temporary directory, preserving any metadata
-        shutil.move(file, TMP_DIR)
-    #END FOR
-    return len(filesToParse)
+        filesToParse = [truePath for (truePath, stats) in zip(allPaths, allStats)
+                        if datetime.datetime.fromtimestamp(stats.st_mtime) < nowTimeLess]
+        if len(filesToParse) == 0:
+            return 0
+
+        print("Found "+str(len(filesToParse))+" files. Processing...")
+        #With all of the files found, we will get the file's modification date, copy the file
+        # with all of it's metadata into the temp directory and a new directory (named the file's
+        # creation data), and then remove the file
+        #I may want to do some testing on the raw data. if so, we want to copy the files into
+        # the dev folder, but only if the folder exists
+        devFolder = os.path.join(BASEDIR, "dev", "UploadData")
+        extracopy = False
+        if os.path.isdir(devFolder):
+            extracopy = True
+
+        async def stage(file):
+            """Copies the file into the dev folder (if needed), and then moves it"""
+            if extracopy:
+                await inThread(shutil.copy2, file, devFolder)
+            #Moving the text file into the temporary directory, preserving any metadata
+            await inThread(shutil.move, file, TMP_DIR)
+        #END DEF
+
+        await asyncio.gather(*[stage(file) for file in filesToParse])
+        return len(filesToParse)
+    finally:
+        #If one of the calls raised an error, the calls that are still running are waited for,
+        # and the ones that have not started are dropped
+        pool.shutdown(wait=True, cancel_futures=True)
+    #END TRY/FINALLY
 #END DEF
 
 
@@ -91,7 +124,7 @@ def _makeDateCSVs(CSV_DIR, csvGener):
     #This loop will continue while there are elements in the original csvGenerator
     for DATE in csvGener.fileDates:
         #We first make a new, temporary csvGenerator
-        newGen = csvGenerator(sys.argv[1],
+        newGen = csvGenerator(csvGener.fileType,
                               FileParserPath=os.path.join(os.getcwd(),
                                                           os.path.dirname(__file__),
                                                           "PyFiles"))
@@ -108,8 +141,8 @@ def _makeDateCSVs(CSV_DIR, csvGener):
 #END DEF
 
 
-def _makeBaseCSVs(CSV_DIR, csvGener):
-    """."""
+def _baseCSVPaths(CSV_DIR):
+    """Returns the paths to the Daily and 'all_test_results' CSVs"""
     #Creating a datetime object
     nowTime = datetime.datetime.now()
     __, nowWeek, __ = nowTime.isocalendar()
@@ -118,15 +151,7 @@ def _makeBaseCSVs(CSV_DIR, csvGener):
     dailyCSV = os.path.join(CSV_DIR,"{}_daily_results.csv".format(nowTime.strftime("%m_%d_%Y")))
     #Setting the location of the 'all_test_results' CSV file
     allCSV = os.path.join(CSV_DIR,"all_test_results.csv")
-
-    print("Creating Daily and 'all_test_results' CSVs...")
-    csvGener.importCSV(dailyCSV, 'daily')
-    csvGener.exportCSV('daily', dailyCSV)
-    csvGener.importCSV(allCSV, 'all')
-    erroredFiles = csvGener.exportCSV('all', allCSV)
-    for file in erroredFiles:
-        print(" ERROR when extracting from '{}'".format(file), file=sys.stderr)
-    return True
+    return (dailyCSV, allCSV)
 #END DEF
 
 
@@ -137,11 +162,19 @@ def _makeBaseCSVs(CSV_DIR, csvGener):
 @__debug(logFileLOCATION, ADMIN, fullDebug=True, funcName="Sort And Extract")
 @__checkSysArg
 def main(**kwargs):
-    """Sorts, archives, and parses incoming results files"""
+    """
+    Sorts, archives, and parses incoming results files
+    KWARGS:
+        fileType    String, 'fieldtest' or 'crowdsource', the kind of files to parse. This is
+                     read from the system arguments if it is not given (see __checkSysArg)
+        executor    concurrent.futures executor to parse the files in (like the worker
+                     pool that determine_test shares with parse_all_tcrts), or None
+    """
+    fileType = kwargs['fileType']
     #This sets the variables holding the paths to the folders we will need
-    if sys.argv[1] == 'fieldtest':
+    if fileType == 'fieldtest':
         parser = FieldTest_File
-    elif sys.argv[1] == 'crowdsource':
+    elif fileType == 'crowdsource':
         parser = CrowdSource_File
     #END IF/ELIF
 
@@ -155,19 +188,24 @@ def main(**kwargs):
     numFound = _find(BASEDIR, UPL_DIR, TMP_DIR, nowTime)
 
     if numFound != 0:
-        CSV_GEN = csvGenerator(sys.argv[1],
+        CSV_GEN = csvGenerator(fileType,
                                FileParserPath=os.path.join(os.getcwd(),
                                                            os.path.dirname(__file__),
                                                            "PyFiles") )
-        (numPar, numErr, ERRORS) = CSV_GEN.pushAllFiles(TMP_DIR,
-                                                        ArchiveDirectory=PAR_DIR,
-                                                        ErrorDirectory=ERR_DIR)
-        if numPar > 0:
-            CSV_GEN.setOpts("1 2 3 4 5 6 7 8 10")
-            _makeBaseCSVs(CSV_DIR, CSV_GEN)
-            #_makeDateCSVs(CSV_DIR, CSV_GEN)
-            #shutil.rmtree(TMP_DIR)
-        else:
+        CSV_GEN.setOpts("1 2 3 4 5 6 7 8 10")
+        #Each file is parsed, and is dropped once its row has been extracted, so that only a
+        # few parsed files are ever held at once. The rows are then added to the Daily and
+        # 'all_test_results' CSVs in date order
+        print("Creating Daily and 'all_test_results' CSVs...")
+        (numPar, numErr, ERRORS, extractErrors) = CSV_GEN.streamToCSVs(TMP_DIR,
+                                                                       _baseCSVPaths(CSV_DIR),
+                                                                       executor=kwargs.get('executor'),
+                                                                       ArchiveDirectory=PAR_DIR,
+                                                                       ErrorDirectory=ERR_DIR)
+        for file in extractErrors:
+            print(" ERROR when extracting from '{}'".format(file), file=sys.stderr)
+        #_makeDateCSVs(CSV_DIR, CSV_GEN)
+        if numPar == 0:
             print("No files could be processed.")
             #shutil.rmtree(TMP_DIR)
     else:
@@ -0,0 +1,9 @@
+"""
+The parser modules import each other by their module names (ie. "from _File import File"),
+ so the folder that they are in is put on the path before the tests import them
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "PyFiles", "FileParser"))
@@ -0,0 +1,94 @@
+"""
+Tests of how _File.File reads the header and the tests of a raw data file
+"""
+import pytest
+
+from _File import File
+
+
+PING_TEST = ("Starting Test {0}: Ping West....\n"
+             "PING 10.2.2.2 (10.2.2.2) 56(84) bytes of data.\n"
+             "64 bytes from 10.2.2.2: icmp_seq=1 ttl=50 time=81.8 ms\n"
+             "64 bytes from 10.2.2.2: icmp_seq=2 ttl=50 time=71.8 ms\n"
+             "\n"
+             "--- 10.2.2.2 ping statistics ---\n"
+             "2 packets transmitted, 2 received, 0% packet loss, time 1001ms\n"
+             "rtt min/avg/max/mdev = 71.800/76.800/81.800/5.000 ms\n"
+             "\n")
+
+
+@pytest.fixture
+def rawFile(tmp_path):
+    """A raw data file with a header and two PING tests"""
+    filePath = tmp_path / "raw.txt"
+    filePath.write_text("CPUC Tester Beta v2.0 Phone\n" +
+                        "Testing started at Wed Jun 04 10:26:23 PDT 2014\n\n" +
+                        PING_TEST.format(1) + PING_TEST.format(2))
+    return str(filePath)
+
+
+@pytest.fixture
+def fileMaps(monkeypatch):
+    """Every memory-map made by File.mapFile, in the order that they were made"""
+    maps = []
+    mapFile = File.mapFile
+    def recordMap(self):
+        source = mapFile(self)
+        maps.append(source)
+        return source
+    monkeypatch.setattr(File, "mapFile", recordMap)
+    return maps
+
+
+def test_unknownTimestamp_isFlagged(tmp_path):
+    filePath = tmp_path / "raw.txt"
+    filePath.write_text("CPUC Tester Beta v2.0 Phone\n" +
+                        "Testing started at sometime last week\n\n" + PING_TEST.format(1))
+    parsed = File(filePath=str(filePath))
+    assert parsed.Date == "NA"
+    assert parsed.ContainsErrors
+    assert parsed.ErrorCode == 312
+
+
+def test_loadTests_closesMap(rawFile, fileMaps):
+    parsed = File(filePath=rawFile, lazy=True)
+    parsed.loadTests()
+    assert len(parsed.Tests["PING"]) == 2
+    assert len(fileMaps) == 1
+    assert fileMaps[0].closed
+    assert "_testSource" not in vars(parsed)
+    assert "_fileContentsByTest" not in vars(parsed)
+
+
+def test_iterTests_closesMap(rawFile, fileMaps):
+    parsed = File(filePath=rawFile, lazy=True)
+    assert len(list(parsed.iterTests())) == 2
+    assert len(fileMaps) == 1
+    assert fileMaps[0].closed
+
+
+def test_iterTests_closesMapWhenStoppedEarly(rawFile, fileMaps):
+    parsed = File(filePath=rawFile, lazy=True)
+    tests = parsed.iterTests()
+    next(tests)
+    assert not fileMaps[0].closed
+    tests.close()
+    assert fileMaps[0].closed
+
+
+def test_iterTests_givesParsedTests(rawFile):
+    parsed = File(filePath=rawFile, lazy=True)
+    parsed.loadTests()
+    assert list(parsed.iterTests()) == [parsed.TestsByNum[1], parsed.TestsByNum[2]]
+    assert list(parsed.iterTests(["TCP"])) == []
+
+
+def test_iterTests_stopsAtQuit(tmp_path):
+    filePath = tmp_path / "raw.txt"
+    filePath.write_text("CPUC Tester Beta v2.0 Phone\n" +
+                        "Testing started at Wed Jun 04 10:26:23 PDT 2014\n\n" +
+                        PING_TEST.format(1) + PING_TEST.format(2) +
+                        "Quitting operations\n" + PING_TEST.format(3))
+    parsed = File(filePath=str(filePath), lazy=True)
+    assert [test.TestNumber for test in parsed.iterTests()] == [1]
+    assert parsed.ErrorCode == 201
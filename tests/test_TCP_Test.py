@@ -0,0 +1,74 @@
+"""
+Tests of the values that TCP_Test finds from its thread matrices, with and without NumPy
+"""
+import sys
+from array import array
+
+import pytest
+
+from TCP_Test import TCP_Test
+
+
+def intervalLine(thread, start, end, size, speed):
+    return "[  {}] {:4.1f}-{:4.1f} sec  {} KBytes  {} Kbits/sec\n".format(thread, start, end, size, speed)
+
+#A TCP test with two threads in each direction, where the threads do not have the
+# same number of intervals
+TCP_TEST = ("Starting Test 1: TCP West....\n"
+            "Iperf command line:/data/iperf -c 10.2.2.2 -e -w 64k -P 2 -i 1 -t 3 -f k\n"
+            "------------------------------------------------------------\n"
+            "Client connecting to 10.2.2.2, TCP port 5001\n"
+            "TCP window size: 64.0 KByte (WARNING: requested 64.0 KByte)\n"
+            "------------------------------------------------------------\n"
+            "[  3] local 192.168.1.5 port 40003 connected with 10.2.2.2 port 5001\n"
+            "[  4] local 192.168.1.5 port 40004 connected with 10.2.2.2 port 5001\n" +
+            intervalLine(3, 0, 1, 100, 800) + intervalLine(4, 0, 1, 50, 400) +
+            intervalLine(3, 1, 2, 200, 1600) + intervalLine(4, 1, 2, 150, 1200) +
+            intervalLine(3, 2, 3, 300, 2400) +
+            intervalLine(3, 0, 3.1, 600, 1600) + intervalLine(4, 0, 3.1, 200, 533) +
+            "[  3] local 192.168.1.5 port 41003 connected with 10.2.2.2 port 5001\n"
+            "[  4] local 192.168.1.5 port 41004 connected with 10.2.2.2 port 5001\n" +
+            intervalLine(3, 0, 1, 10, 80) + intervalLine(4, 0, 1, 20, 160) +
+            intervalLine(3, 1, 2, 30, 240) + intervalLine(4, 1, 2, 40, 320) +
+            intervalLine(4, 2, 3, 60, 480) +
+            intervalLine(3, 0, 3.1, 40, 100) + intervalLine(4, 0, 3.1, 120, 300) +
+            "\n")
+
+
+@pytest.fixture(params=["numpy", "arrays"])
+def tcpTest(request, monkeypatch):
+    """The parsed TCP test, with its matrices made by NumPy, or by flat arrays"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(sys.modules[TCP_Test.__module__], "numpy", None)
+    return TCP_Test(dataString=TCP_TEST, eastWestIP=("10.1.1.1", "10.2.2.2"))
+
+
+def test_threadMeanValues(tcpTest):
+    assert tcpTest.get_ThreadMeanValues("UP") == [1600.0, 800.0]
+    assert tcpTest.get_ThreadMeanValues("DOWN", "Size") == [20.0, 40.0]
+
+
+def test_threadMeanValues_matchThreadsValues(tcpTest):
+    for direction in ["UP", "DOWN"]:
+        for attribute in ["Speed", "Size"]:
+            means = [ sum(values)/len(values)
+                      for values in tcpTest.get_ThreadsValues(direction, attribute) ]
+            assert tcpTest.get_ThreadMeanValues(direction, attribute) == pytest.approx(means)
+
+
+def test_threadMeanValues_defaults(tcpTest):
+    assert tcpTest.get_ThreadMeanValues("SIDEWAYS", "Color") == tcpTest.get_ThreadMeanValues()
+    assert tcpTest.get_ThreadMeanValues() == [160.0, 320.0]
+
+
+def test_threadMeanValues_threadWithoutIntervals(tcpTest):
+    for attribute in ["Speed", "Size"]:
+        tcpTest.Threads["UP"][1].MsmtColumns[attribute] = array("d")
+    assert tcpTest.get_ThreadMeanValues("UP") == [1600.0, 0.0]
+
+
+def test_threadSumValues(tcpTest):
+    assert tcpTest.get_ThreadSumValues("UP") == [1200.0, 2800.0, 2400.0]
+    assert tcpTest.get_ThreadSumValues("DOWN") == [240.0, 560.0, 480.0]